@@ -0,0 +1,28 @@
+import os
+
+from py_clob_client.client import ClobClient
+from py_clob_client.orderbook import BookLogWriter, BookRecorder
+from dotenv import load_dotenv
+
+
+load_dotenv()
+
+
+def main():
+    host = os.getenv("CLOB_API_URL", "https://clob.polymarket.com")
+    client = ClobClient(host)
+
+    token_ids = [
+        "71321045679252212594626385532706912750332728571942532289631379312455583992563",
+        "52114319501245915516055106046884209969926127482827954674443846427813813222426",
+    ]
+
+    # snapshots and deltas are appended to ./book_logs, rotating every hour
+    recorder = BookRecorder(BookLogWriter("book_logs", max_segment_age=3600))
+    try:
+        recorder.poll(client, token_ids, interval=1.0)
+    except KeyboardInterrupt:
+        recorder.close()
+
+
+main()
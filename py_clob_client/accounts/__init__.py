@@ -0,0 +1,7 @@
+from .multi import AccountConfig, AccountResult, MultiAccountClient
+
+__all__ = [
+    "AccountConfig",
+    "AccountResult",
+    "MultiAccountClient",
+]
@@ -0,0 +1,171 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional
+
+from ..client import ClobClient
+from ..clob_types import ApiCreds, OpenOrderParams
+from ..http_helpers.rate_limit import RateLimiter
+
+
+@dataclass
+class AccountConfig:
+    name: str
+    """
+    Unique label of the account
+    """
+
+    key: str
+    """
+    Private key of the account's signer
+    """
+
+    creds: ApiCreds = None
+    signature_type: int = None
+    funder: str = None
+
+    rate: float = None
+    burst: int = None
+    """
+    Request rate (per second) and burst of the account's own rate limiter, defaults to the manager's
+    """
+
+
+@dataclass
+class AccountResult:
+    name: str
+    result: Any = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class MultiAccountClient:
+    """
+    Runs many trading accounts side by side
+
+    Every account gets its own ClobClient (signer, creds and rate limiter).
+    The limiter is applied by the client itself to order entry, cancels and
+    paginated reads, so calls through fan_out() or straight on client() are
+    throttled per account alike.
+    They all send through the library's single HTTP connection pool and
+    share one tick size / neg risk / fee rate cache, so market metadata is
+    fetched once for all accounts. Fan-out operations run concurrently and
+    report a result or error per account instead of failing as a whole.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        chain_id: int,
+        accounts: Iterable[AccountConfig],
+        rate: float = None,
+        burst: int = None,
+        max_workers: int = 16,
+    ):
+        self.host = host
+        self.chain_id = chain_id
+        self.clients: dict[str, ClobClient] = {}
+        # holds the shared market metadata cache
+        self.market_client = ClobClient(host, chain_id=chain_id)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._rate = rate
+        self._burst = burst
+
+        for account in accounts:
+            self.add_account(account)
+
+    def add_account(self, account: AccountConfig) -> ClobClient:
+        if account.name in self.clients:
+            raise ValueError(f"duplicate account name {account.name}")
+
+        rate = account.rate if account.rate is not None else self._rate
+        burst = account.burst if account.burst is not None else self._burst
+        client = ClobClient(
+            self.host,
+            chain_id=self.chain_id,
+            key=account.key,
+            creds=account.creds,
+            signature_type=account.signature_type,
+            funder=account.funder,
+            rate_limiter=RateLimiter(rate, burst) if rate is not None else None,
+        )
+        client.share_market_cache(self.market_client)
+        self.clients[account.name] = client
+        return client
+
+    def remove_account(self, name: str):
+        self.clients.pop(name, None)
+
+    def client(self, name: str) -> ClobClient:
+        return self.clients[name]
+
+    def names(self) -> list[str]:
+        return list(self.clients)
+
+    def fan_out(
+        self,
+        fn: Callable[[ClobClient], Any],
+        names: Iterable[str] = None,
+    ) -> dict[str, AccountResult]:
+        """
+        Calls `fn(client)` for every account (or the named ones) concurrently
+
+        Unknown names get an AccountResult with a KeyError, like a failed call.
+        """
+        names = list(names) if names is not None else self.names()
+        results = {}
+        futures = {}
+        for name in names:
+            client = self.clients.get(name)
+            if client is None:
+                results[name] = AccountResult(
+                    name, error=KeyError(f"unknown account {name}")
+                )
+            else:
+                futures[name] = self._executor.submit(fn, client)
+
+        for name, future in futures.items():
+            try:
+                results[name] = AccountResult(name, result=future.result())
+            except Exception as e:
+                results[name] = AccountResult(name, error=e)
+        return {name: results[name] for name in names}
+
+    def ensure_api_creds(
+        self, nonce: int = None, names: Iterable[str] = None
+    ) -> dict[str, AccountResult]:
+        """
+        Creates or derives API creds for the accounts that have none
+        """
+
+        def ensure(client: ClobClient):
+            if client.creds is None:
+                client.set_api_creds(client.create_or_derive_api_creds(nonce))
+            return client.creds
+
+        return self.fan_out(ensure, names)
+
+    def cancel_all(self, names: Iterable[str] = None) -> dict[str, AccountResult]:
+        """
+        Cancels all open orders of every account
+        """
+        return self.fan_out(lambda client: client.cancel_all(), names)
+
+    def get_orders(
+        self, params: OpenOrderParams = None, names: Iterable[str] = None
+    ) -> dict[str, AccountResult]:
+        """
+        Open orders of every account
+        """
+        return self.fan_out(lambda client: client.get_orders(params), names)
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
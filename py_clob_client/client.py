@@ -1,6 +1,6 @@
 import logging
 import json
-from typing import Optional
+from typing import AsyncIterator, Iterator, Optional, Union
 
 from py_builder_signing_sdk.config import BuilderConfig
 
@@ -9,6 +9,7 @@ from .headers.headers import (
     create_level_1_headers,
     create_level_2_headers,
     enrich_l2_headers_with_builder_headers,
+    L1HeaderCache,
 )
 from .signer import Signer
 from .config import get_contract_config
@@ -92,6 +93,21 @@ from .http_helpers.helpers import (
     add_balance_allowance_params_to_url,
     add_order_scoring_params_to_url,
 )
+from .http_helpers.rate_limit import RateLimiter
+from .http_helpers.batching import (
+    BATCH_CHUNK_SIZE,
+    BATCH_WORKERS,
+    merge_dicts,
+    merge_lists,
+    merge_nested_dicts,
+    run_chunked,
+)
+from .http_helpers.pagination import (
+    iter_pages,
+    iter_records,
+    aiter_pages,
+    aiter_records,
+)
 
 from .constants import (
     L0,
@@ -99,7 +115,6 @@ from .constants import (
     L1_AUTH_UNAVAILABLE,
     L2,
     L2_AUTH_UNAVAILABLE,
-    END_CURSOR,
     BUILDER_AUTH_UNAVAILABLE,
 )
 from .utilities import (
@@ -110,6 +125,9 @@ from .utilities import (
     price_valid,
 )
 from .rfq import RfqClient
+from .orderbook.depth import OrderBookDepth
+from .headers.clock import ServerClock
+from .signing.hmac import HmacSigner
 
 
 class ClobClient:
@@ -122,6 +140,10 @@ class ClobClient:
         signature_type: int = None,
         funder: str = None,
         builder_config: BuilderConfig = None,
+        rate_limiter: RateLimiter = None,
+        batch_chunk_size: int = BATCH_CHUNK_SIZE,
+        batch_workers: int = BATCH_WORKERS,
+        l1_header_cache: L1HeaderCache = None,
     ):
         """
         Initializes the clob client
@@ -134,12 +156,21 @@ class ClobClient:
 
         3) Level 2: Requires the host, chain_id, a private key, and Credentials.
                     Allows access to all endpoints
+
+        An optional rate_limiter throttles the paginated endpoints, the bulk helpers built on them and
+        order entry and cancels (post_order(s), cancel, cancel_orders, cancel_all, cancel_market_orders);
+        heartbeats are not throttled, a delayed one would cancel every order
+        Batch endpoints (get_midpoints, get_prices, ...) are split into chunks of batch_chunk_size tokens,
+        sent concurrently on up to batch_workers threads
+        An optional l1_header_cache reuses signed L1 headers while they are still accepted
         """
         self.host = host[0:-1] if host.endswith("/") else host
         self.chain_id = chain_id
         self.signer = Signer(key, chain_id) if key else None
         self.creds = creds
         self.mode = self._get_client_mode()
+        # (secret, signer) of the creds the HmacSigner was built for
+        self._hmac_signer: tuple[str, HmacSigner] = None
 
         if self.signer:
             self.builder = OrderBuilder(
@@ -150,6 +181,12 @@ class ClobClient:
         if builder_config:
             self.builder_config = builder_config
 
+        self.rate_limiter = rate_limiter
+        self.clock: ServerClock = None
+        self.l1_header_cache = l1_header_cache
+        self.batch_chunk_size = batch_chunk_size
+        self.batch_workers = batch_workers
+
         # local cache
         self.__tick_sizes = {}
         self.__neg_risk = {}
@@ -211,7 +248,7 @@ class ClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, CREATE_API_KEY)
-        headers = create_level_1_headers(self.signer, nonce)
+        headers = self._l1_headers(nonce)
 
         creds_raw = post(endpoint, headers=headers)
         try:
@@ -232,7 +269,7 @@ class ClobClient:
         self.assert_level_1_auth()
 
         endpoint = "{}{}".format(self.host, DERIVE_API_KEY)
-        headers = create_level_1_headers(self.signer, nonce)
+        headers = self._l1_headers(nonce)
 
         creds_raw = get(endpoint, headers=headers)
         try:
@@ -261,6 +298,7 @@ class ClobClient:
         """
         self.creds = creds
         self.mode = self._get_client_mode()
+        self._hmac_signer = None
 
     def get_api_keys(self):
         """
@@ -270,7 +308,7 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=GET_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return get("{}{}".format(self.host, GET_API_KEYS), headers=headers)
 
     def get_closed_only_mode(self):
@@ -281,7 +319,7 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=CLOSED_ONLY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return get("{}{}".format(self.host, CLOSED_ONLY), headers=headers)
 
     def delete_api_key(self):
@@ -292,7 +330,7 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="DELETE", request_path=DELETE_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return delete("{}{}".format(self.host, DELETE_API_KEY), headers=headers)
 
     def create_readonly_api_key(self) -> ReadonlyApiKeyResponse:
@@ -303,7 +341,7 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="POST", request_path=CREATE_READONLY_API_KEY)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
 
         response = post("{}{}".format(self.host, CREATE_READONLY_API_KEY), headers=headers)
         try:
@@ -320,7 +358,7 @@ class ClobClient:
         self.assert_level_2_auth()
 
         request_args = RequestArgs(method="GET", request_path=GET_READONLY_API_KEYS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return get("{}{}".format(self.host, GET_READONLY_API_KEYS), headers=headers)
 
     def delete_readonly_api_key(self, key: str) -> bool:
@@ -338,7 +376,7 @@ class ClobClient:
             body=body,
             serialized_body=serialized,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return delete(
             "{}{}".format(self.host, DELETE_READONLY_API_KEY),
             headers=headers,
@@ -367,7 +405,7 @@ class ClobClient:
         Get the mid market prices for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, MID_POINTS), data=body)
+        return self._post_chunked(MID_POINTS, body, merge_dicts)
 
     def get_price(self, token_id, side):
         """
@@ -380,7 +418,7 @@ class ClobClient:
         Get the market prices for a set
         """
         body = [{"token_id": param.token_id, "side": param.side} for param in params]
-        return post("{}{}".format(self.host, GET_PRICES), data=body)
+        return self._post_chunked(GET_PRICES, body, merge_nested_dicts)
 
     def get_spread(self, token_id):
         """
@@ -393,7 +431,15 @@ class ClobClient:
         Get the spreads for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_SPREADS), data=body)
+        return self._post_chunked(GET_SPREADS, body, merge_dicts)
+
+    def share_market_cache(self, source: "ClobClient"):
+        """
+        Makes this client read and fill the tick size, neg risk and fee rate caches of `source`
+        """
+        self.__tick_sizes = source.__tick_sizes
+        self.__neg_risk = source.__neg_risk
+        self.__fee_rates = source.__fee_rates
 
     def get_tick_size(self, token_id: str) -> TickSize:
         if token_id in self.__tick_sizes:
@@ -504,9 +550,11 @@ class ClobClient:
         self,
         order_args: MarketOrderArgs,
         options: Optional[PartialCreateOrderOptions] = None,
+        book: Union[OrderBookSummary, OrderBookDepth] = None,
     ):
         """
         Creates and signs an order
+        If no price is set, it is calculated from `book` when provided, otherwise from a freshly fetched orderbook
         Level 1 Auth required
         """
         self.assert_level_1_auth()
@@ -523,6 +571,7 @@ class ClobClient:
                 order_args.side,
                 order_args.amount,
                 order_args.order_type,
+                book,
             )
 
         if not price_valid(order_args.price, tick_size):
@@ -569,7 +618,9 @@ class ClobClient:
             body=body,
             serialized_body=json.dumps(body, separators=(",", ":"), ensure_ascii=False),
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        # throttled before signing, so the timestamp is fresh once it is sent
+        self._throttle()
+        headers = self._l2_headers(request_args)
         # Builder flow
         if self.can_builder_auth():
             builder_headers = self._generate_builder_headers(request_args, headers)
@@ -601,7 +652,8 @@ class ClobClient:
             body=body,
             serialized_body=json.dumps(body, separators=(",", ":"), ensure_ascii=False),
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        self._throttle()
+        headers = self._l2_headers(request_args)
         # Builder flow
         if self.can_builder_auth():
             builder_headers = self._generate_builder_headers(request_args, headers)
@@ -640,7 +692,8 @@ class ClobClient:
             body=body,
             serialized_body=json.dumps(body, separators=(",", ":"), ensure_ascii=False),
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        self._throttle()
+        headers = self._l2_headers(request_args)
         return delete(
             "{}{}".format(self.host, CANCEL),
             headers=headers,
@@ -661,7 +714,8 @@ class ClobClient:
             body=body,
             serialized_body=serialized,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        self._throttle()
+        headers = self._l2_headers(request_args)
         return delete(
             "{}{}".format(self.host, CANCEL_ORDERS), headers=headers, data=serialized
         )
@@ -673,23 +727,26 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=CANCEL_ALL)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        self._throttle()
+        headers = self._l2_headers(request_args)
         return delete("{}{}".format(self.host, CANCEL_ALL), headers=headers)
 
-    def post_heartbeat(self, heartbeat_id: Optional[str]):
+    def post_heartbeat(self, heartbeat_id: Optional[str], http_client=None):
         """
         Sends a heartbeat to the server, if heartbeats are started and one isn't sent within 10s, all orders will be cancelled
+        An http_client (see new_http_client) sends it on a dedicated connection instead of the shared pool
         Requires Level 2 authentication
         """
         self.assert_level_2_auth()
         body = {"heartbeat_id": heartbeat_id}
         serialized = json.dumps(body, separators=(",", ":"), ensure_ascii=False)
         request_args = RequestArgs(method="POST", request_path=POST_HEARTBEAT, body=body, serialized_body=serialized)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return post(
             "{}{}".format(self.host, POST_HEARTBEAT),
             headers=headers,
-            data=serialized
+            data=serialized,
+            http_client=http_client,
         )
 
     def cancel_market_orders(self, market: str = "", asset_id: str = ""):
@@ -706,33 +763,69 @@ class ClobClient:
             body=body,
             serialized_body=serialized,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        self._throttle()
+        headers = self._l2_headers(request_args)
         return delete(
             "{}{}".format(self.host, CANCEL_MARKET_ORDERS),
             headers=headers,
             data=serialized,
         )
 
-    def get_orders(self, params: OpenOrderParams = None, next_cursor="MA=="):
-        """
-        Gets orders for the API key
-        Requires Level 2 authentication
-        """
+    def _orders_page_fetcher(self, params: OpenOrderParams = None):
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=ORDERS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
 
-        results = []
-        next_cursor = next_cursor if next_cursor is not None else "MA=="
-        while next_cursor != END_CURSOR:
+        def fetch_page(next_cursor):
+            self._throttle()
+            # signed per page, so long pulls never send a stale timestamp
+            headers = self._l2_headers(request_args)
             url = add_query_open_orders_params(
                 "{}{}".format(self.host, ORDERS), params, next_cursor
             )
-            response = get(url, headers=headers)
-            next_cursor = response["next_cursor"]
-            results += response["data"]
+            return get(url, headers=headers)
+
+        return fetch_page
+
+    def get_orders(self, params: OpenOrderParams = None, next_cursor="MA=="):
+        """
+        Gets orders for the API key
+        Requires Level 2 authentication
+        """
+        fetch_page = self._orders_page_fetcher(params)
+        return list(iter_records(fetch_page, next_cursor, prefetch=False))
+
+    def iter_orders(
+        self,
+        params: OpenOrderParams = None,
+        next_cursor="MA==",
+        prefetch: bool = True,
+        pages: bool = False,
+    ) -> Iterator:
+        """
+        Lazily yields the orders for the API key (or whole pages, with `pages`) as they arrive
+        With `prefetch`, the next page is fetched while the current one is processed
+        Requires Level 2 authentication
+        """
+        fetch_page = self._orders_page_fetcher(params)
+        if pages:
+            return iter_pages(fetch_page, next_cursor, prefetch)
+        return iter_records(fetch_page, next_cursor, prefetch)
 
-        return results
+    def aiter_orders(
+        self,
+        params: OpenOrderParams = None,
+        next_cursor="MA==",
+        prefetch: bool = True,
+        pages: bool = False,
+    ) -> AsyncIterator:
+        """
+        Async variant of iter_orders, requests run in the event loop's default executor
+        Requires Level 2 authentication
+        """
+        fetch_page = self._orders_page_fetcher(params)
+        if pages:
+            return aiter_pages(fetch_page, next_cursor, prefetch)
+        return aiter_records(fetch_page, next_cursor, prefetch)
 
     def get_order_book(self, token_id) -> OrderBookSummary:
         """
@@ -741,14 +834,26 @@ class ClobClient:
         raw_obs = get("{}{}?token_id={}".format(self.host, GET_ORDER_BOOK, token_id))
         return parse_raw_orderbook_summary(raw_obs)
 
+    def get_order_book_depth(self, token_id) -> OrderBookDepth:
+        """
+        Fetches the orderbook for the token_id and precomputes its cumulative depth
+        """
+        return OrderBookDepth(self.get_order_book(token_id))
+
     def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
         """
         Fetches the orderbook for a set of token ids
         """
-        body = [{"token_id": param.token_id} for param in params]
-        raw_obs = post("{}{}".format(self.host, GET_ORDER_BOOKS), data=body)
+        raw_obs = self.get_raw_order_books(params)
         return [parse_raw_orderbook_summary(r) for r in raw_obs]
 
+    def get_raw_order_books(self, params: list[BookParams]) -> list[dict]:
+        """
+        Fetches the orderbook for a set of token ids, without parsing the responses
+        """
+        body = [{"token_id": param.token_id} for param in params]
+        return self._post_chunked(GET_ORDER_BOOKS, body, merge_lists)
+
     def get_order_book_hash(self, orderbook: OrderBookSummary) -> str:
         """
         Calculates the hash for the given orderbook
@@ -763,29 +868,63 @@ class ClobClient:
         self.assert_level_2_auth()
         endpoint = "{}{}".format(GET_ORDER, order_id)
         request_args = RequestArgs(method="GET", request_path=endpoint)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return get("{}{}".format(self.host, endpoint), headers=headers)
 
-    def get_trades(self, params: TradeParams = None, next_cursor="MA=="):
-        """
-        Fetches the trade history for a user
-        Requires Level 2 authentication
-        """
+    def _trades_page_fetcher(self, params: TradeParams = None):
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=TRADES)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
 
-        results = []
-        next_cursor = next_cursor if next_cursor is not None else "MA=="
-        while next_cursor != END_CURSOR:
+        def fetch_page(next_cursor):
+            self._throttle()
+            headers = self._l2_headers(request_args)
             url = add_query_trade_params(
                 "{}{}".format(self.host, TRADES), params, next_cursor
             )
-            response = get(url, headers=headers)
-            next_cursor = response["next_cursor"]
-            results += response["data"]
+            return get(url, headers=headers)
+
+        return fetch_page
+
+    def get_trades(self, params: TradeParams = None, next_cursor="MA=="):
+        """
+        Fetches the trade history for a user
+        Requires Level 2 authentication
+        """
+        fetch_page = self._trades_page_fetcher(params)
+        return list(iter_records(fetch_page, next_cursor, prefetch=False))
 
-        return results
+    def iter_trades(
+        self,
+        params: TradeParams = None,
+        next_cursor="MA==",
+        prefetch: bool = True,
+        pages: bool = False,
+    ) -> Iterator:
+        """
+        Lazily yields the trade history for a user (or whole pages, with `pages`) as they arrive
+        With `prefetch`, the next page is fetched while the current one is processed
+        Requires Level 2 authentication
+        """
+        fetch_page = self._trades_page_fetcher(params)
+        if pages:
+            return iter_pages(fetch_page, next_cursor, prefetch)
+        return iter_records(fetch_page, next_cursor, prefetch)
+
+    def aiter_trades(
+        self,
+        params: TradeParams = None,
+        next_cursor="MA==",
+        prefetch: bool = True,
+        pages: bool = False,
+    ) -> AsyncIterator:
+        """
+        Async variant of iter_trades, requests run in the event loop's default executor
+        Requires Level 2 authentication
+        """
+        fetch_page = self._trades_page_fetcher(params)
+        if pages:
+            return aiter_pages(fetch_page, next_cursor, prefetch)
+        return aiter_records(fetch_page, next_cursor, prefetch)
 
     def get_last_trade_price(self, token_id):
         """
@@ -798,7 +937,7 @@ class ClobClient:
         Fetches the last trades prices for a set of token ids
         """
         body = [{"token_id": param.token_id} for param in params]
-        return post("{}{}".format(self.host, GET_LAST_TRADES_PRICES), data=body)
+        return self._post_chunked(GET_LAST_TRADES_PRICES, body, merge_lists)
 
     def assert_level_1_auth(self):
         """
@@ -824,6 +963,68 @@ class ClobClient:
     def can_builder_auth(self) -> bool:
         return self.builder_config is not None and self.builder_config.is_valid()
 
+    def sync_clock(self, refresh_interval: float = None) -> ServerClock:
+        """
+        Estimates the offset to the server clock from /time and uses it for all signed headers
+        With refresh_interval, the offset is refreshed in the background every refresh_interval seconds
+        """
+        if self.clock is None:
+            self.clock = ServerClock(self.get_server_time)
+        self.clock.sync()
+        if refresh_interval is not None:
+            self.clock.start(refresh_interval)
+        return self.clock
+
+    def _timestamp(self) -> Optional[int]:
+        return self.clock.timestamp() if self.clock is not None else None
+
+    def _l1_headers(self, nonce: int = None) -> dict:
+        if self.l1_header_cache is not None:
+            return self.l1_header_cache.get_headers(
+                self.signer, nonce, self._timestamp()
+            )
+        return create_level_1_headers(self.signer, nonce, self._timestamp())
+
+    def get_hmac_signer(self) -> HmacSigner:
+        """
+        HmacSigner for the current api creds, built on first use and again when they change
+        """
+        secret = self.creds.api_secret
+        if self._hmac_signer is None or self._hmac_signer[0] != secret:
+            self._hmac_signer = (secret, HmacSigner(secret))
+        return self._hmac_signer[1]
+
+    def _l2_headers(self, request_args: RequestArgs) -> dict:
+        return create_level_2_headers(
+            self.signer,
+            self.creds,
+            request_args,
+            self._timestamp(),
+            self.get_hmac_signer(),
+        )
+
+    def _throttle(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+    def _post_chunked(self, request_path: str, body: list, merge):
+        """
+        Posts a batch body in chunks of batch_chunk_size, concurrently, merging the responses in order
+        """
+        url = "{}{}".format(self.host, request_path)
+
+        def post_chunk(chunk: list):
+            self._throttle()
+            return post(url, data=chunk)
+
+        return run_chunked(
+            post_chunk,
+            body,
+            merge,
+            chunk_size=self.batch_chunk_size,
+            max_workers=self.batch_workers,
+        )
+
     def _get_client_mode(self):
         if self.signer is not None and self.creds is not None:
             return L2
@@ -858,7 +1059,9 @@ class ClobClient:
         Returns:
             dict or None: Builder headers as a dictionary, or None if not available.
         """
-        headers = self.builder_config.generate_builder_headers(method, path, body)
+        headers = self.builder_config.generate_builder_headers(
+            method, path, body, self._timestamp()
+        )
         if headers:
             return headers.to_dict()
         return None
@@ -870,7 +1073,7 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         url = "{}{}?signature_type={}".format(
             self.host, GET_NOTIFICATIONS, self.builder.sig_type
         )
@@ -883,7 +1086,7 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="DELETE", request_path=DROP_NOTIFICATIONS)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         url = drop_notifications_query_params(
             "{}{}".format(self.host, DROP_NOTIFICATIONS), params
         )
@@ -896,7 +1099,7 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=GET_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
@@ -911,7 +1114,7 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=UPDATE_BALANCE_ALLOWANCE)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         if params.signature_type == -1:
             params.signature_type = self.builder.sig_type
         url = add_balance_allowance_params_to_url(
@@ -926,7 +1129,7 @@ class ClobClient:
         """
         self.assert_level_2_auth()
         request_args = RequestArgs(method="GET", request_path=IS_ORDER_SCORING)
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         url = add_order_scoring_params_to_url(
             "{}{}".format(self.host, IS_ORDER_SCORING), params
         )
@@ -946,7 +1149,7 @@ class ClobClient:
             body=body,
             serialized_body=serialized,
         )
-        headers = create_level_2_headers(self.signer, self.creds, request_args)
+        headers = self._l2_headers(request_args)
         return post(
             "{}{}".format(self.host, ARE_ORDERS_SCORING),
             headers=headers,
@@ -997,38 +1200,79 @@ class ClobClient:
         """
         return get("{}{}{}".format(self.host, GET_MARKET_TRADES_EVENTS, condition_id))
 
-    def get_builder_trades(self, params: TradeParams = None, next_cursor="MA=="):
-        """
-        Get trades originated by the builder
-        """
+    def _builder_trades_page_fetcher(self, params: TradeParams = None):
         self.assert_builder_auth()
 
         request_args = RequestArgs(method="GET", request_path=GET_BUILDER_TRADES)
-        headers = self._get_builder_headers(
-            request_args.method, request_args.request_path, request_args.body
-        )
 
-        results = []
-        next_cursor = next_cursor if next_cursor is not None else "MA=="
-        while next_cursor != END_CURSOR:
+        def fetch_page(next_cursor):
+            self._throttle()
+            headers = self._get_builder_headers(
+                request_args.method, request_args.request_path, request_args.body
+            )
             url = add_query_trade_params(
                 "{}{}".format(self.host, GET_BUILDER_TRADES), params, next_cursor
             )
-            response = get(url, headers=headers)
-            next_cursor = response["next_cursor"]
-            results += response["data"]
+            return get(url, headers=headers)
+
+        return fetch_page
+
+    def get_builder_trades(self, params: TradeParams = None, next_cursor="MA=="):
+        """
+        Get trades originated by the builder
+        """
+        fetch_page = self._builder_trades_page_fetcher(params)
+        return list(iter_records(fetch_page, next_cursor, prefetch=False))
+
+    def iter_builder_trades(
+        self,
+        params: TradeParams = None,
+        next_cursor="MA==",
+        prefetch: bool = True,
+        pages: bool = False,
+    ) -> Iterator:
+        """
+        Lazily yields trades originated by the builder (or whole pages, with `pages`) as they arrive
+        With `prefetch`, the next page is fetched while the current one is processed
+        """
+        fetch_page = self._builder_trades_page_fetcher(params)
+        if pages:
+            return iter_pages(fetch_page, next_cursor, prefetch)
+        return iter_records(fetch_page, next_cursor, prefetch)
 
-        return results
+    def aiter_builder_trades(
+        self,
+        params: TradeParams = None,
+        next_cursor="MA==",
+        prefetch: bool = True,
+        pages: bool = False,
+    ) -> AsyncIterator:
+        """
+        Async variant of iter_builder_trades, requests run in the event loop's default executor
+        """
+        fetch_page = self._builder_trades_page_fetcher(params)
+        if pages:
+            return aiter_pages(fetch_page, next_cursor, prefetch)
+        return aiter_records(fetch_page, next_cursor, prefetch)
 
     def calculate_market_price(
-        self, token_id: str, side: str, amount: float, order_type: OrderType
+        self,
+        token_id: str,
+        side: str,
+        amount: float,
+        order_type: OrderType,
+        book: Union[OrderBookSummary, OrderBookDepth] = None,
     ) -> float:
         """
         Calculates the matching price considering an amount and the current orderbook
+        A locally held `book` is used instead of fetching the orderbook when provided
         """
-        book = self.get_order_book(token_id)
+        if book is None:
+            book = self.get_order_book(token_id)
         if book is None:
             raise Exception("no orderbook")
+        if isinstance(book, OrderBookDepth):
+            return book.market_price(side, amount, order_type)
         if side == "BUY":
             if book.asks is None:
                 raise Exception("no match")
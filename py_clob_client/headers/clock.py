@@ -0,0 +1,90 @@
+import logging
+import threading
+import time
+from typing import Callable, Optional
+
+CLOCK_SAMPLES = 5
+
+
+class ServerClock:
+    """
+    Estimates the offset between the local clock and the server's
+
+    Each sync samples `fetch_server_time` (unix seconds) a few times and keeps
+    the sample with the shortest round trip, assuming the server read its
+    clock at the midpoint of that round trip. The server truncates to whole
+    seconds, so half a second is added to centre the estimate. now() and
+    timestamp() only add the cached offset to time.time().
+    """
+
+    def __init__(
+        self,
+        fetch_server_time: Callable[[], int],
+        samples: int = CLOCK_SAMPLES,
+    ):
+        self.fetch_server_time = fetch_server_time
+        self.samples = max(1, samples)
+        self.offset = 0.0
+        self.round_trip: Optional[float] = None
+        self.synced_at: Optional[float] = None
+
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def sync(self) -> float:
+        """
+        Re-estimates the offset, returns it in seconds
+        """
+        best = None
+        for _ in range(self.samples):
+            sent = time.time()
+            server_time = float(self.fetch_server_time())
+            received = time.time()
+            round_trip = received - sent
+            if best is None or round_trip < best[0]:
+                best = (round_trip, server_time + 0.5 - (sent + received) / 2)
+
+        self.round_trip, self.offset = best
+        self.synced_at = time.time()
+        return self.offset
+
+    def now(self) -> float:
+        return time.time() + self.offset
+
+    def timestamp(self) -> int:
+        """
+        Current server time in whole seconds, as used by the signed headers
+        """
+        return int(time.time() + self.offset)
+
+    def run(self, interval: float = 300.0, stop_event: threading.Event = None):
+        """
+        Resyncs every `interval` seconds until `stop_event` is set
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.wait(interval):
+            try:
+                self.sync()
+            except Exception as e:
+                self.logger.error("Server clock sync failed: {}".format(e))
+
+    def start(self, interval: float = 300.0):
+        """
+        Keeps the offset fresh in a daemon thread
+        """
+        if self._thread is not None:
+            return
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self.run, args=(interval, self._stop_event), daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._stop_event = None
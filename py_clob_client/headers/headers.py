@@ -1,8 +1,9 @@
 from ..clob_types import ApiCreds, RequestArgs
-from ..signing.hmac import build_hmac_signature
+from ..signing.hmac import HmacSigner
 from ..signer import Signer
 from ..signing.eip712 import sign_clob_auth_message
 
+import threading
 from datetime import datetime
 
 POLY_ADDRESS = "POLY_ADDRESS"
@@ -12,12 +13,15 @@ POLY_NONCE = "POLY_NONCE"
 POLY_API_KEY = "POLY_API_KEY"
 POLY_PASSPHRASE = "POLY_PASSPHRASE"
 
+L1_HEADER_TTL = 30
 
-def create_level_1_headers(signer: Signer, nonce: int = None):
+
+def create_level_1_headers(signer: Signer, nonce: int = None, timestamp: int = None):
     """
-    Creates Level 1 Poly headers for a request
+    Creates Level 1 Poly headers for a request, timestamped now unless given
     """
-    timestamp = int(datetime.now().timestamp())
+    if timestamp is None:
+        timestamp = int(datetime.now().timestamp())
 
     n = 0
     if nonce is not None:
@@ -34,9 +38,57 @@ def create_level_1_headers(signer: Signer, nonce: int = None):
     return headers
 
 
-def create_level_2_headers(signer: Signer, creds: ApiCreds, request_args: RequestArgs):
-    """Creates Level 2 Poly headers for a request using pre-serialized body if provided"""
-    timestamp = int(datetime.now().timestamp())
+class L1HeaderCache:
+    """
+    Reuses signed Level 1 headers per (address, chain id, nonce) for `ttl` seconds
+
+    Signing ClobAuth is an EIP712 hash plus an ECDSA signature, while the
+    server accepts a header for a while after its timestamp. Opt in by
+    passing a cache to ClobClient, one cache can be shared across clients.
+    """
+
+    def __init__(self, ttl: int = L1_HEADER_TTL):
+        self.ttl = ttl
+        self._headers: dict[tuple, dict] = {}
+        self._lock = threading.Lock()
+
+    def get_headers(self, signer: Signer, nonce: int = None, timestamp: int = None):
+        """
+        Cached headers while younger than ttl at `timestamp` (now by default), else freshly signed ones
+        """
+        if timestamp is None:
+            timestamp = int(datetime.now().timestamp())
+        key = (signer.address(), signer.get_chain_id(), nonce or 0)
+
+        headers = self._headers.get(key)
+        if (
+            headers is None
+            or not 0 <= timestamp - int(headers[POLY_TIMESTAMP]) < self.ttl
+        ):
+            headers = create_level_1_headers(signer, nonce, timestamp)
+            with self._lock:
+                self._headers[key] = headers
+        # callers may add to the headers they get
+        return dict(headers)
+
+    def clear(self):
+        with self._lock:
+            self._headers.clear()
+
+
+def create_level_2_headers(
+    signer: Signer,
+    creds: ApiCreds,
+    request_args: RequestArgs,
+    timestamp: int = None,
+    hmac_signer: HmacSigner = None,
+):
+    """Creates Level 2 Poly headers for a request using pre-serialized body if provided
+
+    Pass the HmacSigner kept for `creds` to skip setting one up per request.
+    """
+    if timestamp is None:
+        timestamp = int(datetime.now().timestamp())
 
     # Prefer the pre-serialized body string for deterministic signing if available
     body_for_sig = (
@@ -45,8 +97,9 @@ def create_level_2_headers(signer: Signer, creds: ApiCreds, request_args: Reques
         else request_args.body
     )
 
-    hmac_sig = build_hmac_signature(
-        creds.api_secret,
+    if hmac_signer is None:
+        hmac_signer = HmacSigner(creds.api_secret)
+    hmac_sig = hmac_signer.sign(
         timestamp,
         request_args.method,
         request_args.request_path,
@@ -65,4 +118,8 @@ def create_level_2_headers(signer: Signer, creds: ApiCreds, request_args: Reques
 def enrich_l2_headers_with_builder_headers(
     headers: dict, builder_headers: dict
 ) -> dict:
-    return {**headers, **builder_headers}
+    """
+    Adds the builder headers to the freshly created L2 headers, in place
+    """
+    headers.update(builder_headers)
+    return headers
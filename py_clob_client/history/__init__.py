@@ -0,0 +1,9 @@
+from .bulk import fetch_trade_history, split_time_range
+from .sync import SyncCheckpoint, TradeSync
+
+__all__ = [
+    "fetch_trade_history",
+    "split_time_range",
+    "SyncCheckpoint",
+    "TradeSync",
+]
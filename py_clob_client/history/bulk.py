@@ -0,0 +1,93 @@
+import heapq
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from typing import TYPE_CHECKING
+
+from ..clob_types import TradeParams
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+TRADE_TIME_KEY = "match_time"
+TRADE_ID_KEY = "id"
+
+
+def split_time_range(after: int, before: int, shards: int) -> list[tuple[int, int]]:
+    """
+    Splits [after, before] into up to `shards` contiguous (after, before) windows
+
+    Neighbouring windows share their boundary timestamp, trades landing on it
+    are deduplicated when the shards are merged.
+    """
+    if before < after:
+        raise ValueError("before must not be earlier than after")
+
+    shards = max(1, min(shards, before - after or 1))
+    width = (before - after) / shards
+    bounds = [after + round(i * width) for i in range(shards)] + [before]
+    return list(zip(bounds[:-1], bounds[1:]))
+
+
+def trade_timestamp(trade: dict, time_key: str) -> int:
+    try:
+        return int(trade.get(time_key) or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+def fetch_trade_history(
+    client: "ClobClient",
+    params: TradeParams = None,
+    after: int = None,
+    before: int = None,
+    shards: int = 8,
+    max_workers: int = None,
+    builder: bool = False,
+    time_key: str = TRADE_TIME_KEY,
+    id_key: str = TRADE_ID_KEY,
+) -> list[dict]:
+    """
+    Downloads the trade history between `after` and `before` (unix seconds) concurrently
+
+    The range is split into `shards` windows which are paginated in parallel,
+    each page going through the client's rate limiter when one is set. The
+    results are merged in ascending time order and trades repeated on shard
+    boundaries are dropped.
+
+    `params` narrows the query (market, asset_id, ...), its after/before are
+    used when the arguments are not given. `before` defaults to now.
+    With `builder`, builder trades are fetched instead of the user's trades.
+    """
+    params = params or TradeParams()
+    after = after if after is not None else params.after
+    before = before if before is not None else params.before
+    if after is None:
+        raise ValueError("a start timestamp (after) is required to shard the history")
+    if before is None:
+        before = int(time.time())
+
+    iter_trades = client.iter_builder_trades if builder else client.iter_trades
+    windows = split_time_range(int(after), int(before), shards)
+
+    def fetch_window(window: tuple[int, int]) -> list[dict]:
+        shard_params = replace(params, after=window[0], before=window[1])
+        trades = list(iter_trades(shard_params, prefetch=False))
+        trades.sort(key=lambda t: trade_timestamp(t, time_key))
+        return trades
+
+    with ThreadPoolExecutor(max_workers=max_workers or len(windows)) as executor:
+        shard_results = list(executor.map(fetch_window, windows))
+
+    results = []
+    seen = set()
+    for trade in heapq.merge(
+        *shard_results, key=lambda t: trade_timestamp(t, time_key)
+    ):
+        trade_id = trade.get(id_key)
+        if trade_id is not None:
+            if trade_id in seen:
+                continue
+            seen.add(trade_id)
+        results.append(trade)
+    return results
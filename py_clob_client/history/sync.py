@@ -0,0 +1,145 @@
+import json
+import os
+import threading
+from dataclasses import asdict, dataclass, field, replace
+from typing import Iterator, TYPE_CHECKING
+
+from ..clob_types import TradeParams
+from .bulk import TRADE_ID_KEY, TRADE_TIME_KEY, trade_timestamp
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+STORE_FILE = "trades.jsonl"
+CHECKPOINT_FILE = "checkpoint.json"
+
+
+@dataclass
+class SyncCheckpoint:
+    last_time: int = None
+    """
+    Timestamp of the newest synced trade
+    """
+
+    recent_ids: list[str] = field(default_factory=list)
+    """
+    Ids of the synced trades inside the overlap window before last_time
+    """
+
+
+class TradeSync:
+    """
+    Incrementally mirrors a trade history into a local append-only store
+
+    The newest synced timestamp is persisted as a checkpoint. Each sync only
+    asks the server for trades after it (minus a small overlap, since trades
+    sharing the checkpoint second may arrive late), drops the ones already
+    stored and appends the rest. With `builder`, builder trades are synced.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        directory: str,
+        params: TradeParams = None,
+        builder: bool = False,
+        overlap: int = 1,
+        time_key: str = TRADE_TIME_KEY,
+        id_key: str = TRADE_ID_KEY,
+    ):
+        self.client = client
+        self.directory = directory
+        self.params = params or TradeParams()
+        self.builder = builder
+        self.overlap = overlap
+        self.time_key = time_key
+        self.id_key = id_key
+
+        self.store_path = os.path.join(directory, STORE_FILE)
+        self.checkpoint_path = os.path.join(directory, CHECKPOINT_FILE)
+        self._lock = threading.Lock()
+
+        os.makedirs(directory, exist_ok=True)
+        self.checkpoint = self._load_checkpoint()
+
+    def _load_checkpoint(self) -> SyncCheckpoint:
+        if not os.path.exists(self.checkpoint_path):
+            return SyncCheckpoint()
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            return SyncCheckpoint(**json.load(f))
+
+    def _save_checkpoint(self, checkpoint: SyncCheckpoint):
+        tmp_path = self.checkpoint_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(asdict(checkpoint), f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def sync(self) -> list[dict]:
+        """
+        Fetches and stores the trades newer than the checkpoint, returned oldest first
+        """
+        with self._lock:
+            checkpoint = self.checkpoint
+            params = self.params
+            if checkpoint.last_time is not None:
+                params = replace(params, after=checkpoint.last_time - self.overlap)
+
+            iter_trades = (
+                self.client.iter_builder_trades
+                if self.builder
+                else self.client.iter_trades
+            )
+            known = set(checkpoint.recent_ids)
+            trades = [t for t in iter_trades(params) if t.get(self.id_key) not in known]
+            if not trades:
+                return []
+
+            trades.sort(key=lambda t: trade_timestamp(t, self.time_key))
+            with open(self.store_path, "a", encoding="utf-8") as f:
+                for trade in trades:
+                    f.write(json.dumps(trade, separators=(",", ":")))
+                    f.write("\n")
+                f.flush()
+                os.fsync(f.fileno())
+
+            self.checkpoint = self._next_checkpoint(checkpoint, trades)
+            self._save_checkpoint(self.checkpoint)
+            return trades
+
+    def _next_checkpoint(
+        self, checkpoint: SyncCheckpoint, trades: list[dict]
+    ) -> SyncCheckpoint:
+        last_time = max(
+            trade_timestamp(trades[-1], self.time_key), checkpoint.last_time or 0
+        )
+        window_start = last_time - self.overlap
+        # previous ids are kept while their window still overlaps the new one
+        recent_ids = [
+            i for i in checkpoint.recent_ids if checkpoint.last_time >= window_start
+        ]
+        recent_ids += [
+            t.get(self.id_key)
+            for t in trades
+            if trade_timestamp(t, self.time_key) >= window_start
+            and t.get(self.id_key) is not None
+        ]
+        return SyncCheckpoint(last_time=last_time, recent_ids=recent_ids)
+
+    def trades_since(self, timestamp: int = None) -> Iterator[dict]:
+        """
+        Yields the stored trades at or after `timestamp` (all of them by default)
+        """
+        if not os.path.exists(self.store_path):
+            return
+        with open(self.store_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                trade = json.loads(line)
+                if (
+                    timestamp is None
+                    or trade_timestamp(trade, self.time_key) >= timestamp
+                ):
+                    yield trade
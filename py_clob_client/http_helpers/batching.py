@@ -0,0 +1,72 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from .retry import RETRIES, call_with_retries
+
+T = TypeVar("T")
+
+BATCH_CHUNK_SIZE = 500
+BATCH_WORKERS = 4
+
+
+def chunked(items: list, size: Optional[int]) -> list[list]:
+    """
+    Splits `items` into consecutive chunks of at most `size` items, a falsy size means one chunk
+    """
+    if not size or len(items) <= size:
+        return [items]
+    return [items[i : i + size] for i in range(0, len(items), size)]
+
+
+def merge_lists(results: list[list]) -> list:
+    merged = []
+    for result in results:
+        merged.extend(result)
+    return merged
+
+
+def merge_dicts(results: list[dict]) -> dict:
+    merged = {}
+    for result in results:
+        merged.update(result)
+    return merged
+
+
+def merge_nested_dicts(results: list[dict]) -> dict:
+    """
+    Merges {key: {sub_key: value}} responses, e.g. prices keyed by token and side
+    """
+    merged = {}
+    for result in results:
+        for key, value in result.items():
+            if isinstance(value, dict) and isinstance(merged.get(key), dict):
+                merged[key].update(value)
+            else:
+                merged[key] = value
+    return merged
+
+
+def run_chunked(
+    call: Callable[[list], T],
+    items: list,
+    merge: Callable[[list[T]], T],
+    chunk_size: Optional[int] = BATCH_CHUNK_SIZE,
+    max_workers: int = BATCH_WORKERS,
+    retries: int = RETRIES,
+) -> T:
+    """
+    Calls `call` once per chunk of `items` and merges the responses in input order
+
+    Chunks are dispatched concurrently on up to `max_workers` threads, each
+    failed chunk is retried on its own (see call_with_retries) without
+    re-sending the others.
+    """
+    chunks = chunked(items, chunk_size)
+    if len(chunks) == 1:
+        return merge([call_with_retries(call, chunks[0], retries=retries)])
+
+    def call_chunk(chunk: list) -> T:
+        return call_with_retries(call, chunk, retries=retries)
+
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        return merge(list(executor.map(call_chunk, chunks)))
@@ -1,3 +1,6 @@
+from types import MappingProxyType
+from typing import Mapping
+
 import httpx
 
 from py_clob_client.clob_types import (
@@ -16,37 +19,89 @@ POST = "POST"
 DELETE = "DELETE"
 PUT = "PUT"
 
-_http_client = httpx.Client(http2=True)
+STATIC_HEADERS = MappingProxyType(
+    {
+        "User-Agent": "py_clob_client",
+        "Accept": "*/*",
+        "Connection": "keep-alive",
+        "Content-Type": "application/json",
+    }
+)
+
+# per-method additions to STATIC_HEADERS, built once and shared read-only
+_METHOD_HEADERS = {
+    GET: {"Accept-Encoding": "gzip"},
+    POST: {},
+    DELETE: {},
+    PUT: {},
+}
+METHOD_HEADERS = {
+    method: MappingProxyType(headers) for method, headers in _METHOD_HEADERS.items()
+}
+
+# the static headers are defaults of the connection pool, httpx merges them
+# into every request while building it, so requests only carry the rest
+_http_client = httpx.Client(http2=True, headers=STATIC_HEADERS)
+
+
+def new_http_client(**kwargs) -> httpx.Client:
+    """
+    A separate connection pool sending the same static headers, for traffic that must not queue behind the shared one
+    """
+    return httpx.Client(http2=True, headers=STATIC_HEADERS, **kwargs)
+
+
+def base_headers(method: str) -> Mapping[str, str]:
+    """
+    The immutable headers sent with every request of the method, on top of STATIC_HEADERS
+    """
+    return METHOD_HEADERS.get(method, METHOD_HEADERS[POST])
 
 
 def overloadHeaders(method: str, headers: dict) -> dict:
     if headers is None:
         headers = dict()
-    headers["User-Agent"] = "py_clob_client"
+    headers.update(STATIC_HEADERS)
+    headers.update(base_headers(method))
+    return headers
 
-    headers["Accept"] = "*/*"
-    headers["Connection"] = "keep-alive"
-    headers["Content-Type"] = "application/json"
 
-    if method == GET:
-        headers["Accept-Encoding"] = "gzip"
+def request_headers(method: str, headers: dict = None) -> Mapping[str, str]:
+    """
+    Headers to pass for one request, STATIC_HEADERS come from the client
 
+    Without per-request (auth) headers the shared method mapping is used as
+    is. Auth headers are created for a single request, so the method headers
+    are added to them in place rather than copied.
+    """
+    if not headers:
+        return base_headers(method)
+    extra = _METHOD_HEADERS.get(method)
+    if extra:
+        headers.update(extra)
     return headers
 
 
-def request(endpoint: str, method: str, headers=None, data=None):
+def request(
+    endpoint: str,
+    method: str,
+    headers=None,
+    data=None,
+    http_client: httpx.Client = None,
+):
+    http_client = http_client or _http_client
     try:
-        headers = overloadHeaders(method, headers)
+        headers = request_headers(method, headers)
         if isinstance(data, str):
             # Pre-serialized body: send exact bytes
-            resp = _http_client.request(
+            resp = http_client.request(
                 method=method,
                 url=endpoint,
                 headers=headers,
                 content=data.encode("utf-8"),
             )
         else:
-            resp = _http_client.request(
+            resp = http_client.request(
                 method=method,
                 url=endpoint,
                 headers=headers,
@@ -65,20 +120,20 @@ def request(endpoint: str, method: str, headers=None, data=None):
         raise PolyApiException(error_msg="Request exception!")
 
 
-def post(endpoint, headers=None, data=None):
-    return request(endpoint, POST, headers, data)
+def post(endpoint, headers=None, data=None, http_client: httpx.Client = None):
+    return request(endpoint, POST, headers, data, http_client)
 
 
-def get(endpoint, headers=None, data=None):
-    return request(endpoint, GET, headers, data)
+def get(endpoint, headers=None, data=None, http_client: httpx.Client = None):
+    return request(endpoint, GET, headers, data, http_client)
 
 
-def delete(endpoint, headers=None, data=None):
-    return request(endpoint, DELETE, headers, data)
+def delete(endpoint, headers=None, data=None, http_client: httpx.Client = None):
+    return request(endpoint, DELETE, headers, data, http_client)
 
 
-def put(endpoint, headers=None, data=None):
-    return request(endpoint, PUT, headers, data)
+def put(endpoint, headers=None, data=None, http_client: httpx.Client = None):
+    return request(endpoint, PUT, headers, data, http_client)
 
 
 def build_query_params(url: str, param: str, val: str) -> str:
@@ -0,0 +1,116 @@
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Generic, Optional, TypeVar
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+MICROBATCH_WINDOW = 0.002
+
+
+class MicroBatcher(Generic[T, R]):
+    """
+    Collects items submitted from any thread within a short window and flushes them together
+
+    The first item of a batch opens a `window` (seconds) during which further
+    submissions join it; the batch is flushed earlier once it holds
+    `max_batch` items. `flush` receives the items in submission order and
+    returns one result per item, results that are exceptions are raised to
+    that item's caller only. If `flush` itself raises, every future of the
+    batch fails with that error. Flushes run on up to `max_workers` threads,
+    so the next batch starts collecting while the previous one is in flight.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[list[T]], list[R]],
+        window: float = MICROBATCH_WINDOW,
+        max_batch: Optional[int] = None,
+        max_workers: int = 4,
+    ):
+        if window < 0:
+            raise ValueError("window must not be negative")
+
+        self.flush = flush
+        self.window = window
+        self.max_batch = max_batch
+
+        self._pending: list[tuple[T, Future]] = []
+        self._cond = threading.Condition()
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, item: T) -> Future:
+        """
+        Queues `item` for the next batch, the returned future resolves to its result
+        """
+        future = Future()
+        with self._cond:
+            if self._closed:
+                raise RuntimeError("cannot submit to a closed batcher")
+            self._pending.append((item, future))
+            if len(self._pending) == 1 or self._is_full():
+                self._cond.notify()
+        return future
+
+    def _is_full(self) -> bool:
+        return self.max_batch is not None and len(self._pending) >= self.max_batch
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+
+                deadline = time.monotonic() + self.window
+                while not self._closed and not self._is_full():
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                size = self.max_batch or len(self._pending)
+                batch = self._pending[:size]
+                del self._pending[:size]
+            self._executor.submit(self._flush, batch)
+
+    def _flush(self, batch: list[tuple[T, Future]]):
+        batch = [(item, f) for item, f in batch if f.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        try:
+            results = self.flush([item for item, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+    def close(self, wait: bool = True):
+        """
+        Flushes what is pending and stops accepting new items
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
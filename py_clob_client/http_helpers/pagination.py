@@ -0,0 +1,136 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Callable, Iterator
+
+from ..constants import END_CURSOR
+from .retry import RETRIES, RETRY_BACKOFF, call_with_retries
+
+INITIAL_CURSOR = "MA=="
+
+
+def resumable(
+    fetch_page: Callable[[str], dict],
+    retries: int = RETRIES,
+    backoff: float = RETRY_BACKOFF,
+) -> Callable[[str], dict]:
+    """
+    Wraps `fetch_page` so a failed page is requested again from the same cursor
+
+    Retryable failures are retried up to `retries` times with exponential
+    backoff, `fetch_page` is expected to sign each call afresh. The error
+    finally raised carries the failed cursor as `next_cursor`, so the caller
+    can resume the pull from there instead of from the start.
+    """
+
+    def fetch(next_cursor: str) -> dict:
+        try:
+            return call_with_retries(
+                fetch_page, next_cursor, retries=retries, backoff=backoff
+            )
+        except Exception as exc:
+            exc.next_cursor = next_cursor
+            raise
+
+    return fetch
+
+
+def iter_pages(
+    fetch_page: Callable[[str], dict],
+    next_cursor: str = INITIAL_CURSOR,
+    prefetch: bool = True,
+    retries: int = RETRIES,
+) -> Iterator[list]:
+    """
+    Yields the `data` of each page of a cursor paginated endpoint until END_CURSOR
+
+    `fetch_page` is called with the cursor of the page to fetch. With `prefetch`,
+    the next page is requested in the background while the caller processes the
+    current one. Failed pages are retried from their cursor, see resumable.
+    """
+    next_cursor = next_cursor if next_cursor is not None else INITIAL_CURSOR
+    if next_cursor == END_CURSOR:
+        return
+    if retries:
+        fetch_page = resumable(fetch_page, retries)
+
+    if not prefetch:
+        while next_cursor != END_CURSOR:
+            response = fetch_page(next_cursor)
+            next_cursor = response["next_cursor"]
+            yield response["data"]
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1)
+    try:
+        pending = executor.submit(fetch_page, next_cursor)
+        while pending is not None:
+            response = pending.result()
+            next_cursor = response["next_cursor"]
+            pending = (
+                executor.submit(fetch_page, next_cursor)
+                if next_cursor != END_CURSOR
+                else None
+            )
+            yield response["data"]
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def iter_records(
+    fetch_page: Callable[[str], dict],
+    next_cursor: str = INITIAL_CURSOR,
+    prefetch: bool = True,
+    retries: int = RETRIES,
+) -> Iterator:
+    """
+    Yields the records of every page of a cursor paginated endpoint
+    """
+    for page in iter_pages(fetch_page, next_cursor, prefetch, retries):
+        yield from page
+
+
+async def aiter_pages(
+    fetch_page: Callable[[str], dict],
+    next_cursor: str = INITIAL_CURSOR,
+    prefetch: bool = True,
+    retries: int = RETRIES,
+) -> AsyncIterator[list]:
+    """
+    Async variant of iter_pages, the blocking `fetch_page` runs in the loop's default executor
+    """
+    next_cursor = next_cursor if next_cursor is not None else INITIAL_CURSOR
+    if next_cursor == END_CURSOR:
+        return
+    if retries:
+        fetch_page = resumable(fetch_page, retries)
+
+    loop = asyncio.get_running_loop()
+    pending = loop.run_in_executor(None, fetch_page, next_cursor)
+    try:
+        while pending is not None:
+            response = await pending
+            next_cursor = response["next_cursor"]
+            has_next = next_cursor != END_CURSOR
+            pending = None
+            if has_next and prefetch:
+                pending = loop.run_in_executor(None, fetch_page, next_cursor)
+            yield response["data"]
+            if has_next and not prefetch:
+                pending = loop.run_in_executor(None, fetch_page, next_cursor)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def aiter_records(
+    fetch_page: Callable[[str], dict],
+    next_cursor: str = INITIAL_CURSOR,
+    prefetch: bool = True,
+    retries: int = RETRIES,
+) -> AsyncIterator:
+    """
+    Yields the records of every page of a cursor paginated endpoint
+    """
+    async for page in aiter_pages(fetch_page, next_cursor, prefetch, retries):
+        for record in page:
+            yield record
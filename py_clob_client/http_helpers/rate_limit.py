@@ -0,0 +1,53 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread safe token bucket
+
+    Allows `rate` requests per second on average with bursts of up to `burst`
+    requests. acquire() blocks until a token is available.
+    """
+
+    def __init__(self, rate: float, burst: int = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, tokens: int = 1) -> bool:
+        """
+        Takes `tokens` if available right now, without blocking
+        """
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: int = 1):
+        """
+        Blocks until `tokens` are available and takes them
+        """
+        if tokens > self.burst:
+            raise ValueError("cannot acquire more tokens than the burst size")
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
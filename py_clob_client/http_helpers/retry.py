@@ -0,0 +1,40 @@
+import time
+from typing import Callable, TypeVar
+
+from ..exceptions import PolyApiException
+
+T = TypeVar("T")
+
+RETRIES = 3
+RETRY_BACKOFF = 0.5
+
+# None is a transport failure. 401 is left out: every attempt is signed
+# afresh, so it means bad credentials or a skewed clock, which retrying
+# does not fix
+RETRYABLE_STATUS_CODES = {None, 408, 425, 429, 500, 502, 503, 504}
+
+
+def is_retryable(exc: Exception) -> bool:
+    return (
+        isinstance(exc, PolyApiException) and exc.status_code in RETRYABLE_STATUS_CODES
+    )
+
+
+def call_with_retries(
+    fn: Callable[..., T],
+    *args,
+    retries: int = RETRIES,
+    backoff: float = RETRY_BACKOFF,
+) -> T:
+    """
+    Calls `fn(*args)`, retrying retryable failures up to `retries` times with exponential backoff
+    """
+    attempt = 0
+    while True:
+        try:
+            return fn(*args)
+        except Exception as exc:
+            if attempt >= retries or not is_retryable(exc):
+                raise
+            time.sleep(backoff * 2**attempt)
+            attempt += 1
@@ -0,0 +1,11 @@
+from .aggregator import PriceAggregator
+from .catalog import MarketCatalog
+from .scheduler import LatestValueStore, PollingScheduler, PollTier
+
+__all__ = [
+    "LatestValueStore",
+    "MarketCatalog",
+    "PollingScheduler",
+    "PollTier",
+    "PriceAggregator",
+]
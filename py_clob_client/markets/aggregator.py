@@ -0,0 +1,85 @@
+from concurrent.futures import Future
+from typing import Optional, TYPE_CHECKING
+
+from ..clob_types import BookParams
+from ..exceptions import PolyApiException
+from ..http_helpers.microbatch import MICROBATCH_WINDOW, MicroBatcher
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+
+def _missing(token_id: str) -> PolyApiException:
+    return PolyApiException(error_msg=f"no value returned for token {token_id}")
+
+
+class PriceAggregator:
+    """
+    Coalesces single-token price calls from many threads into batch requests
+
+    get_midpoint, get_price and get_spread return futures. Calls made within
+    `window` seconds of each other are sent as one get_midpoints, get_prices
+    or get_spreads request and every future resolves to the same shape the
+    single-token endpoint returns, e.g. {"mid": "0.5"}.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        window: float = MICROBATCH_WINDOW,
+        max_batch: Optional[int] = None,
+    ):
+        self.client = client
+        self._midpoints = MicroBatcher(self._flush_midpoints, window, max_batch)
+        self._prices = MicroBatcher(self._flush_prices, window, max_batch)
+        self._spreads = MicroBatcher(self._flush_spreads, window, max_batch)
+
+    def get_midpoint(self, token_id: str) -> Future:
+        return self._midpoints.submit(token_id)
+
+    def get_price(self, token_id: str, side: str) -> Future:
+        return self._prices.submit((token_id, side))
+
+    def get_spread(self, token_id: str) -> Future:
+        return self._spreads.submit(token_id)
+
+    def _flush_midpoints(self, token_ids: list[str]) -> list:
+        mids = self.client.get_midpoints(
+            [BookParams(token_id=t) for t in dict.fromkeys(token_ids)]
+        )
+        return [
+            {"mid": mids[t]} if mids.get(t) is not None else _missing(t)
+            for t in token_ids
+        ]
+
+    def _flush_prices(self, keys: list[tuple[str, str]]) -> list:
+        prices = self.client.get_prices(
+            [BookParams(token_id=t, side=s) for t, s in dict.fromkeys(keys)]
+        )
+        results = []
+        for token_id, side in keys:
+            price = (prices.get(token_id) or {}).get(side)
+            results.append(
+                {"price": price} if price is not None else _missing(token_id)
+            )
+        return results
+
+    def _flush_spreads(self, token_ids: list[str]) -> list:
+        spreads = self.client.get_spreads(
+            [BookParams(token_id=t) for t in dict.fromkeys(token_ids)]
+        )
+        return [
+            {"spread": spreads[t]} if spreads.get(t) is not None else _missing(t)
+            for t in token_ids
+        ]
+
+    def close(self):
+        self._midpoints.close()
+        self._prices.close()
+        self._spreads.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,326 @@
+import base64
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TYPE_CHECKING
+
+from ..constants import END_CURSOR
+from ..http_helpers.pagination import INITIAL_CURSOR, iter_pages
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+MARKETS = "markets"
+SIMPLIFIED_MARKETS = "simplified_markets"
+SAMPLING_MARKETS = "sampling_markets"
+SAMPLING_SIMPLIFIED_MARKETS = "sampling_simplified_markets"
+
+SOURCES = {
+    MARKETS: "get_markets",
+    SIMPLIFIED_MARKETS: "get_simplified_markets",
+    SAMPLING_MARKETS: "get_sampling_markets",
+    SAMPLING_SIMPLIFIED_MARKETS: "get_sampling_simplified_markets",
+}
+
+
+def encode_cursor(offset: int) -> str:
+    """
+    Cursor of the page starting at `offset`, the server encodes it as base64 of the offset
+    """
+    return base64.b64encode(str(offset).encode("utf-8")).decode("utf-8")
+
+
+class MarketCatalog:
+    """
+    In-memory index of every market, looked up by condition id, token id or slug
+
+    load() downloads all pages. Cursors are plain base64 offsets, so once the
+    first page confirms the page size the following pages are requested
+    concurrently; if the server's cursors stop matching the guesses the
+    download continues sequentially from the last confirmed cursor.
+
+    refresh() is incremental: it resumes from the cursor of the last (partial)
+    page, which is where newly listed markets show up. A full reload picks
+    up state changes of existing markets (closed, tick size, ...), start()
+    runs both periodically in a background thread.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        source: str = MARKETS,
+        max_workers: int = 8,
+    ):
+        if source not in SOURCES:
+            raise ValueError(f"source must be one of {', '.join(SOURCES)}")
+
+        self.client = client
+        self.source = source
+        self.max_workers = max_workers
+
+        self.markets: dict[str, dict] = {}
+        self._by_token: dict[str, dict] = {}
+        self._by_slug: dict[str, dict] = {}
+        self._complements: dict[str, str] = {}
+        self._tail_cursor: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._stop_event: Optional[threading.Event] = None
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def __len__(self):
+        return len(self.markets)
+
+    def __contains__(self, condition_id: str):
+        return condition_id in self.markets
+
+    def _fetch_page(self, next_cursor: str) -> dict:
+        rate_limiter = getattr(self.client, "rate_limiter", None)
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        return getattr(self.client, SOURCES[self.source])(next_cursor)
+
+    def _fetch_sequential(self, next_cursor: str) -> tuple[list[dict], str]:
+        pages = []
+        fetch_page = self._fetch_page
+
+        def track(cursor):
+            nonlocal tail
+            tail = cursor
+            return fetch_page(cursor)
+
+        tail = next_cursor
+        for page in iter_pages(track, next_cursor, prefetch=False):
+            pages.append(page)
+        return pages, tail
+
+    def _fetch_all(self) -> tuple[list[list[dict]], str]:
+        """
+        Downloads every page, returns their data in order and the cursor of the last one
+        """
+        first = self._fetch_page(INITIAL_CURSOR)
+        pages = [first["data"]]
+        next_cursor = first["next_cursor"]
+        page_size = len(first["data"])
+        if next_cursor == END_CURSOR:
+            return pages, INITIAL_CURSOR
+        if not page_size or next_cursor != encode_cursor(page_size):
+            rest, tail = self._fetch_sequential(next_cursor)
+            return pages + rest, tail
+
+        def try_fetch(cursor):
+            try:
+                return self._fetch_page(cursor)
+            except Exception as e:
+                return e
+
+        offset = page_size
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            while True:
+                cursors = [
+                    encode_cursor(offset + i * page_size)
+                    for i in range(self.max_workers)
+                ]
+                for i, page in enumerate(executor.map(try_fetch, cursors)):
+                    cursor = cursors[i]
+                    if isinstance(page, Exception):
+                        # guessed past the end or a transient failure, go one by one
+                        rest, tail = self._fetch_sequential(cursor)
+                        return pages + rest, tail
+
+                    pages.append(page["data"])
+                    if page["next_cursor"] == END_CURSOR:
+                        return pages, cursor
+                    expected = encode_cursor(offset + (i + 1) * page_size)
+                    if page["next_cursor"] != expected:
+                        rest, tail = self._fetch_sequential(page["next_cursor"])
+                        return pages + rest, tail
+                offset += self.max_workers * page_size
+
+    def _index(
+        self,
+        market: dict,
+        markets: dict,
+        by_token: dict,
+        by_slug: dict,
+        complements: dict,
+    ):
+        condition_id = market.get("condition_id")
+        if not condition_id:
+            return
+
+        previous = markets.get(condition_id)
+        if previous is not None:
+            for token in previous.get("tokens") or ():
+                by_token.pop(token.get("token_id"), None)
+                complements.pop(token.get("token_id"), None)
+            if previous.get("market_slug"):
+                by_slug.pop(previous["market_slug"], None)
+
+        markets[condition_id] = market
+        token_ids = [
+            token.get("token_id")
+            for token in market.get("tokens") or ()
+            if token.get("token_id")
+        ]
+        for token_id in token_ids:
+            by_token[token_id] = market
+        if len(token_ids) == 2:
+            complements[token_ids[0]] = token_ids[1]
+            complements[token_ids[1]] = token_ids[0]
+        if market.get("market_slug"):
+            by_slug[market["market_slug"]] = market
+
+    def load(self) -> int:
+        """
+        Downloads the full catalog, replacing the current indexes, returns the market count
+        """
+        pages, tail = self._fetch_all()
+
+        markets, by_token, by_slug, complements = {}, {}, {}, {}
+        for page in pages:
+            for market in page:
+                self._index(market, markets, by_token, by_slug, complements)
+
+        with self._lock:
+            self.markets = markets
+            self._by_token = by_token
+            self._by_slug = by_slug
+            self._complements = complements
+            self._tail_cursor = tail
+        return len(markets)
+
+    def refresh(self) -> list[dict]:
+        """
+        Fetches the pages from the last known cursor onwards and returns the new or updated markets
+        """
+        if self._tail_cursor is None:
+            self.load()
+            return list(self.markets.values())
+
+        pages, tail = self._fetch_sequential(self._tail_cursor)
+        updated = []
+        with self._lock:
+            for page in pages:
+                for market in page:
+                    if market != self.markets.get(market.get("condition_id")):
+                        self._index(
+                            market,
+                            self.markets,
+                            self._by_token,
+                            self._by_slug,
+                            self._complements,
+                        )
+                        updated.append(market)
+            self._tail_cursor = tail
+        return updated
+
+    def upsert(self, market: dict):
+        """
+        Adds or replaces a single market, e.g. with the result of get_market
+        """
+        with self._lock:
+            self._index(
+                market, self.markets, self._by_token, self._by_slug, self._complements
+            )
+
+    def get(self, condition_id: str) -> Optional[dict]:
+        return self.markets.get(condition_id)
+
+    def by_token(self, token_id: str) -> Optional[dict]:
+        return self._by_token.get(token_id)
+
+    def by_slug(self, slug: str) -> Optional[dict]:
+        return self._by_slug.get(slug)
+
+    def complement(self, token_id: str) -> Optional[str]:
+        """
+        The other outcome token of a binary market
+        """
+        return self._complements.get(token_id)
+
+    def tick_size(self, token_id: str) -> Optional[str]:
+        market = self._by_token.get(token_id)
+        if market is None or market.get("minimum_tick_size") is None:
+            return None
+        return str(market["minimum_tick_size"])
+
+    def neg_risk(self, token_id: str) -> Optional[bool]:
+        market = self._by_token.get(token_id)
+        return None if market is None else market.get("neg_risk")
+
+    def is_active(self, token_id: str) -> bool:
+        """
+        Whether the token's market is active and not closed
+        """
+        market = self._by_token.get(token_id)
+        return bool(market and market.get("active") and not market.get("closed"))
+
+    def token_ids(self, active_only: bool = False) -> list[str]:
+        return [
+            token_id
+            for token_id in list(self._by_token)
+            if not active_only or self.is_active(token_id)
+        ]
+
+    def run(
+        self,
+        interval: float = 60.0,
+        full_interval: float = 3600.0,
+        on_update: Callable[[list[dict]], None] = None,
+        stop_event: threading.Event = None,
+    ):
+        """
+        Refreshes every `interval` seconds and reloads everything every `full_interval`
+        seconds until `stop_event` is set, calling `on_update` with the changed markets
+        """
+        stop_event = stop_event or threading.Event()
+        since_full = 0.0
+        while not stop_event.wait(interval):
+            since_full += interval
+            try:
+                if full_interval is not None and since_full >= full_interval:
+                    since_full = 0.0
+                    previous = self.markets
+                    self.load()
+                    updated = [
+                        market
+                        for condition_id, market in self.markets.items()
+                        if previous.get(condition_id) != market
+                    ]
+                else:
+                    updated = self.refresh()
+                if updated and on_update is not None:
+                    on_update(updated)
+            except Exception as e:
+                self.logger.error("Market catalog refresh failed: {}".format(e))
+
+    def start(
+        self,
+        interval: float = 60.0,
+        full_interval: float = 3600.0,
+        on_update: Callable[[list[dict]], None] = None,
+    ):
+        """
+        Loads the catalog if needed and keeps it refreshed in a daemon thread
+        """
+        if self._thread is not None:
+            return
+        if self._tail_cursor is None:
+            self.load()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self.run,
+            args=(interval, full_interval, on_update, self._stop_event),
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+        self._stop_event = None
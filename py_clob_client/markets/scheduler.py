@@ -0,0 +1,254 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable, Optional, TYPE_CHECKING
+
+from ..clob_types import BookParams
+from ..order_builder.constants import BUY, SELL
+from ..utilities import parse_raw_orderbook_summary
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+PRICES = "prices"
+BOOK = "book"
+
+
+@dataclass
+class PollTier:
+    priority: int = 0
+    """
+    Lower values are polled first when a cycle is over budget
+    """
+
+    interval: float = 5.0
+    """
+    Target refresh interval in seconds
+    """
+
+    min_interval: float = None
+    max_interval: float = None
+    """
+    Bounds for the volatility adjusted interval, default to interval / 4 and interval * 4
+    """
+
+    books: bool = False
+    """
+    Whether to poll the full orderbook in addition to the prices
+    """
+
+    def __post_init__(self):
+        if self.interval <= 0:
+            raise ValueError("interval must be positive")
+        if self.min_interval is None:
+            self.min_interval = self.interval / 4
+        if self.max_interval is None:
+            self.max_interval = self.interval * 4
+
+
+@dataclass
+class _TrackedToken:
+    tier: PollTier
+    interval: float
+    next_due: float
+    last_mid: Optional[float] = None
+    last_hash: Optional[str] = None
+
+
+class LatestValueStore:
+    """
+    Thread safe store of the latest value per (token id, field), with change listeners
+    """
+
+    def __init__(self):
+        self._values: dict[tuple[str, str], tuple[float, Any]] = {}
+        self._listeners: list[Callable[[str, str, Any], None]] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, listener: Callable[[str, str, Any], None]):
+        """
+        Registers `listener(token_id, field, value)`, called on every update
+        """
+        self._listeners.append(listener)
+
+    def update(self, token_id: str, field: str, value: Any, ts: float = None):
+        with self._lock:
+            self._values[(token_id, field)] = (
+                ts if ts is not None else time.time(),
+                value,
+            )
+        for listener in self._listeners:
+            listener(token_id, field, value)
+
+    def get(self, token_id: str, field: str, default: Any = None) -> Any:
+        entry = self._values.get((token_id, field))
+        return entry[1] if entry is not None else default
+
+    def updated_at(self, token_id: str, field: str) -> Optional[float]:
+        entry = self._values.get((token_id, field))
+        return entry[0] if entry is not None else None
+
+    def remove(self, token_id: str):
+        with self._lock:
+            for key in [k for k in self._values if k[0] == token_id]:
+                del self._values[key]
+
+
+class PollingScheduler:
+    """
+    Polls prices (and optionally books) for many tokens in tiers, batching each cycle
+
+    Every tracked token is due once its current interval has elapsed. A cycle
+    gathers the due tokens, highest priority and most overdue first, capped at
+    `max_tokens_per_cycle`, and fetches them with one get_prices and one
+    get_raw_order_books call; the client chunks those and throttles each chunk
+    through its rate limiter. Tokens left over are simply due in the next cycle.
+
+    Intervals adapt to volatility: when the midpoint moves by at least
+    `move_threshold` the token's interval is halved, otherwise it grows by
+    half, always within its tier's bounds. Results are published to `store`
+    under the PRICES ({side: price}) and BOOK (OrderBookSummary) fields.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        store: LatestValueStore = None,
+        max_tokens_per_cycle: int = None,
+        move_threshold: float = 0.005,
+    ):
+        self.client = client
+        self.store = store if store is not None else LatestValueStore()
+        self.max_tokens_per_cycle = max_tokens_per_cycle
+        self.move_threshold = move_threshold
+
+        self._tokens: dict[str, _TrackedToken] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def add_tokens(self, token_ids: Iterable[str], tier: PollTier = None):
+        """
+        Tracks the tokens in `tier`, moving them if already tracked, they are due immediately
+        """
+        tier = tier or PollTier()
+        with self._lock:
+            for token_id in token_ids:
+                self._tokens[token_id] = _TrackedToken(
+                    tier=tier, interval=tier.interval, next_due=float("-inf")
+                )
+
+    def remove_tokens(self, token_ids: Iterable[str]):
+        with self._lock:
+            for token_id in token_ids:
+                self._tokens.pop(token_id, None)
+
+    def interval(self, token_id: str) -> Optional[float]:
+        tracked = self._tokens.get(token_id)
+        return tracked.interval if tracked is not None else None
+
+    def due(self, now: float = None) -> list[str]:
+        """
+        Token ids due at `now`, in the order they would be polled
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            due = [
+                (t.tier.priority, t.next_due, token_id)
+                for token_id, t in self._tokens.items()
+                if t.next_due <= now
+            ]
+        due.sort()
+        token_ids = [token_id for _, _, token_id in due]
+        if self.max_tokens_per_cycle is not None:
+            token_ids = token_ids[: self.max_tokens_per_cycle]
+        return token_ids
+
+    def cycle(self, now: float = None) -> list[str]:
+        """
+        Polls the due tokens once and returns them
+        """
+        now = time.monotonic() if now is None else now
+        token_ids = self.due(now)
+        if not token_ids:
+            return []
+
+        with self._lock:
+            book_ids = [
+                t for t in token_ids if t in self._tokens and self._tokens[t].tier.books
+            ]
+            # rescheduled up front so a failing request does not retry in a hot loop
+            for token_id in token_ids:
+                tracked = self._tokens.get(token_id)
+                if tracked is not None:
+                    tracked.next_due = now + tracked.interval
+
+        params = [
+            BookParams(token_id=token_id, side=side)
+            for token_id in token_ids
+            for side in (BUY, SELL)
+        ]
+        prices = self.client.get_prices(params)
+        raw_books = (
+            self.client.get_raw_order_books(
+                [BookParams(token_id=token_id) for token_id in book_ids]
+            )
+            if book_ids
+            else []
+        )
+
+        for token_id in token_ids:
+            token_prices = prices.get(token_id)
+            if token_prices:
+                self.store.update(token_id, PRICES, token_prices)
+                self._adapt(token_id, token_prices, now)
+
+        for raw in raw_books:
+            token_id = raw["asset_id"]
+            tracked = self._tokens.get(token_id)
+            if tracked is None:
+                continue
+            if raw.get("hash") and raw.get("hash") == tracked.last_hash:
+                continue
+            tracked.last_hash = raw.get("hash")
+            self.store.update(token_id, BOOK, parse_raw_orderbook_summary(raw))
+
+        return token_ids
+
+    def _adapt(self, token_id: str, token_prices: dict, now: float):
+        try:
+            mid = (float(token_prices[BUY]) + float(token_prices[SELL])) / 2
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self._lock:
+            tracked = self._tokens.get(token_id)
+            if tracked is None:
+                return
+            tier = tracked.tier
+            if tracked.last_mid is not None:
+                if abs(mid - tracked.last_mid) >= self.move_threshold:
+                    tracked.interval = max(tier.min_interval, tracked.interval / 2)
+                else:
+                    tracked.interval = min(tier.max_interval, tracked.interval * 1.5)
+                tracked.next_due = now + tracked.interval
+            tracked.last_mid = mid
+
+    def run(self, stop_event: threading.Event = None, idle_wait: float = 0.05):
+        """
+        Runs cycles until `stop_event` is set, sleeping until the next token is due
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                self.cycle()
+            except Exception as e:
+                self.logger.error("Price poll cycle failed: {}".format(e))
+
+            with self._lock:
+                next_due = min(
+                    (t.next_due for t in self._tokens.values()), default=None
+                )
+            wait = idle_wait if next_due is None else next_due - time.monotonic()
+            if wait > 0:
+                stop_event.wait(wait)
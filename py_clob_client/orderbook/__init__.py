@@ -0,0 +1,18 @@
+from .depth import OrderBookDepth
+from .local_book import LocalOrderBook, LocalOrderBooks
+from .poller import OrderBookPoller
+from .recorder import BookLogReader, BookLogWriter, BookRecorder
+from .replay import ReplayClient, ReplayEngine, ReplayStats
+
+__all__ = [
+    "OrderBookDepth",
+    "LocalOrderBook",
+    "LocalOrderBooks",
+    "OrderBookPoller",
+    "BookLogReader",
+    "BookLogWriter",
+    "BookRecorder",
+    "ReplayEngine",
+    "ReplayClient",
+    "ReplayStats",
+]
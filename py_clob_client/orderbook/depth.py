@@ -0,0 +1,184 @@
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Optional
+
+from ..clob_types import OrderBookSummary, OrderSummary, OrderType
+from ..order_builder.constants import BUY, SELL
+
+# Tolerance used when comparing float prices against tick boundaries
+PRICE_EPSILON = 1e-9
+
+
+class _DepthSide:
+    """
+    Cumulative view over one side of the book, ordered best level first
+    """
+
+    __slots__ = ("ascending", "prices", "sizes", "cum_sizes", "cum_notionals", "_keys")
+
+    def __init__(self, levels: list[OrderSummary], ascending: bool):
+        self.ascending = ascending
+        # The server sends both sides with the best level last
+        ordered = list(reversed(levels or []))
+        self.prices = [float(level.price) for level in ordered]
+        self.sizes = [float(level.size) for level in ordered]
+        self.cum_sizes = list(accumulate(self.sizes))
+        self.cum_notionals = list(
+            accumulate(p * s for p, s in zip(self.prices, self.sizes))
+        )
+        # bisect needs ascending keys: asks already are, bids are negated
+        self._keys = self.prices if ascending else [-p for p in self.prices]
+
+    def __len__(self):
+        return len(self.prices)
+
+    def best(self) -> Optional[float]:
+        return self.prices[0] if self.prices else None
+
+    def worst(self) -> Optional[float]:
+        return self.prices[-1] if self.prices else None
+
+    def fill_index(self, size: float) -> int:
+        """
+        Index of the level at which `size` shares are fully matched
+        """
+        return bisect_left(self.cum_sizes, size - PRICE_EPSILON)
+
+    def notional_index(self, amount: float) -> int:
+        """
+        Index of the level at which `amount` of collateral is fully matched
+        """
+        return bisect_left(self.cum_notionals, amount)
+
+    def levels_through(self, price: float) -> int:
+        """
+        Number of levels priced at or better than `price`
+        """
+        key = price if self.ascending else -price
+        return bisect_right(self._keys, key + PRICE_EPSILON)
+
+
+class OrderBookDepth:
+    """
+    Precomputed cumulative depth for an orderbook
+
+    Building the view walks the levels once. Every query afterwards is a
+    binary search over the cumulative size and notional arrays, so the same
+    book can be asked for prices, VWAPs and available size repeatedly without
+    refetching or rescanning it.
+    """
+
+    def __init__(self, book: OrderBookSummary):
+        self.book = book
+        self.tick_size = float(book.tick_size) if book.tick_size else None
+        self.bids = _DepthSide(book.bids, ascending=False)
+        self.asks = _DepthSide(book.asks, ascending=True)
+
+    @property
+    def asset_id(self) -> str:
+        return self.book.asset_id
+
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best()
+
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best()
+
+    def midpoint(self) -> Optional[float]:
+        bid, ask = self.best_bid(), self.best_ask()
+        if bid is None or ask is None:
+            return None
+        return (bid + ask) / 2
+
+    def _taker_side(self, side: str) -> _DepthSide:
+        """
+        Returns the side of the book a taker order of the given side consumes
+        """
+        if side == BUY:
+            return self.asks
+        if side == SELL:
+            return self.bids
+        raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+    def market_price(
+        self, side: str, amount: float, order_type: OrderType = OrderType.FOK
+    ) -> float:
+        """
+        Matching price for a market order, mirroring OrderBuilder's
+        calculate_buy_market_price / calculate_sell_market_price
+
+        BUY orders: `amount` is the collateral to spend
+        SELL orders: `amount` is the number of shares to sell
+        """
+        levels = self._taker_side(side)
+        if not len(levels):
+            raise Exception("no match")
+
+        if side == BUY:
+            i = levels.notional_index(amount)
+        else:
+            i = bisect_left(levels.cum_sizes, amount)
+        if i < len(levels):
+            return levels.prices[i]
+
+        if order_type == OrderType.FOK:
+            raise Exception("no match")
+
+        return levels.worst()
+
+    def price_to_fill(self, side: str, size: float) -> float:
+        """
+        Worst price reached when taking `size` shares from the book
+        """
+        levels = self._taker_side(side)
+        i = levels.fill_index(size)
+        if i >= len(levels):
+            raise Exception("no match")
+        return levels.prices[i]
+
+    def vwap(self, side: str, size: float) -> float:
+        """
+        Volume weighted average price of taking `size` shares from the book
+        """
+        if size <= 0:
+            raise ValueError("size must be positive")
+
+        levels = self._taker_side(side)
+        i = levels.fill_index(size)
+        if i >= len(levels):
+            raise Exception("no match")
+
+        filled, notional = 0.0, 0.0
+        if i > 0:
+            filled = levels.cum_sizes[i - 1]
+            notional = levels.cum_notionals[i - 1]
+        notional += (size - filled) * levels.prices[i]
+        return notional / size
+
+    def slippage(self, side: str, size: float) -> float:
+        """
+        Price paid over the midpoint when taking `size` shares from the book.
+        Positive values are always unfavourable to the taker
+        """
+        mid = self.midpoint()
+        if mid is None:
+            raise Exception("no midpoint")
+
+        vwap = self.vwap(side, size)
+        return vwap - mid if side == BUY else mid - vwap
+
+    def size_within_ticks(self, side: str, ticks: int) -> float:
+        """
+        Shares available to a taker within `ticks` ticks of the best price
+        """
+        if self.tick_size is None:
+            raise Exception("orderbook has no tick size")
+
+        levels = self._taker_side(side)
+        if not len(levels):
+            return 0.0
+
+        offset = ticks * self.tick_size
+        limit = levels.best() + offset if levels.ascending else levels.best() - offset
+        n = levels.levels_through(limit)
+        return levels.cum_sizes[n - 1] if n else 0.0
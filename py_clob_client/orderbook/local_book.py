@@ -0,0 +1,210 @@
+from typing import Optional
+
+from ..clob_types import OrderBookSummary, OrderSummary
+from ..order_builder.constants import BUY, SELL
+from .depth import OrderBookDepth
+
+# Market channel event types
+BOOK_EVENT = "book"
+PRICE_CHANGE_EVENT = "price_change"
+TICK_SIZE_CHANGE_EVENT = "tick_size_change"
+LAST_TRADE_PRICE_EVENT = "last_trade_price"
+
+
+class LocalOrderBook:
+    """
+    Orderbook for a single token kept up to date from snapshots and level changes
+
+    Levels are stored as price -> size maps keyed by the server's price strings,
+    so applying a change is O(1). Sorted views are only built on demand.
+    """
+
+    def __init__(self, asset_id: str, market: str = None):
+        self.asset_id = asset_id
+        self.market = market
+        self.bids: dict[str, str] = {}
+        self.asks: dict[str, str] = {}
+        self.timestamp: str = None
+        self.hash: str = None
+        self.min_order_size: str = None
+        self.tick_size: str = None
+        self.neg_risk: bool = None
+        self.last_trade_price: str = None
+
+        self._summary: Optional[OrderBookSummary] = None
+        self._depth: Optional[OrderBookDepth] = None
+
+    def _touch(self):
+        self._summary = None
+        self._depth = None
+
+    def apply_snapshot(self, raw: dict):
+        """
+        Replaces the book with a raw orderbook response or a `book` event
+        """
+        self.market = raw.get("market", self.market)
+        self.bids = {o["price"]: o["size"] for o in raw.get("bids") or ()}
+        self.asks = {o["price"]: o["size"] for o in raw.get("asks") or ()}
+        self.timestamp = raw.get("timestamp", self.timestamp)
+        self.hash = raw.get("hash", self.hash)
+        self.min_order_size = raw.get("min_order_size", self.min_order_size)
+        self.tick_size = raw.get("tick_size", self.tick_size)
+        self.neg_risk = raw.get("neg_risk", self.neg_risk)
+        self.last_trade_price = raw.get("last_trade_price", self.last_trade_price)
+        self._touch()
+
+    def apply_change(self, side: str, price: str, size: str):
+        """
+        Sets the size resting at a price level, a zero size removes the level
+        """
+        if side == BUY:
+            levels = self.bids
+        elif side == SELL:
+            levels = self.asks
+        else:
+            raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+        if float(size) == 0:
+            levels.pop(price, None)
+        else:
+            levels[price] = size
+        self._touch()
+
+    def to_raw(self) -> dict:
+        """
+        Raw orderbook response for the current state, levels in server order
+        """
+        return {
+            "market": self.market,
+            "asset_id": self.asset_id,
+            "timestamp": self.timestamp,
+            "hash": self.hash,
+            "bids": [
+                {"price": p, "size": s}
+                for p, s in sorted(self.bids.items(), key=lambda x: float(x[0]))
+            ],
+            "asks": [
+                {"price": p, "size": s}
+                for p, s in sorted(
+                    self.asks.items(), key=lambda x: float(x[0]), reverse=True
+                )
+            ],
+            "min_order_size": self.min_order_size,
+            "tick_size": self.tick_size,
+            "neg_risk": self.neg_risk,
+            "last_trade_price": self.last_trade_price,
+        }
+
+    def to_summary(self) -> OrderBookSummary:
+        """
+        OrderBookSummary for the current state, cached until the book changes
+        """
+        if self._summary is None:
+            raw = self.to_raw()
+            self._summary = OrderBookSummary(
+                market=raw["market"],
+                asset_id=raw["asset_id"],
+                timestamp=raw["timestamp"],
+                bids=[
+                    OrderSummary(price=o["price"], size=o["size"]) for o in raw["bids"]
+                ],
+                asks=[
+                    OrderSummary(price=o["price"], size=o["size"]) for o in raw["asks"]
+                ],
+                min_order_size=raw["min_order_size"],
+                neg_risk=raw["neg_risk"],
+                tick_size=raw["tick_size"],
+                last_trade_price=raw["last_trade_price"],
+                hash=raw["hash"],
+            )
+        return self._summary
+
+    def depth(self) -> OrderBookDepth:
+        """
+        Cumulative depth for the current state, cached until the book changes
+        """
+        if self._depth is None:
+            self._depth = OrderBookDepth(self.to_summary())
+        return self._depth
+
+
+class LocalOrderBooks:
+    """
+    Collection of local orderbooks driven by market channel messages
+    """
+
+    def __init__(self):
+        self.books: dict[str, LocalOrderBook] = {}
+
+    def __contains__(self, asset_id: str) -> bool:
+        return asset_id in self.books
+
+    def __len__(self) -> int:
+        return len(self.books)
+
+    def get(self, asset_id: str) -> Optional[LocalOrderBook]:
+        return self.books.get(asset_id)
+
+    def _book(self, asset_id: str, market: str = None) -> LocalOrderBook:
+        book = self.books.get(asset_id)
+        if book is None:
+            book = self.books[asset_id] = LocalOrderBook(asset_id, market)
+        return book
+
+    def apply_message(self, msg: dict) -> set[str]:
+        """
+        Applies a market channel message and returns the asset ids whose book changed
+        """
+        event_type = msg.get("event_type")
+
+        if event_type == BOOK_EVENT:
+            self._book(msg["asset_id"], msg.get("market")).apply_snapshot(msg)
+            return {msg["asset_id"]}
+
+        if event_type == PRICE_CHANGE_EVENT:
+            changed = set()
+            if "price_changes" in msg:
+                for change in msg["price_changes"]:
+                    book = self._book(change["asset_id"], msg.get("market"))
+                    book.apply_change(change["side"], change["price"], change["size"])
+                    book.hash = change.get("hash", book.hash)
+                    book.timestamp = msg.get("timestamp", book.timestamp)
+                    changed.add(change["asset_id"])
+            else:
+                # legacy format: a single asset with a list of changes
+                book = self._book(msg["asset_id"], msg.get("market"))
+                for change in msg.get("changes") or ():
+                    book.apply_change(change["side"], change["price"], change["size"])
+                book.hash = msg.get("hash", book.hash)
+                book.timestamp = msg.get("timestamp", book.timestamp)
+                changed.add(msg["asset_id"])
+            return changed
+
+        if event_type == TICK_SIZE_CHANGE_EVENT:
+            book = self._book(msg["asset_id"], msg.get("market"))
+            book.tick_size = msg.get("new_tick_size", book.tick_size)
+            book._touch()
+            return {msg["asset_id"]}
+
+        if event_type == LAST_TRADE_PRICE_EVENT:
+            book = self._book(msg["asset_id"], msg.get("market"))
+            book.last_trade_price = msg.get("price", book.last_trade_price)
+            book._touch()
+            return {msg["asset_id"]}
+
+        return set()
+
+
+def diff_levels(old: dict[str, str], new: dict[str, str], side: str) -> list[dict]:
+    """
+    Level changes turning `old` into `new`, removed levels get a zero size
+    """
+    changes = [
+        {"price": price, "size": size, "side": side}
+        for price, size in new.items()
+        if old.get(price) != size
+    ]
+    changes.extend(
+        {"price": price, "size": "0", "side": side} for price in old if price not in new
+    )
+    return changes
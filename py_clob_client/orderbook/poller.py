@@ -0,0 +1,117 @@
+import logging
+import threading
+from typing import Callable, Iterable, Optional, TYPE_CHECKING
+
+from ..clob_types import BookParams, OrderBookSummary
+from ..utilities import parse_raw_orderbook_summary
+from .depth import OrderBookDepth
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+
+class OrderBookPoller:
+    """
+    Polls orderbooks for a set of tokens and only parses the ones that moved
+
+    Each raw response's `hash` is compared against the last hash seen for that
+    token. Unchanged books are skipped without touching their level lists, and
+    the tokens whose hash changed are exposed through `changed` so downstream
+    consumers can recompute only what moved.
+    """
+
+    def __init__(self, client: "ClobClient", token_ids: Iterable[str] = ()):
+        self.client = client
+        self.token_ids: list[str] = []
+        self.books: dict[str, OrderBookSummary] = {}
+        self.changed: set[str] = set()
+
+        self._hashes: dict[str, str] = {}
+        self._depths: dict[str, OrderBookDepth] = {}
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self.add_tokens(token_ids)
+
+    def add_tokens(self, token_ids: Iterable[str]):
+        with self._lock:
+            for token_id in token_ids:
+                if token_id not in self.token_ids:
+                    self.token_ids.append(token_id)
+
+    def remove_tokens(self, token_ids: Iterable[str]):
+        with self._lock:
+            for token_id in token_ids:
+                if token_id in self.token_ids:
+                    self.token_ids.remove(token_id)
+                self.books.pop(token_id, None)
+                self._hashes.pop(token_id, None)
+                self._depths.pop(token_id, None)
+                self.changed.discard(token_id)
+
+    def poll(self) -> set[str]:
+        """
+        Fetches the books once and returns the set of token ids whose hash changed
+        """
+        with self._lock:
+            params = [BookParams(token_id=token_id) for token_id in self.token_ids]
+        if not params:
+            return set()
+
+        raw_obs = self.client.get_raw_order_books(params)
+        return self.apply(raw_obs)
+
+    def apply(self, raw_obs: list[dict]) -> set[str]:
+        """
+        Applies a batch of raw orderbook responses, parsing only the changed ones
+        """
+        changed = set()
+        with self._lock:
+            for raw in raw_obs:
+                token_id = raw["asset_id"]
+                raw_hash = raw.get("hash")
+                if raw_hash and self._hashes.get(token_id) == raw_hash:
+                    continue
+
+                self.books[token_id] = parse_raw_orderbook_summary(raw)
+                self._hashes[token_id] = raw_hash
+                self._depths.pop(token_id, None)
+                changed.add(token_id)
+            self.changed = changed
+        return changed
+
+    def get_book(self, token_id: str) -> Optional[OrderBookSummary]:
+        return self.books.get(token_id)
+
+    def get_depth(self, token_id: str) -> Optional[OrderBookDepth]:
+        """
+        Cumulative depth for the latest book of the token, rebuilt only after it changes
+        """
+        with self._lock:
+            depth = self._depths.get(token_id)
+            if depth is None:
+                book = self.books.get(token_id)
+                if book is None:
+                    return None
+                depth = self._depths[token_id] = OrderBookDepth(book)
+            return depth
+
+    def run(
+        self,
+        interval: float = 1.0,
+        on_change: Callable[[set[str]], None] = None,
+        stop_event: threading.Event = None,
+    ):
+        """
+        Polls every `interval` seconds until `stop_event` is set,
+        calling `on_change` with the changed token ids after each poll that moved something
+        """
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                changed = self.poll()
+                if changed and on_change is not None:
+                    on_change(changed)
+            except Exception as e:
+                self.logger.error("Orderbook poll failed: {}".format(e))
+            stop_event.wait(interval)
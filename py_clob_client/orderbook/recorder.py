@@ -0,0 +1,373 @@
+import json
+import logging
+import os
+import struct
+import threading
+import time
+import zlib
+from bisect import bisect_right
+from typing import Callable, Iterable, Iterator, Optional, TYPE_CHECKING
+
+from ..clob_types import BookParams
+from ..order_builder.constants import BUY, SELL
+from .local_book import (
+    BOOK_EVENT,
+    PRICE_CHANGE_EVENT,
+    LocalOrderBooks,
+    diff_levels,
+)
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+# Segment layout
+#   <prefix>-<first timestamp ms>.blog  append-only sequence of blocks
+#   <prefix>-<first timestamp ms>.bidx  one fixed size entry per block
+# Each block is a header followed by a zlib compressed payload of
+# newline separated `[timestamp_ms, message]` JSON records.
+BLOCK_MAGIC = b"PBK1"
+BLOCK_HEADER = struct.Struct("<4sIIQ")  # magic, payload length, record count, first ts
+INDEX_ENTRY = struct.Struct("<QQQI")  # first ts, last ts, block offset, record count
+
+# Book fields that are only carried by snapshots
+METADATA_KEYS = ("min_order_size", "tick_size", "neg_risk", "last_trade_price")
+
+LOG_SUFFIX = ".blog"
+INDEX_SUFFIX = ".bidx"
+
+
+def _now_ms() -> int:
+    return int(time.time() * 1000)
+
+
+class BookLogWriter:
+    """
+    Append-only, block compressed log of timestamped market messages
+
+    Records are buffered in memory up to `block_bytes` and then written as a
+    single zlib compressed block, with an index entry recording the block's
+    time range and file offset. Segments rotate once they exceed
+    `max_segment_bytes` or `max_segment_age` seconds.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        prefix: str = "books",
+        max_segment_bytes: int = 256 * 1024 * 1024,
+        max_segment_age: float = 3600,
+        block_bytes: int = 1024 * 1024,
+        compression_level: int = 6,
+        on_rotate: Callable[["BookLogWriter", int], None] = None,
+    ):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_segment_bytes = max_segment_bytes
+        self.max_segment_age = max_segment_age
+        self.block_bytes = block_bytes
+        self.compression_level = compression_level
+        self.on_rotate = on_rotate
+
+        self._lock = threading.RLock()
+        self._log = None
+        self._index = None
+        self._segment_started = None
+        self._rotating = False
+
+        self._buffer: list[bytes] = []
+        self._buffer_bytes = 0
+        self._first_ts = None
+        self._last_ts = None
+
+        os.makedirs(directory, exist_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @property
+    def segment_path(self) -> Optional[str]:
+        return self._log.name if self._log is not None else None
+
+    def write(self, msg: dict, ts: int = None):
+        """
+        Appends a message, timestamped in milliseconds (defaults to now)
+        """
+        ts = ts if ts is not None else _now_ms()
+        record = json.dumps([ts, msg], separators=(",", ":")).encode("utf-8")
+
+        with self._lock:
+            if self._log is None:
+                self._open_segment(ts)
+            elif not self._rotating and self._should_rotate(ts):
+                self._flush_block()
+                self._close_segment()
+                self._open_segment(ts)
+
+            if self._first_ts is None:
+                self._first_ts = ts
+            self._last_ts = ts
+            self._buffer.append(record)
+            self._buffer_bytes += len(record) + 1
+
+            if self._buffer_bytes >= self.block_bytes:
+                self._flush_block()
+
+    def flush(self):
+        with self._lock:
+            self._flush_block()
+            if self._log is not None:
+                self._log.flush()
+                self._index.flush()
+
+    def close(self):
+        with self._lock:
+            self._flush_block()
+            self._close_segment()
+
+    def _should_rotate(self, ts: int) -> bool:
+        if self._log.tell() + self._buffer_bytes >= self.max_segment_bytes:
+            return True
+        return (ts - self._segment_started) >= self.max_segment_age * 1000
+
+    def _open_segment(self, ts: int):
+        name = "{}-{:013d}".format(self.prefix, ts)
+        base = os.path.join(self.directory, name)
+        self._log = open(base + LOG_SUFFIX, "ab")
+        self._index = open(base + INDEX_SUFFIX, "ab")
+        self._segment_started = ts
+
+        if self.on_rotate is not None:
+            # let the owner re-seed the new segment, e.g. with full snapshots
+            self._rotating = True
+            try:
+                self.on_rotate(self, ts)
+            finally:
+                self._rotating = False
+
+    def _close_segment(self):
+        if self._log is not None:
+            self._log.close()
+            self._index.close()
+        self._log = None
+        self._index = None
+
+    def _flush_block(self):
+        if not self._buffer:
+            return
+
+        payload = zlib.compress(b"\n".join(self._buffer), self.compression_level)
+        offset = self._log.tell()
+        self._log.write(
+            BLOCK_HEADER.pack(
+                BLOCK_MAGIC, len(payload), len(self._buffer), self._first_ts
+            )
+        )
+        self._log.write(payload)
+        self._index.write(
+            INDEX_ENTRY.pack(self._first_ts, self._last_ts, offset, len(self._buffer))
+        )
+
+        self._buffer = []
+        self._buffer_bytes = 0
+        self._first_ts = None
+        self._last_ts = None
+
+
+class BookLogReader:
+    """
+    Reads the segments written by BookLogWriter, seeking by timestamp through the index
+    """
+
+    def __init__(self, directory: str, prefix: str = "books"):
+        self.directory = directory
+        self.prefix = prefix
+
+    def segments(self) -> list[str]:
+        """
+        Segment log paths, oldest first
+        """
+        names = [
+            name
+            for name in os.listdir(self.directory)
+            if name.startswith(self.prefix + "-") and name.endswith(LOG_SUFFIX)
+        ]
+        return [os.path.join(self.directory, name) for name in sorted(names)]
+
+    def read_index(self, segment: str) -> list[tuple]:
+        """
+        (first ts, last ts, offset, record count) for every block of a segment
+        """
+        path = segment[: -len(LOG_SUFFIX)] + INDEX_SUFFIX
+        if not os.path.exists(path):
+            return self._scan_index(segment)
+        with open(path, "rb") as f:
+            data = f.read()
+        usable = len(data) - len(data) % INDEX_ENTRY.size
+        return [entry for entry in INDEX_ENTRY.iter_unpack(data[:usable])]
+
+    def _scan_index(self, segment: str) -> list[tuple]:
+        entries = []
+        with open(segment, "rb") as f:
+            for offset, count, first_ts, payload in self._iter_blocks(f):
+                records = zlib.decompress(payload).split(b"\n")
+                last_ts = json.loads(records[-1])[0]
+                entries.append((first_ts, last_ts, offset, count))
+        return entries
+
+    def _iter_blocks(self, f):
+        while True:
+            offset = f.tell()
+            header = f.read(BLOCK_HEADER.size)
+            if len(header) < BLOCK_HEADER.size:
+                return
+            magic, length, count, first_ts = BLOCK_HEADER.unpack(header)
+            if magic != BLOCK_MAGIC:
+                raise ValueError("corrupt block at offset {}".format(offset))
+            payload = f.read(length)
+            if len(payload) < length:
+                # block still being written
+                return
+            yield offset, count, first_ts, payload
+
+    def iter_records(
+        self, start_ts: int = None, end_ts: int = None
+    ) -> Iterator[tuple[int, dict]]:
+        """
+        Yields (timestamp ms, message) in recording order within [start_ts, end_ts]
+        """
+        for segment in self.segments():
+            index = self.read_index(segment)
+            if not index:
+                continue
+            if end_ts is not None and index[0][0] > end_ts:
+                break
+            if start_ts is not None and index[-1][1] < start_ts:
+                continue
+
+            offset = 0
+            if start_ts is not None:
+                # last block starting at or before start_ts
+                i = bisect_right([entry[0] for entry in index], start_ts) - 1
+                offset = index[max(i, 0)][2]
+
+            with open(segment, "rb") as f:
+                f.seek(offset)
+                for _, _, first_ts, payload in self._iter_blocks(f):
+                    if end_ts is not None and first_ts > end_ts:
+                        return
+                    for line in zlib.decompress(payload).split(b"\n"):
+                        ts, msg = json.loads(line)
+                        if start_ts is not None and ts < start_ts:
+                            continue
+                        if end_ts is not None and ts > end_ts:
+                            return
+                        yield ts, msg
+
+
+class BookRecorder:
+    """
+    Captures orderbook snapshots and deltas into a BookLogWriter
+
+    Messages from the market stream are recorded as received. Polled books
+    are recorded as a `book` snapshot the first time a token is seen and as
+    `price_change` deltas afterwards, skipping books whose hash did not
+    change. Only the latest levels of each token are kept in memory, and every
+    new segment starts with a full snapshot of all known books so segments
+    can be replayed on their own.
+    """
+
+    def __init__(self, writer: BookLogWriter):
+        self.writer = writer
+        self.books = LocalOrderBooks()
+        self.writer.on_rotate = self._write_snapshots
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def _write_snapshots(self, writer: BookLogWriter, ts: int):
+        for book in list(self.books.books.values()):
+            writer.write({"event_type": BOOK_EVENT, **book.to_raw()}, ts)
+
+    def record_message(self, msg: dict, ts: int = None):
+        """
+        Records a market channel message
+        """
+        with self._lock:
+            # written before applying, so a rotation triggered by this write
+            # seeds the new segment with the state the message applies to
+            self.writer.write(msg, ts)
+            self.books.apply_message(msg)
+
+    def record_raw_books(self, raw_obs: Iterable[dict], ts: int = None) -> set[str]:
+        """
+        Records raw orderbook responses, returns the asset ids that were written
+        """
+        ts = ts if ts is not None else _now_ms()
+        written = set()
+        with self._lock:
+            for raw in raw_obs:
+                asset_id = raw["asset_id"]
+                book = self.books.get(asset_id)
+                if book is not None and raw.get("hash") and raw["hash"] == book.hash:
+                    continue
+
+                if book is None:
+                    msg = {"event_type": BOOK_EVENT, **raw}
+                else:
+                    msg = self._delta(book, raw)
+                if msg is None:
+                    continue
+
+                self.writer.write(msg, ts)
+                self.books.apply_message(msg)
+                written.add(asset_id)
+        return written
+
+    def _delta(self, book, raw: dict) -> Optional[dict]:
+        bids = {o["price"]: o["size"] for o in raw.get("bids") or ()}
+        asks = {o["price"]: o["size"] for o in raw.get("asks") or ()}
+        changes = diff_levels(book.bids, bids, BUY) + diff_levels(book.asks, asks, SELL)
+        if any(
+            raw.get(key, getattr(book, key)) != getattr(book, key)
+            for key in METADATA_KEYS
+        ):
+            # market metadata moved, deltas can't carry it
+            return {"event_type": BOOK_EVENT, **raw}
+        if not changes:
+            # hash moved without a level change (e.g. timestamp), nothing to replay
+            book.hash = raw.get("hash")
+            return None
+
+        for change in changes:
+            change["asset_id"] = raw["asset_id"]
+        changes[-1]["hash"] = raw.get("hash")
+        return {
+            "event_type": PRICE_CHANGE_EVENT,
+            "market": raw.get("market"),
+            "timestamp": raw.get("timestamp"),
+            "price_changes": changes,
+        }
+
+    def poll(
+        self,
+        client: "ClobClient",
+        token_ids: Iterable[str],
+        interval: float = 1.0,
+        stop_event: threading.Event = None,
+    ):
+        """
+        Records polled orderbooks every `interval` seconds until `stop_event` is set
+        """
+        params = [BookParams(token_id=token_id) for token_id in token_ids]
+        stop_event = stop_event or threading.Event()
+        while not stop_event.is_set():
+            try:
+                self.record_raw_books(client.get_raw_order_books(params))
+            except Exception as e:
+                self.logger.error("Orderbook capture failed: {}".format(e))
+            stop_event.wait(interval)
+
+    def close(self):
+        self.writer.close()
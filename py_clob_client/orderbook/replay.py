@@ -0,0 +1,211 @@
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ..clob_types import BookParams, OrderBookSummary
+from ..order_builder.constants import BUY, SELL
+from .depth import OrderBookDepth
+from .local_book import LocalOrderBook, LocalOrderBooks
+from .recorder import BookLogReader
+
+
+@dataclass
+class ReplayStats:
+    events: int = 0
+    elapsed: float = 0.0
+    first_ts: int = None
+    last_ts: int = None
+
+    @property
+    def events_per_second(self) -> float:
+        return self.events / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ReplayEngine:
+    """
+    Replays recorded orderbook logs through the same messages the market stream emits
+
+    Every recorded message is applied to a LocalOrderBooks instance and then
+    handed to the registered handlers, exactly like a live market channel
+    subscription. `speed=None` replays as fast as possible, otherwise the
+    recorded inter-event gaps are divided by `speed` (1.0 is real time).
+    """
+
+    def __init__(self, reader: BookLogReader, speed: Optional[float] = None):
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive")
+
+        self.reader = reader
+        self.speed = speed
+        self.books = LocalOrderBooks()
+        self.now_ms: int = None
+        self.handlers: list[Callable[[dict], None]] = []
+        self.book_handlers: list[Callable[[set[str]], None]] = []
+
+    def add_handler(self, handler: Callable[[dict], None]):
+        """
+        Registers a handler called with every market channel message
+        """
+        self.handlers.append(handler)
+
+    def add_book_handler(self, handler: Callable[[set[str]], None]):
+        """
+        Registers a handler called with the asset ids whose book changed
+        """
+        self.book_handlers.append(handler)
+
+    def reset(self):
+        self.books = LocalOrderBooks()
+        self.now_ms = None
+
+    def run(self, start_ts: int = None, end_ts: int = None) -> ReplayStats:
+        """
+        Replays the recorded messages within [start_ts, end_ts]
+        """
+        stats = ReplayStats()
+        apply_message = self.books.apply_message
+        handlers = self.handlers
+        book_handlers = self.book_handlers
+        speed = self.speed
+
+        started = time.perf_counter()
+        for ts, msg in self.reader.iter_records(start_ts, end_ts):
+            if stats.first_ts is None:
+                stats.first_ts = ts
+            elif speed is not None:
+                delay = (ts - stats.first_ts) / 1000 / speed - (
+                    time.perf_counter() - started
+                )
+                if delay > 0:
+                    time.sleep(delay)
+
+            self.now_ms = ts
+            changed = apply_message(msg)
+            for handler in handlers:
+                handler(msg)
+            if changed:
+                for handler in book_handlers:
+                    handler(changed)
+
+            stats.events += 1
+            stats.last_ts = ts
+
+        stats.elapsed = time.perf_counter() - started
+        return stats
+
+    def benchmark(self, start_ts: int = None, end_ts: int = None) -> ReplayStats:
+        """
+        Replays the logs at full speed on fresh books and reports events per second
+
+        Handlers stay registered, so the result includes their cost.
+        """
+        speed = self.speed
+        self.speed = None
+        self.reset()
+        try:
+            return self.run(start_ts, end_ts)
+        finally:
+            self.speed = speed
+
+    def client(self) -> "ReplayClient":
+        return ReplayClient(self)
+
+
+def _format_price(value: Optional[float]) -> Optional[str]:
+    return None if value is None else str(round(value, 6))
+
+
+class ReplayClient:
+    """
+    Read-only stand-in for ClobClient's market data methods, served from a replay
+
+    Return values follow the shapes of the live endpoints, so strategies that
+    only read market data can be backtested against a ReplayEngine unchanged.
+    """
+
+    def __init__(self, engine: ReplayEngine):
+        self.engine = engine
+
+    def _book(self, token_id: str) -> LocalOrderBook:
+        book = self.engine.books.get(token_id)
+        if book is None:
+            raise Exception("no orderbook")
+        return book
+
+    def _depth(self, token_id: str) -> OrderBookDepth:
+        return self._book(token_id).depth()
+
+    def get_server_time(self):
+        return self.engine.now_ms // 1000 if self.engine.now_ms is not None else None
+
+    def get_order_book(self, token_id) -> OrderBookSummary:
+        return self._book(token_id).to_summary()
+
+    def get_order_book_depth(self, token_id) -> OrderBookDepth:
+        return self._depth(token_id)
+
+    def get_order_books(self, params: list[BookParams]) -> list[OrderBookSummary]:
+        return [
+            self.get_order_book(p.token_id)
+            for p in params
+            if p.token_id in self.engine.books
+        ]
+
+    def get_raw_order_books(self, params: list[BookParams]) -> list[dict]:
+        return [
+            self._book(p.token_id).to_raw()
+            for p in params
+            if p.token_id in self.engine.books
+        ]
+
+    def get_midpoint(self, token_id):
+        return {"mid": _format_price(self._depth(token_id).midpoint())}
+
+    def get_midpoints(self, params: list[BookParams]):
+        return {
+            p.token_id: _format_price(self._depth(p.token_id).midpoint())
+            for p in params
+            if p.token_id in self.engine.books
+        }
+
+    def get_price(self, token_id, side):
+        """
+        Best price resting on the given side of the book
+        """
+        depth = self._depth(token_id)
+        if side == BUY:
+            return {"price": _format_price(depth.best_bid())}
+        if side == SELL:
+            return {"price": _format_price(depth.best_ask())}
+        raise ValueError(f"side must be '{BUY}' or '{SELL}'")
+
+    def get_prices(self, params: list[BookParams]):
+        prices = {}
+        for p in params:
+            if p.token_id in self.engine.books:
+                prices.setdefault(p.token_id, {})[p.side] = self.get_price(
+                    p.token_id, p.side
+                )["price"]
+        return prices
+
+    def get_spread(self, token_id):
+        depth = self._depth(token_id)
+        bid, ask = depth.best_bid(), depth.best_ask()
+        spread = None if bid is None or ask is None else ask - bid
+        return {"spread": _format_price(spread)}
+
+    def get_spreads(self, params: list[BookParams]):
+        return {
+            p.token_id: self.get_spread(p.token_id)["spread"]
+            for p in params
+            if p.token_id in self.engine.books
+        }
+
+    def get_last_trade_price(self, token_id):
+        return {"price": self._book(token_id).last_trade_price}
+
+    def get_tick_size(self, token_id: str):
+        return self._book(token_id).tick_size
+
+    def get_neg_risk(self, token_id: str) -> bool:
+        return self._book(token_id).neg_risk
@@ -0,0 +1,17 @@
+from .cancel import BulkCancelResult, CancelCoalescer, bulk_cancel
+from .ladder import LadderDiff, LadderQuoter, LadderResult, diff_ladder
+from .store import OrderStore, TrackedOrder
+from .submission import OrderQueue
+
+__all__ = [
+    "BulkCancelResult",
+    "CancelCoalescer",
+    "LadderDiff",
+    "LadderQuoter",
+    "LadderResult",
+    "OrderQueue",
+    "OrderStore",
+    "TrackedOrder",
+    "bulk_cancel",
+    "diff_ladder",
+]
@@ -0,0 +1,178 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from ..clob_types import OpenOrderParams
+from ..http_helpers.batching import BATCH_WORKERS, chunked
+from ..http_helpers.microbatch import MICROBATCH_WINDOW, MicroBatcher
+from ..http_helpers.retry import RETRIES, call_with_retries
+from .store import OrderStore
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+# order ids accepted by a single cancel_orders call
+CANCEL_ORDERS_LIMIT = 3000
+
+# outcome of an id whose chunk failed after all retries
+CHUNK_FAILED = "chunk failed"
+# outcome of an id missing from both lists of its chunk's response
+UNANSWERED = "not in response"
+
+
+@dataclass
+class BulkCancelResult:
+    canceled: list[str] = field(default_factory=list)
+    not_canceled: dict[str, str] = field(default_factory=dict)
+    """
+    Reason per id, from the server, CHUNK_FAILED or UNANSWERED
+    """
+
+    errors: list[Exception] = field(default_factory=list)
+    """
+    Errors of the chunks that failed after all retries
+    """
+
+    still_live: list[str] = field(default_factory=list)
+    """
+    Ids not canceled that are still open on the server (all of them when not verified)
+    """
+
+    @property
+    def ok(self) -> bool:
+        return not self.still_live
+
+    def outcome(self, order_id: str) -> Optional[str]:
+        """
+        "canceled", the reason it was not, or None for an id that was not requested
+        """
+        if order_id in self.not_canceled:
+            return self.not_canceled[order_id]
+        if order_id in self.canceled:
+            return "canceled"
+        return None
+
+
+def bulk_cancel(
+    client: "ClobClient",
+    order_ids: Iterable[str],
+    chunk_size: int = CANCEL_ORDERS_LIMIT,
+    max_workers: int = BATCH_WORKERS,
+    retries: int = RETRIES,
+    verify: bool = True,
+    store: OrderStore = None,
+) -> BulkCancelResult:
+    """
+    Cancels any number of orders through concurrent cancel_orders calls
+
+    The ids are split into chunks of the server batch limit which are sent
+    in parallel. A failed chunk is retried on its own (see
+    call_with_retries), a chunk failing for good marks its ids CHUNK_FAILED
+    instead of failing the others. With `verify`, the ids that were not
+    confirmed canceled are checked against the open orders so still_live
+    only lists orders that really remain on the book. Confirmed cancels are
+    applied to `store` when given.
+    """
+    order_ids = list(dict.fromkeys(order_ids))
+    result = BulkCancelResult()
+    if not order_ids:
+        return result
+
+    def cancel_chunk(chunk: list[str]):
+        try:
+            return call_with_retries(client.cancel_orders, chunk, retries=retries)
+        except Exception as exc:
+            return exc
+
+    chunks = chunked(order_ids, chunk_size)
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(chunks))) as executor:
+        responses = list(executor.map(cancel_chunk, chunks))
+
+    for chunk, response in zip(chunks, responses):
+        if isinstance(response, Exception):
+            result.errors.append(response)
+            result.not_canceled.update((i, CHUNK_FAILED) for i in chunk)
+            continue
+        canceled = response.get("canceled") or []
+        result.canceled.extend(canceled)
+        result.not_canceled.update(response.get("not_canceled") or {})
+        # ids the server left out of both lists are unaccounted for
+        answered = set(canceled) | set(result.not_canceled)
+        result.not_canceled.update((i, UNANSWERED) for i in chunk if i not in answered)
+
+    if store is not None:
+        store.apply_cancel(result.canceled)
+
+    unconfirmed = [i for i in order_ids if i in result.not_canceled]
+    if unconfirmed and verify:
+        result.still_live = still_open(client, unconfirmed)
+    else:
+        result.still_live = unconfirmed
+    return result
+
+
+def still_open(
+    client: "ClobClient", order_ids: list[str], params: OpenOrderParams = None
+) -> list[str]:
+    """
+    The ids among `order_ids` that are open orders on the server
+    """
+    open_ids = {order["id"] for order in client.get_orders(params)}
+    return [i for i in order_ids if i in open_ids]
+
+
+def cancel_response_for(order_id: str, response: dict) -> dict:
+    """
+    The part of a cancel_orders response about one id, shaped like a cancel() response
+    """
+    not_canceled = response.get("not_canceled") or {}
+    if order_id in not_canceled:
+        return {"canceled": [], "not_canceled": {order_id: not_canceled[order_id]}}
+    if order_id in (response.get("canceled") or ()):
+        return {"canceled": [order_id], "not_canceled": {}}
+    return {"canceled": [], "not_canceled": {order_id: UNANSWERED}}
+
+
+class CancelCoalescer:
+    """
+    Merges cancel calls made from many threads into cancel_orders requests
+
+    cancel() returns a future. Cancels made within `window` seconds of the
+    first pending one are sent as one cancel_orders call (at most
+    `max_batch` ids per call), so a burst pays one round trip and one
+    signature instead of one per order. Each future resolves to the
+    cancel()-shaped part of the response about its own id. Cancels are
+    applied to `store` when given.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        window: float = MICROBATCH_WINDOW,
+        max_batch: int = CANCEL_ORDERS_LIMIT,
+        store: OrderStore = None,
+    ):
+        self.client = client
+        self.store = store
+        self._batcher = MicroBatcher(self._flush, window, max_batch)
+
+    def cancel(self, order_id: str) -> Future:
+        return self._batcher.submit(order_id)
+
+    def _flush(self, order_ids: list[str]) -> list[dict]:
+        response = self.client.cancel_orders(list(dict.fromkeys(order_ids)))
+        if self.store is not None:
+            self.store.apply_cancel_response(response)
+        return [cancel_response_for(i, response) for i in order_ids]
+
+    def close(self):
+        """
+        Sends the pending cancels and stops accepting new ones
+        """
+        self._batcher.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
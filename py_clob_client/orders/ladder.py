@@ -0,0 +1,225 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from ..clob_types import OrderArgs, OrderType, PartialCreateOrderOptions, PostOrdersArgs
+from ..order_builder.constants import BUY, SELL
+from .store import OrderStore, TrackedOrder, price_key
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+# orders accepted by a single post_orders call
+POST_ORDERS_LIMIT = 15
+
+SIZE_DECIMALS = 2
+
+
+@dataclass
+class LadderDiff:
+    token_id: str
+    cancels: list[TrackedOrder] = field(default_factory=list)
+    creates: list[OrderArgs] = field(default_factory=list)
+    kept: list[TrackedOrder] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return not self.cancels and not self.creates
+
+    @property
+    def crosses(self) -> bool:
+        """
+        Whether a new order would trade against an order that is only being cancelled
+        """
+        return any(crosses(args, self.cancels) for args in self.creates)
+
+
+def crosses(args: OrderArgs, orders: list[TrackedOrder]) -> bool:
+    """
+    Whether the new order would trade against one of `orders`
+    """
+    price = price_key(args.price)
+    if args.side == BUY:
+        return any(o.side == SELL and price >= o.price for o in orders)
+    return any(o.side == BUY and price <= o.price for o in orders)
+
+
+@dataclass
+class LadderResult:
+    diff: LadderDiff
+    cancel_response: dict = None
+    post_responses: list = field(default_factory=list)
+    cancel_error: Exception = None
+    post_error: Exception = None
+    skipped: list[OrderArgs] = field(default_factory=list)
+    """
+    Creates not posted because they would cross an order whose cancel was not confirmed
+    """
+
+    @property
+    def ok(self) -> bool:
+        return self.cancel_error is None and self.post_error is None
+
+
+def diff_ladder(
+    token_id: str,
+    desired: dict[str, dict],
+    open_orders: list[TrackedOrder],
+    min_size: float = 0.0,
+) -> LadderDiff:
+    """
+    Minimal cancels and creates turning the open orders into the desired ladder
+
+    `desired` maps a side to {price: size}. A level already holding the
+    desired size is left alone. A level holding less gets an order for the
+    difference, its resting orders keep their queue position. A level
+    holding more keeps its oldest orders that fit in the desired size and
+    cancels the newer ones, topping up the rest. Levels missing from
+    `desired` are cancelled. Top-ups smaller than `min_size` are skipped.
+    """
+    diff = LadderDiff(token_id)
+
+    current: dict[tuple[str, float], list[TrackedOrder]] = {}
+    for order in open_orders:
+        if order.token_id == token_id and order.is_open:
+            current.setdefault((order.side, order.price), []).append(order)
+
+    wanted: dict[tuple[str, float], float] = {}
+    for side, levels in desired.items():
+        for price, size in levels.items():
+            if float(size) > 0:
+                wanted[(side, price_key(price))] = float(size)
+
+    for level, orders in current.items():
+        if level not in wanted:
+            diff.cancels.extend(orders)
+
+    for (side, price), size in wanted.items():
+        orders = sorted(current.get((side, price), ()), key=lambda o: o.recorded_at)
+        resting = 0.0
+        for order in orders:
+            if resting + order.remaining <= size + 10**-SIZE_DECIMALS / 2:
+                resting += order.remaining
+                diff.kept.append(order)
+            else:
+                diff.cancels.append(order)
+
+        missing = round(size - resting, SIZE_DECIMALS)
+        if missing > 0 and missing >= min_size:
+            diff.creates.append(
+                OrderArgs(token_id=token_id, price=price, size=missing, side=side)
+            )
+    return diff
+
+
+class LadderQuoter:
+    """
+    Requotes a token's ladder with the fewest order changes
+
+    Each requote diffs the desired ladder against the open orders in the
+    OrderStore, then sends the cancels through one cancel_orders call while
+    the new orders are signed and posted through post_orders batches, so
+    both legs overlap instead of running back to back. When a new order
+    would cross an order still being cancelled, posting waits for the
+    cancel, and creates crossing an order whose cancel failed or was not
+    confirmed are skipped. Responses are applied to the store.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        store: OrderStore,
+        order_type: OrderType = OrderType.GTC,
+        post_only: bool = False,
+        options: PartialCreateOrderOptions = None,
+        min_size: float = 0.0,
+        batch_size: int = POST_ORDERS_LIMIT,
+    ):
+        self.client = client
+        self.store = store
+        self.order_type = order_type
+        self.post_only = post_only
+        self.options = options
+        self.min_size = min_size
+        self.batch_size = batch_size
+        self._executor = ThreadPoolExecutor(max_workers=2)
+
+    def diff(self, token_id: str, desired: dict[str, dict]) -> LadderDiff:
+        return diff_ladder(
+            token_id,
+            desired,
+            self.store.open_orders(token_id),
+            min_size=self.min_size,
+        )
+
+    def requote(self, token_id: str, desired: dict[str, dict]) -> LadderResult:
+        """
+        Moves the token's open orders to the desired ladder, {side: {price: size}}
+        """
+        diff = self.diff(token_id, desired)
+        result = LadderResult(diff)
+        if diff.empty:
+            return result
+
+        cancel_future = None
+        if diff.cancels:
+            cancel_future = self._executor.submit(
+                self.client.cancel_orders, [o.id for o in diff.cancels]
+            )
+        creates = diff.creates
+        if creates and cancel_future is not None and diff.crosses:
+            self._wait_cancel(cancel_future, result)
+            cancel_future = None
+            # posting against a cancel that failed would trade with ourselves
+            live = self._unconfirmed(diff.cancels, result)
+            result.skipped = [a for a in creates if crosses(a, live)]
+            creates = [a for a in creates if not crosses(a, live)]
+        if creates:
+            self._post(creates, result)
+        if cancel_future is not None:
+            self._wait_cancel(cancel_future, result)
+        return result
+
+    def _wait_cancel(self, future, result: LadderResult):
+        try:
+            result.cancel_response = future.result()
+        except Exception as exc:
+            result.cancel_error = exc
+            return
+        self.store.apply_cancel_response(result.cancel_response)
+
+    @staticmethod
+    def _unconfirmed(
+        cancels: list[TrackedOrder], result: LadderResult
+    ) -> list[TrackedOrder]:
+        if result.cancel_error is not None:
+            return cancels
+        canceled = set(result.cancel_response.get("canceled") or ())
+        return [o for o in cancels if o.id not in canceled]
+
+    def _post(self, creates: list[OrderArgs], result: LadderResult):
+        try:
+            args = [
+                PostOrdersArgs(
+                    order=self.client.create_order(order_args, self.options),
+                    orderType=self.order_type,
+                    postOnly=self.post_only,
+                )
+                for order_args in creates
+            ]
+            for start in range(0, len(args), self.batch_size):
+                batch = args[start : start + self.batch_size]
+                responses = self.client.post_orders(batch) or []
+                self.store.record_posts(batch, responses)
+                result.post_responses.extend(responses)
+        except Exception as exc:
+            result.post_error = exc
+
+    def close(self):
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,347 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Iterable, Optional, TYPE_CHECKING
+
+from ..clob_types import OpenOrderParams, OrderType, PostOrdersArgs
+from ..order_builder.constants import BUY
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+LIVE = "LIVE"
+MATCHED = "MATCHED"
+CANCELED = "CANCELED"
+
+# user channel order event types
+PLACEMENT = "PLACEMENT"
+UPDATE = "UPDATE"
+CANCELLATION = "CANCELLATION"
+
+AMOUNT_DECIMALS = 6
+PRICE_DECIMALS = 6
+
+
+def price_key(price) -> float:
+    """
+    Normalised price used to index orders, so "0.53", 0.53 and 0.530000001 match
+    """
+    return round(float(price), PRICE_DECIMALS)
+
+
+@dataclass
+class TrackedOrder:
+    id: str
+    token_id: str
+    side: str
+    price: float
+    original_size: float
+    size_matched: float = 0.0
+    status: str = LIVE
+    market: str = None
+    order_type: str = None
+    recorded_at: float = field(default_factory=time.time)
+    """
+    Local time the order entered the store
+    """
+
+    @property
+    def remaining(self) -> float:
+        return max(0.0, self.original_size - self.size_matched)
+
+    @property
+    def is_open(self) -> bool:
+        return self.status == LIVE and self.remaining > 0
+
+
+def _order_from_signed(signed_order, order_id: str, order_type=None) -> TrackedOrder:
+    order = signed_order.dict()
+    maker_amount = int(order["makerAmount"]) / 10**AMOUNT_DECIMALS
+    taker_amount = int(order["takerAmount"]) / 10**AMOUNT_DECIMALS
+    side = order["side"]
+    if side == BUY:
+        price, size = maker_amount / taker_amount, taker_amount
+    else:
+        price, size = taker_amount / maker_amount, maker_amount
+    return TrackedOrder(
+        id=order_id,
+        token_id=order["tokenId"],
+        side=side,
+        price=price_key(price),
+        original_size=size,
+        order_type=order_type,
+    )
+
+
+def _order_from_record(record: dict) -> TrackedOrder:
+    """
+    From an open order as returned by get_orders or sent in a user channel order event
+    """
+    return TrackedOrder(
+        id=record["id"],
+        token_id=record["asset_id"],
+        side=record["side"].upper(),
+        price=price_key(record["price"]),
+        original_size=float(record["original_size"]),
+        size_matched=float(record.get("size_matched") or 0),
+        status=(record.get("status") or LIVE).upper(),
+        market=record.get("market"),
+        order_type=record.get("order_type"),
+    )
+
+
+def _matched_size(order: TrackedOrder, response: dict) -> Optional[float]:
+    """
+    Size matched on placement, from the response's making / taking amounts
+
+    A buy takes the tokens, a sell makes them. Returns None when the amount
+    is missing or not a plausible token size, the order then stays open
+    until a user channel event or reconcile() corrects it.
+    """
+    key = "takingAmount" if order.side == BUY else "makingAmount"
+    try:
+        size = float(response.get(key))
+    except (TypeError, ValueError):
+        return None
+    if size <= 0 or size > order.original_size + 10**-AMOUNT_DECIMALS:
+        return None
+    return min(size, order.original_size)
+
+
+class OrderStore:
+    """
+    Local view of the account's open orders, indexed for lookups without network calls
+
+    Orders enter from post_order / post_orders responses (record_post,
+    record_posts), fills and cancels are applied from the user channel
+    (apply_event) or cancel responses (apply_cancel_response), and
+    reconcile() realigns everything with a get_orders snapshot. Open
+    orders are indexed by token, by (token, side) and by (token, side,
+    price) so orders_at() and size_at() are dict lookups and open_orders()
+    and levels() only visit the orders of the token and side asked for.
+    """
+
+    def __init__(self):
+        self.orders: dict[str, TrackedOrder] = {}
+        self._by_level: dict[tuple[str, str, float], dict[str, TrackedOrder]] = {}
+        self._by_side: dict[tuple[str, str], dict[str, TrackedOrder]] = {}
+        self._by_token: dict[str, dict[str, TrackedOrder]] = {}
+        self._lock = threading.RLock()
+
+    def _index(self, order: TrackedOrder):
+        level = (order.token_id, order.side, order.price)
+        self._by_level.setdefault(level, {})[order.id] = order
+        self._by_side.setdefault(level[:2], {})[order.id] = order
+        self._by_token.setdefault(order.token_id, {})[order.id] = order
+
+    def _unindex(self, order: TrackedOrder):
+        level = (order.token_id, order.side, order.price)
+        orders = self._by_level.get(level)
+        if orders is not None:
+            orders.pop(order.id, None)
+            if not orders:
+                del self._by_level[level]
+        orders = self._by_side.get(level[:2])
+        if orders is not None:
+            orders.pop(order.id, None)
+            if not orders:
+                del self._by_side[level[:2]]
+        orders = self._by_token.get(order.token_id)
+        if orders is not None:
+            orders.pop(order.id, None)
+            if not orders:
+                del self._by_token[order.token_id]
+
+    def _put(self, order: TrackedOrder):
+        previous = self.orders.get(order.id)
+        if previous is not None:
+            self._unindex(previous)
+            order.recorded_at = previous.recorded_at
+        self.orders[order.id] = order
+        if order.is_open:
+            self._index(order)
+
+    def _update(
+        self, order: TrackedOrder, size_matched: float = None, status: str = None
+    ):
+        self._unindex(order)
+        if size_matched is not None:
+            order.size_matched = max(order.size_matched, size_matched)
+        if status is not None:
+            order.status = status
+        if order.is_open:
+            self._index(order)
+
+    def add(self, order: TrackedOrder):
+        with self._lock:
+            self._put(order)
+
+    def record_post(
+        self, signed_order, response: dict, order_type=None
+    ) -> Optional[TrackedOrder]:
+        """
+        Records an order from its post_order response, returns None if it was rejected
+        """
+        if (
+            not response
+            or not response.get("success", True)
+            or not response.get("orderID")
+        ):
+            return None
+
+        order = _order_from_signed(signed_order, response["orderID"], order_type)
+        matched = (response.get("status") or "").upper() == MATCHED
+        size_matched = _matched_size(order, response)
+        if order_type in (OrderType.FOK, OrderType.FAK):
+            # the unmatched rest of an immediate order never rests on the book
+            if matched:
+                order.size_matched = (
+                    size_matched if size_matched is not None else order.original_size
+                )
+                order.status = MATCHED
+            else:
+                order.status = CANCELED
+        elif matched and size_matched is not None:
+            # a marketable GTC / GTD order may rest its unmatched part
+            order.size_matched = size_matched
+            if order.remaining <= 0:
+                order.status = MATCHED
+        with self._lock:
+            self._put(order)
+        return order
+
+    def record_posts(
+        self, args: list[PostOrdersArgs], responses: list[dict]
+    ) -> list[Optional[TrackedOrder]]:
+        """
+        Records the orders of a post_orders call, responses are in the order of `args`
+        """
+        return [
+            self.record_post(arg.order, response, arg.orderType)
+            for arg, response in zip(args, responses)
+        ]
+
+    def apply_cancel(self, order_ids: Iterable[str]):
+        with self._lock:
+            for order_id in order_ids:
+                order = self.orders.get(order_id)
+                if order is not None:
+                    self._update(order, status=CANCELED)
+
+    def apply_cancel_response(self, response: dict):
+        """
+        Applies a cancel / cancel_orders / cancel_all response
+        """
+        self.apply_cancel(response.get("canceled") or ())
+
+    def apply_event(self, event: dict):
+        """
+        Applies a user channel order event (placement, fill update or cancellation)
+        """
+        if event.get("event_type", "order") != "order":
+            return
+
+        with self._lock:
+            order = self.orders.get(event["id"])
+            event_type = (event.get("type") or "").upper()
+            if order is None:
+                if event_type == CANCELLATION:
+                    return
+                self._put(_order_from_record(event))
+                return
+
+            size_matched = event.get("size_matched")
+            self._update(
+                order,
+                size_matched=float(size_matched) if size_matched is not None else None,
+                status=CANCELED if event_type == CANCELLATION else None,
+            )
+
+    def reconcile(self, open_orders: list[dict], as_of: float = None):
+        """
+        Makes the store match a get_orders snapshot
+
+        Orders missing from the snapshot are closed, except those recorded
+        after `as_of` (the local time the snapshot was requested), which the
+        snapshot may simply predate.
+        """
+        seen = set()
+        with self._lock:
+            for record in open_orders:
+                seen.add(record["id"])
+                order = self.orders.get(record["id"])
+                if order is None:
+                    self._put(_order_from_record(record))
+                else:
+                    self._update(
+                        order,
+                        size_matched=float(record.get("size_matched") or 0),
+                        status=(record.get("status") or LIVE).upper(),
+                    )
+
+            for order in list(self._iter_open()):
+                if order.id in seen:
+                    continue
+                if as_of is not None and order.recorded_at > as_of:
+                    continue
+                status = MATCHED if order.remaining <= 0 else CANCELED
+                self._update(order, status=status)
+
+    def sync(self, client: "ClobClient", params: OpenOrderParams = None):
+        """
+        Reconciles with the open orders currently on the server
+        """
+        as_of = time.time()
+        self.reconcile(client.get_orders(params), as_of)
+
+    def prune(self, older_than: float = 0.0):
+        """
+        Forgets closed orders recorded more than `older_than` seconds ago
+        """
+        cutoff = time.time() - older_than
+        with self._lock:
+            for order_id in [
+                o.id
+                for o in self.orders.values()
+                if not o.is_open and o.recorded_at <= cutoff
+            ]:
+                del self.orders[order_id]
+
+    def _iter_open(self):
+        for orders in self._by_token.values():
+            yield from orders.values()
+
+    def get(self, order_id: str) -> Optional[TrackedOrder]:
+        return self.orders.get(order_id)
+
+    def orders_at(self, token_id: str, side: str, price) -> list[TrackedOrder]:
+        """
+        Open orders resting at exactly `price`
+        """
+        orders = self._by_level.get((token_id, side, price_key(price)))
+        return list(orders.values()) if orders else []
+
+    def size_at(self, token_id: str, side: str, price) -> float:
+        orders = self._by_level.get((token_id, side, price_key(price)))
+        return sum(o.remaining for o in orders.values()) if orders else 0.0
+
+    def open_orders(self, token_id: str = None, side: str = None) -> list[TrackedOrder]:
+        with self._lock:
+            if token_id is None:
+                orders = list(self._iter_open())
+                if side is not None:
+                    orders = [o for o in orders if o.side == side]
+                return orders
+            if side is None:
+                return list(self._by_token.get(token_id, {}).values())
+            return list(self._by_side.get((token_id, side), {}).values())
+
+    def levels(self, token_id: str, side: str) -> dict[float, float]:
+        """
+        Remaining open size per price for the token and side
+        """
+        levels = {}
+        with self._lock:
+            for order in self._by_side.get((token_id, side), {}).values():
+                levels[order.price] = levels.get(order.price, 0.0) + order.remaining
+        return levels
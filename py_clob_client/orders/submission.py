@@ -0,0 +1,229 @@
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, TYPE_CHECKING
+
+from ..clob_types import OrderType, PostOrdersArgs
+from ..exceptions import PolyApiException
+from ..http_helpers.microbatch import MICROBATCH_WINDOW
+from .cancel import CANCEL_ORDERS_LIMIT, cancel_response_for
+from .ladder import POST_ORDERS_LIMIT
+from .store import OrderStore
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+MAX_PENDING_ORDERS = 1000
+
+
+class OrderQueue:
+    """
+    Gathers orders submitted from many threads into post_orders batches
+
+    submit() returns a future resolving to the order's own entry of the
+    post_orders response. Orders submitted within `window` seconds of the
+    first pending one are posted together, at most `max_batch` per request.
+    cancel() returns a future resolving to a cancel()-shaped response;
+    pending cancels end the window and are sent as one cancel_orders call
+    on their own `cancel_workers` threads, so they never wait behind post
+    batches already in flight. Orders gathered in the same window as
+    cancels are posted once the cancel call returns.
+
+    At most `max_pending` orders may be queued or in flight. Past that,
+    submit() blocks until earlier orders resolve, or raises queue.Full
+    when `block` is false or `timeout` expires. Cancels are never held
+    back. Responses are applied to `store` when given.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        window: float = MICROBATCH_WINDOW,
+        max_batch: int = POST_ORDERS_LIMIT,
+        max_pending: int = MAX_PENDING_ORDERS,
+        max_workers: int = 4,
+        store: OrderStore = None,
+        cancel_workers: int = 2,
+    ):
+        if window < 0:
+            raise ValueError("window must not be negative")
+
+        self.client = client
+        self.window = window
+        self.max_batch = max_batch
+        self.max_pending = max_pending
+        self.store = store
+
+        self._orders: deque[tuple[PostOrdersArgs, Future]] = deque()
+        self._cancels: deque[tuple[str, Future]] = deque()
+        lock = threading.Lock()
+        self._cond = threading.Condition(lock)
+        self._space = threading.Condition(lock)
+        self._unresolved = 0
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._cancel_executor = ThreadPoolExecutor(max_workers=cancel_workers)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        order,
+        order_type: OrderType = OrderType.GTC,
+        post_only: bool = False,
+        block: bool = True,
+        timeout: Optional[float] = None,
+    ) -> Future:
+        """
+        Queues a signed order for the next post_orders batch
+        """
+        if post_only and order_type not in (OrderType.GTC, OrderType.GTD):
+            raise Exception("post_only orders can only be of type GTC or GTD")
+
+        future = Future()
+        args = PostOrdersArgs(order=order, orderType=order_type, postOnly=post_only)
+        with self._cond:
+            self._check_open()
+            if self._unresolved >= self.max_pending:
+                if not block or not self._space.wait_for(
+                    lambda: self._unresolved < self.max_pending or self._closed,
+                    timeout,
+                ):
+                    raise queue.Full(
+                        "order queue holds {} orders".format(self._unresolved)
+                    )
+                self._check_open()
+            self._unresolved += 1
+            self._orders.append((args, future))
+            if len(self._orders) == 1 or len(self._orders) >= self.max_batch:
+                self._cond.notify()
+        future.add_done_callback(self._release)
+        return future
+
+    def cancel(self, order_id: str) -> Future:
+        """
+        Queues a cancel ahead of every pending order
+        """
+        future = Future()
+        with self._cond:
+            self._check_open()
+            self._cancels.append((order_id, future))
+            self._cond.notify()
+        return future
+
+    @property
+    def pending(self) -> int:
+        """
+        Orders queued or in flight
+        """
+        return self._unresolved
+
+    def _check_open(self):
+        if self._closed:
+            raise RuntimeError("cannot submit to a closed order queue")
+
+    def _release(self, _):
+        with self._cond:
+            self._unresolved -= 1
+            self._space.notify()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._orders and not self._cancels and not self._closed:
+                    self._cond.wait()
+                if not self._orders and not self._cancels:
+                    return
+
+                deadline = time.monotonic() + self.window
+                while (
+                    not self._closed
+                    and not self._cancels
+                    and len(self._orders) < self.max_batch
+                ):
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                cancels = [
+                    self._cancels.popleft()
+                    for _ in range(min(len(self._cancels), CANCEL_ORDERS_LIMIT))
+                ]
+                orders = [
+                    self._orders.popleft()
+                    for _ in range(min(len(self._orders), self.max_batch))
+                ]
+            sent = None
+            if cancels:
+                sent = self._cancel_executor.submit(self._send_cancels, cancels)
+            if orders:
+                self._executor.submit(self._send_orders, orders, sent)
+
+    def _send_cancels(self, batch: list[tuple[str, Future]]):
+        batch = [(i, f) for i, f in batch if f.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        order_ids = list(dict.fromkeys(i for i, _ in batch))
+        try:
+            response = self.client.cancel_orders(order_ids)
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        if self.store is not None:
+            self.store.apply_cancel_response(response)
+        for order_id, future in batch:
+            future.set_result(cancel_response_for(order_id, response))
+
+    def _send_orders(
+        self, batch: list[tuple[PostOrdersArgs, Future]], after: Future = None
+    ):
+        if after is not None:
+            # blocks until the cancels of the same window are answered
+            after.exception()
+        batch = [(a, f) for a, f in batch if f.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        args = [a for a, _ in batch]
+        try:
+            responses = self.client.post_orders(args) or []
+        except Exception as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+
+        if self.store is not None:
+            self.store.record_posts(args, responses)
+        for i, (_, future) in enumerate(batch):
+            if i < len(responses):
+                future.set_result(responses[i])
+            else:
+                future.set_exception(
+                    PolyApiException(error_msg="no response for the order")
+                )
+
+    def close(self, wait: bool = True):
+        """
+        Sends what is pending and stops accepting new orders and cancels
+        """
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify_all()
+            self._space.notify_all()
+        self._thread.join()
+        self._cancel_executor.shutdown(wait=wait)
+        self._executor.shutdown(wait=wait)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -11,7 +11,6 @@ from urllib.parse import urlencode
 from typing import Optional, Any, TYPE_CHECKING
 
 from ..clob_types import RequestArgs, OrderArgs, PartialCreateOrderOptions
-from ..headers.headers import create_level_2_headers
 from ..http_helpers.helpers import get, post, delete
 from ..order_builder.builder import ROUNDING_CONFIG
 from ..order_builder.helpers import round_normal, round_down
@@ -99,11 +98,7 @@ class RfqClient:
         if serialized_body is not None:
             request_args.serialized_body = serialized_body
 
-        return create_level_2_headers(
-            self._parent.signer,
-            self._parent.creds,
-            request_args,
-        )
+        return self._parent._l2_headers(request_args)
 
     def _build_url(self, endpoint: str) -> str:
         """Build full URL from endpoint."""
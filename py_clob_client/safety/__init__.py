@@ -0,0 +1,9 @@
+from .heartbeat import HeartbeatService, HeartbeatStats
+from .kill_switch import KillSwitch, KillSwitchResult
+
+__all__ = [
+    "HeartbeatService",
+    "HeartbeatStats",
+    "KillSwitch",
+    "KillSwitchResult",
+]
@@ -0,0 +1,164 @@
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional, TYPE_CHECKING
+
+import httpx
+
+from ..exceptions import PolyApiException
+from ..http_helpers.helpers import new_http_client
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+HEARTBEAT_DEADLINE = 10.0
+
+
+@dataclass
+class HeartbeatStats:
+    heartbeat_id: Optional[str] = None
+    sent: int = 0
+    failures: int = 0
+
+    last_latency: Optional[float] = None
+    """
+    Round trip of the last successful heartbeat, in seconds
+    """
+
+    last_slack: Optional[float] = None
+    """
+    Time that was left before the deadline when the last heartbeat was acknowledged
+    """
+
+    min_slack: Optional[float] = None
+
+
+class HeartbeatService:
+    """
+    Keeps the order heartbeat alive from a background thread
+
+    Heartbeats go out every `interval` seconds on a connection of their own,
+    so they never wait behind other traffic, chaining the heartbeat_id
+    returned by the server. Slack is measured conservatively as `deadline`
+    minus the time from sending the previous acknowledged heartbeat to
+    acknowledging the current one; pauses of the process (GC, a blocked
+    thread) show up in it. `on_slack(slack, stats)` is called whenever the
+    slack drops below `slack_threshold`, e.g. to alert or pull quotes.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        interval: float = 5.0,
+        deadline: float = HEARTBEAT_DEADLINE,
+        slack_threshold: float = 3.0,
+        on_slack: Callable[[float, HeartbeatStats], None] = None,
+        http_client: httpx.Client = None,
+    ):
+        if interval >= deadline:
+            raise ValueError("interval must be shorter than the deadline")
+
+        self.client = client
+        self.interval = interval
+        self.deadline = deadline
+        self.slack_threshold = slack_threshold
+        self.on_slack = on_slack
+        self.stats = HeartbeatStats()
+
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or new_http_client()
+        self._last_acked_sent_at: Optional[float] = None
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+    def beat(self) -> Optional[float]:
+        """
+        Sends one heartbeat and returns the slack it was acknowledged with
+        """
+        sent_at = time.monotonic()
+        try:
+            resp = self.client.post_heartbeat(
+                self.stats.heartbeat_id, http_client=self.http_client
+            )
+        except PolyApiException as e:
+            self.stats.failures += 1
+            # the server names the heartbeat id it expects when the chain broke
+            if isinstance(e.error_msg, dict) and e.error_msg.get("heartbeat_id"):
+                self.stats.heartbeat_id = e.error_msg["heartbeat_id"]
+            raise
+
+        acked_at = time.monotonic()
+        stats = self.stats
+        stats.sent += 1
+        stats.heartbeat_id = resp.get("heartbeat_id", stats.heartbeat_id)
+        stats.last_latency = acked_at - sent_at
+
+        slack = None
+        if self._last_acked_sent_at is not None:
+            slack = self.deadline - (acked_at - self._last_acked_sent_at)
+            stats.last_slack = slack
+            if stats.min_slack is None or slack < stats.min_slack:
+                stats.min_slack = slack
+        self._last_acked_sent_at = sent_at
+
+        if slack is not None and slack < self.slack_threshold:
+            self._notify(slack)
+        return slack
+
+    def _notify(self, slack: float):
+        if self.on_slack is None:
+            self.logger.warning("Heartbeat slack down to {:.3f}s".format(slack))
+            return
+        try:
+            self.on_slack(slack, self.stats)
+        except Exception as e:
+            self.logger.error("Heartbeat slack callback failed: {}".format(e))
+
+    def run(self):
+        """
+        Sends heartbeats until stop() is called, failed ones are retried at a fifth of the interval
+        """
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            wait = self.interval
+            try:
+                self.beat()
+            except Exception as e:
+                self.logger.error("Heartbeat failed: {}".format(e))
+                wait = self.interval / 5
+                if self._last_acked_sent_at is not None:
+                    slack = self.deadline - (
+                        time.monotonic() - self._last_acked_sent_at
+                    )
+                    if slack < self.slack_threshold:
+                        self._notify(slack)
+            self._stop_event.wait(max(0.0, wait - (time.monotonic() - started)))
+
+    def start(self):
+        if self._thread is not None:
+            return
+        if self._owns_http_client and self.http_client.is_closed:
+            self.http_client = new_http_client()
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """
+        Stops sending heartbeats, the server will cancel the orders once the deadline passes
+        """
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+        if self._owns_http_client:
+            self.http_client.close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
@@ -0,0 +1,220 @@
+import json
+import logging
+import signal
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, TYPE_CHECKING
+
+import httpx
+
+from ..endpoints import CANCEL_ALL, CANCEL_MARKET_ORDERS, TIME
+from ..headers.headers import (
+    POLY_ADDRESS,
+    POLY_API_KEY,
+    POLY_PASSPHRASE,
+    POLY_SIGNATURE,
+    POLY_TIMESTAMP,
+)
+from ..http_helpers.helpers import DELETE, delete, get, new_http_client
+
+if TYPE_CHECKING:
+    from ..client import ClobClient
+
+
+@dataclass
+class KillSwitchResult:
+    target: str
+    """
+    "all", or the market / asset id whose orders were cancelled
+    """
+
+    response: Any = None
+    error: Optional[Exception] = None
+
+    latency: float = None
+    """
+    Seconds from firing until the server answered
+    """
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _PreparedCancel:
+    target: str
+    url: str
+    request_path: str
+    body: Optional[str]
+
+
+class KillSwitch:
+    """
+    Cancels orders with as little work as possible once fired
+
+    Arming resolves everything that does not depend on the time: urls,
+    serialized bodies, the static auth headers, the pre-keyed HMAC signer
+    and a warm dedicated connection (kept alive by re-warming every
+    `keepalive` seconds). Firing only stamps and signs the prepared
+    requests before sending them. fire() cancels everything, fire_markets()
+    cancels the armed markets concurrently. Both can be called from any
+    thread, install_signal_handler() wires them to a signal.
+    """
+
+    def __init__(
+        self,
+        client: "ClobClient",
+        markets: Iterable[str] = (),
+        asset_ids: Iterable[str] = (),
+        keepalive: Optional[float] = 20.0,
+        http_client: httpx.Client = None,
+    ):
+        client.assert_level_2_auth()
+        self.client = client
+        self.keepalive = keepalive
+        self.history: list[KillSwitchResult] = []
+        self.logger = logging.getLogger(self.__class__.__name__)
+
+        self._owns_http_client = http_client is None
+        self.http_client = http_client or new_http_client()
+        self._signer = client.get_hmac_signer()
+        self._static_headers = {
+            POLY_ADDRESS: client.signer.address(),
+            POLY_API_KEY: client.creds.api_key,
+            POLY_PASSPHRASE: client.creds.api_passphrase,
+        }
+        self._all = self._prepare("all", CANCEL_ALL, None)
+        self._markets: list[_PreparedCancel] = []
+        self.arm_markets(markets, asset_ids)
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._executor = ThreadPoolExecutor(max_workers=8)
+        self._keepalive_thread: Optional[threading.Thread] = None
+        self.warm()
+        if keepalive is not None:
+            self._keepalive_thread = threading.Thread(
+                target=self._keep_warm, daemon=True
+            )
+            self._keepalive_thread.start()
+
+    def _prepare(self, target: str, request_path: str, body) -> _PreparedCancel:
+        serialized = (
+            json.dumps(body, separators=(",", ":"), ensure_ascii=False)
+            if body is not None
+            else None
+        )
+        return _PreparedCancel(
+            target,
+            "{}{}".format(self.client.host, request_path),
+            request_path,
+            serialized,
+        )
+
+    def arm_markets(self, markets: Iterable[str] = (), asset_ids: Iterable[str] = ()):
+        """
+        Replaces the markets (condition ids) and assets cancelled by fire_markets
+        """
+        prepared = [
+            self._prepare(
+                market, CANCEL_MARKET_ORDERS, {"market": market, "asset_id": ""}
+            )
+            for market in markets
+        ]
+        prepared += [
+            self._prepare(
+                asset_id, CANCEL_MARKET_ORDERS, {"market": "", "asset_id": asset_id}
+            )
+            for asset_id in asset_ids
+        ]
+        self._markets = prepared
+
+    def warm(self):
+        """
+        Opens (or refreshes) the dedicated connection with a cheap request
+        """
+        get("{}{}".format(self.client.host, TIME), http_client=self.http_client)
+
+    def _keep_warm(self):
+        while not self._stop_event.wait(self.keepalive):
+            try:
+                self.warm()
+            except Exception as e:
+                self.logger.warning("Kill switch keepalive failed: {}".format(e))
+
+    def _send(self, prepared: _PreparedCancel, started: float) -> KillSwitchResult:
+        timestamp = self.client._timestamp() or int(time.time())
+        headers = dict(self._static_headers)
+        headers[POLY_TIMESTAMP] = str(timestamp)
+        headers[POLY_SIGNATURE] = self._signer.sign(
+            timestamp, DELETE, prepared.request_path, prepared.body
+        )
+        result = KillSwitchResult(prepared.target)
+        try:
+            result.response = delete(
+                prepared.url,
+                headers=headers,
+                data=prepared.body,
+                http_client=self.http_client,
+            )
+        except Exception as e:
+            result.error = e
+        result.latency = time.perf_counter() - started
+        with self._lock:
+            self.history.append(result)
+        return result
+
+    def fire(self) -> KillSwitchResult:
+        """
+        Cancels all open orders of the account
+        """
+        return self._send(self._all, time.perf_counter())
+
+    def fire_markets(self) -> list[KillSwitchResult]:
+        """
+        Cancels the orders of every armed market concurrently
+        """
+        started = time.perf_counter()
+        futures = [
+            self._executor.submit(self._send, prepared, started)
+            for prepared in self._markets
+        ]
+        return [future.result() for future in futures]
+
+    def install_signal_handler(self, signum: int = None, markets: bool = False):
+        """
+        Fires on `signum` (SIGUSR1 by default), must be called from the main thread
+
+        The handler only starts a thread, the requests are sent from it so the
+        interrupted code is never blocked on the network. Returns the previous handler.
+        """
+        if signum is None:
+            signum = getattr(signal, "SIGUSR1", None)
+            if signum is None:
+                raise ValueError(
+                    "SIGUSR1 is not available on this platform, pass a signum"
+                )
+        target = self.fire_markets if markets else self.fire
+
+        def handler(signum, frame):
+            threading.Thread(target=target, daemon=True).start()
+
+        return signal.signal(signum, handler)
+
+    def close(self):
+        self._stop_event.set()
+        if self._keepalive_thread is not None:
+            self._keepalive_thread.join()
+            self._keepalive_thread = None
+        self._executor.shutdown(wait=True)
+        if self._owns_http_client:
+            self.http_client.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from poly_eip712_structs import make_domain
 from eth_utils import keccak
 from py_order_utils.utils import prepend_zx
@@ -10,6 +12,7 @@ CLOB_VERSION = "1"
 MSG_TO_SIGN = "This message attests that I control the given wallet"
 
 
+@lru_cache(maxsize=None)
 def get_clob_auth_domain(chain_id: int):
     return make_domain(name=CLOB_DOMAIN_NAME, version=CLOB_VERSION, chainId=chain_id)
 
@@ -3,20 +3,41 @@ import hashlib
 import base64
 
 
+class HmacSigner:
+    """
+    HMAC signer for one API secret, kept with the credentials it belongs to
+
+    The secret is decoded and the key schedule computed once, each signature
+    starts from a copy of the pre-keyed hmac and is fed the message parts
+    one at a time instead of building the concatenated message string.
+    """
+
+    def __init__(self, secret: str):
+        self._keyed = hmac.new(
+            base64.urlsafe_b64decode(secret), digestmod=hashlib.sha256
+        )
+
+    def sign(self, timestamp, method, requestPath, body=None) -> str:
+        h = self._keyed.copy()
+        h.update(str(timestamp).encode("utf-8"))
+        h.update(str(method).encode("utf-8"))
+        h.update(str(requestPath).encode("utf-8"))
+        if body:
+            # NOTE: Necessary to replace single quotes with double quotes
+            # to generate the same hmac message as go and typescript
+            body = body if isinstance(body, str) else str(body)
+            if "'" in body:
+                body = body.replace("'", '"')
+            h.update(body.encode("utf-8"))
+
+        # ensure base64 encoded
+        return (base64.urlsafe_b64encode(h.digest())).decode("utf-8")
+
+
 def build_hmac_signature(
     secret: str, timestamp: str, method: str, requestPath: str, body=None
 ):
     """
     Creates an HMAC signature by signing a payload with the secret
     """
-    base64_secret = base64.urlsafe_b64decode(secret)
-    message = str(timestamp) + str(method) + str(requestPath)
-    if body:
-        # NOTE: Necessary to replace single quotes with double quotes
-        # to generate the same hmac message as go and typescript
-        message += str(body).replace("'", '"')
-
-    h = hmac.new(base64_secret, bytes(message, "utf-8"), hashlib.sha256)
-
-    # ensure base64 encoded
-    return (base64.urlsafe_b64encode(h.digest())).decode("utf-8")
+    return HmacSigner(secret).sign(timestamp, method, requestPath, body)
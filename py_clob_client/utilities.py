@@ -1,5 +1,6 @@
 import hashlib
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from .clob_types import OrderBookSummary, OrderSummary, TickSize
 
@@ -29,6 +30,87 @@ def parse_raw_orderbook_summary(raw_obs: any) -> OrderBookSummary:
     return orderbookSummary
 
 
+# Matches json.dumps(..., ensure_ascii=False) for strings
+_encode_json_string = json.encoder.encode_basestring
+
+
+def _json_value(value) -> str:
+    if value.__class__ is str:
+        return _encode_json_string(value)
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _levels_json(levels: list[OrderSummary]) -> str:
+    return ",".join(
+        [
+            '{"price":%s,"size":%s}' % (_json_value(o.price), _json_value(o.size))
+            for o in levels or ()
+        ]
+    )
+
+
+def _raw_levels_json(levels: list[dict]) -> str:
+    return ",".join(
+        [
+            '{"price":%s,"size":%s}' % (_json_value(o["price"]), _json_value(o["size"]))
+            for o in levels or ()
+        ]
+    )
+
+
+def _orderbook_hash(
+    market,
+    asset_id,
+    timestamp,
+    bids,
+    asks,
+    min_order_size,
+    tick_size,
+    neg_risk,
+    last_trade_price,
+) -> str:
+    """
+    Streams the server's compact JSON payload into SHA1 without building it as a dict
+
+    Go server-side payload field order (struct order):
+    market, asset_id, timestamp, hash, bids, asks, min_order_size, tick_size, neg_risk, last_trade_price
+    `bids` and `asks` are the already serialized level lists, without brackets
+    """
+    h = hashlib.sha1()
+    h.update(
+        '{{"market":{},"asset_id":{},"timestamp":{},"hash":"","bids":['.format(
+            _json_value(market), _json_value(asset_id), _json_value(timestamp)
+        ).encode("utf-8")
+    )
+    h.update(bids.encode("utf-8"))
+    h.update(b'],"asks":[')
+    h.update(asks.encode("utf-8"))
+    tail = '],"min_order_size":{},"tick_size":{},"neg_risk":{},"last_trade_price":{}}}'
+    h.update(
+        tail.format(
+            _json_value(min_order_size),
+            _json_value(tick_size),
+            _json_value(neg_risk),
+            _json_value(last_trade_price),
+        ).encode("utf-8")
+    )
+    return h.hexdigest()
+
+
+def _orderbook_summary_hash(orderbook: OrderBookSummary) -> str:
+    return _orderbook_hash(
+        orderbook.market,
+        orderbook.asset_id,
+        orderbook.timestamp,
+        _levels_json(orderbook.bids),
+        _levels_json(orderbook.asks),
+        orderbook.min_order_size,
+        orderbook.tick_size,
+        orderbook.neg_risk,
+        orderbook.last_trade_price,
+    )
+
+
 def generate_orderbook_summary_hash(orderbook: OrderBookSummary) -> str:
     """
     Server-compatible orderbook hash.
@@ -36,28 +118,50 @@ def generate_orderbook_summary_hash(orderbook: OrderBookSummary) -> str:
     The server computes SHA1 over a compact JSON payload with a specific key order,
     and with the "hash" field set to an empty string while hashing.
     """
-
-    # Go server-side payload field order (struct order):
-    # market, asset_id, timestamp, hash, bids, asks, min_order_size, tick_size, neg_risk, last_trade_price
-    payload = {
-        "market": orderbook.market,
-        "asset_id": orderbook.asset_id,
-        "timestamp": orderbook.timestamp,
-        "hash": "",
-        "bids": [{"price": o.price, "size": o.size} for o in (orderbook.bids or [])],
-        "asks": [{"price": o.price, "size": o.size} for o in (orderbook.asks or [])],
-        "min_order_size": orderbook.min_order_size,
-        "tick_size": orderbook.tick_size,
-        "neg_risk": orderbook.neg_risk,
-        "last_trade_price": orderbook.last_trade_price,
-    }
-
-    serialized = json.dumps(payload, separators=(",", ":"), ensure_ascii=False)
-    h = hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+    h = _orderbook_summary_hash(orderbook)
     orderbook.hash = h
     return h
 
 
+def generate_raw_orderbook_hash(raw_obs: dict) -> str:
+    """
+    Server-compatible hash of a raw orderbook response, without parsing it first
+    """
+    return _orderbook_hash(
+        raw_obs.get("market"),
+        raw_obs.get("asset_id"),
+        raw_obs.get("timestamp"),
+        _raw_levels_json(raw_obs.get("bids")),
+        _raw_levels_json(raw_obs.get("asks")),
+        raw_obs.get("min_order_size"),
+        raw_obs.get("tick_size"),
+        raw_obs.get("neg_risk"),
+        raw_obs.get("last_trade_price"),
+    )
+
+
+def verify_orderbook_summary_hash(orderbook: OrderBookSummary) -> bool:
+    """
+    Checks the hash the server sent with the orderbook, leaving the orderbook untouched
+    """
+    return bool(orderbook.hash) and orderbook.hash == _orderbook_summary_hash(orderbook)
+
+
+def verify_orderbook_summary_hashes(
+    orderbooks: list[OrderBookSummary], max_workers: int = None
+) -> list[bool]:
+    """
+    Verifies the hashes of many orderbooks across a thread pool, results in input order
+
+    hashlib releases the GIL while hashing large payloads, so big books verify in parallel
+    """
+    if len(orderbooks) < 2 or max_workers == 1:
+        return [verify_orderbook_summary_hash(o) for o in orderbooks]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(verify_orderbook_summary_hash, orderbooks))
+
+
 def order_to_json(order, owner, orderType, post_only: bool = False) -> dict:
     return {"order": order.dict(), "owner": owner, "orderType": orderType, "postOnly": post_only}
 
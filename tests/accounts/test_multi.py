@@ -0,0 +1,124 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.accounts import AccountConfig, MultiAccountClient
+from py_clob_client.clob_types import ApiCreds
+from py_clob_client.constants import AMOY
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.headers.headers import POLY_ADDRESS
+
+# publicly known private keys
+KEYS = {
+    "a": "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+    "b": "0x59c6995e998f97a5a0044966f0945389dc9e86dae88c7a8412f4603b6b78690d",
+}
+
+
+def creds(name):
+    return ApiCreds(
+        api_key=f"key-{name}",
+        api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+        api_passphrase="passphrase",
+    )
+
+
+class TestMultiAccountClient(TestCase):
+    def setUp(self):
+        self.manager = MultiAccountClient(
+            "http://localhost",
+            AMOY,
+            [
+                AccountConfig("a", KEYS["a"], creds("a")),
+                AccountConfig("b", KEYS["b"], creds("b"), rate=5, burst=2),
+            ],
+            rate=10,
+        )
+
+    def tearDown(self):
+        self.manager.close()
+
+    def test_accounts_have_their_own_signer_creds_and_limiter(self):
+        a, b = self.manager.client("a"), self.manager.client("b")
+        self.assertNotEqual(a.get_address(), b.get_address())
+        self.assertEqual(a.creds.api_key, "key-a")
+        self.assertIsNot(a.rate_limiter, b.rate_limiter)
+        self.assertEqual(a.rate_limiter.rate, 10)
+        self.assertEqual((b.rate_limiter.rate, b.rate_limiter.burst), (5, 2))
+        self.assertEqual(self.manager.names(), ["a", "b"])
+
+        with self.assertRaises(ValueError):
+            self.manager.add_account(AccountConfig("a", KEYS["a"]))
+
+    @patch("py_clob_client.client.get")
+    def test_market_metadata_is_shared(self, get):
+        get.return_value = {"minimum_tick_size": 0.01, "neg_risk": True}
+        self.assertEqual(self.manager.client("a").get_tick_size("t1"), "0.01")
+        self.assertEqual(self.manager.client("b").get_tick_size("t1"), "0.01")
+        self.assertTrue(self.manager.client("b").get_neg_risk("t1"))
+        self.assertTrue(self.manager.client("a").get_neg_risk("t1"))
+        self.assertEqual(get.call_count, 2)
+
+    @patch("py_clob_client.client.delete")
+    def test_cancel_all_reports_per_account(self, delete):
+        threads = set()
+        failing = self.manager.client("b").get_address()
+
+        def fake_delete(url, headers=None, data=None):
+            threads.add(threading.get_ident())
+            if headers[POLY_ADDRESS] == failing:
+                raise PolyApiException(error_msg="down")
+            return {"canceled": ["o1"], "not_canceled": {}}
+
+        delete.side_effect = fake_delete
+        results = self.manager.cancel_all()
+
+        self.assertTrue(results["a"].ok)
+        self.assertEqual(results["a"].result["canceled"], ["o1"])
+        self.assertFalse(results["b"].ok)
+        self.assertIsInstance(results["b"].error, PolyApiException)
+        self.assertEqual(list(self.manager.cancel_all(names=["a"])), ["a"])
+
+    @patch("py_clob_client.client.get")
+    def test_get_orders_for_all_accounts(self, get):
+        def fake_get(url, headers=None, data=None):
+            return {
+                "data": [{"id": headers["POLY_API_KEY"]}],
+                "next_cursor": "LTE=",
+            }
+
+        get.side_effect = fake_get
+        results = self.manager.get_orders()
+        self.assertEqual(results["a"].result, [{"id": "key-a"}])
+        self.assertEqual(results["b"].result, [{"id": "key-b"}])
+
+    @patch("py_clob_client.client.delete")
+    @patch("py_clob_client.client.post")
+    def test_order_entry_and_cancels_use_the_account_limiter(self, post, delete):
+        delete.return_value = {"canceled": [], "not_canceled": {}}
+        post.return_value = []
+        limiters = {name: self.manager.client(name).rate_limiter for name in ("a", "b")}
+        acquired = []
+
+        def track(name):
+            acquire = limiters[name].acquire
+            return lambda tokens=1: acquired.append(name) or acquire(tokens)
+
+        with patch.object(limiters["a"], "acquire", track("a")), patch.object(
+            limiters["b"], "acquire", track("b")
+        ):
+            self.manager.cancel_all()
+            self.manager.fan_out(lambda client: client.cancel_orders(["o1"]))
+            self.manager.client("b").post_orders([])
+            self.manager.client("b").cancel_market_orders(market="m1")
+
+        self.assertEqual(sorted(acquired), ["a", "a", "b", "b", "b", "b"])
+
+    def test_unknown_names_get_an_error_result(self):
+        results = self.manager.fan_out(
+            lambda client: client.get_address(), names=["a", "missing"]
+        )
+        self.assertEqual(list(results), ["a", "missing"])
+        self.assertEqual(results["a"].result, self.manager.client("a").get_address())
+        self.assertFalse(results["missing"].ok)
+        self.assertIsInstance(results["missing"].error, KeyError)
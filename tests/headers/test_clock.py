@@ -0,0 +1,78 @@
+import threading
+import time
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, RequestArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.headers.clock import ServerClock
+from py_clob_client.headers.headers import POLY_TIMESTAMP
+
+
+class TestServerClock(TestCase):
+    def test_sync_uses_shortest_round_trip(self):
+        # (local send, server time, local receive) per sample
+        samples = iter([(100.0, 150, 100.8), (101.0, 151, 101.2), (102.0, 153, 102.6)])
+        clock_reads = []
+        server_times = []
+        for sent, server, received in samples:
+            clock_reads += [sent, received]
+            server_times.append(server)
+        reads = iter(clock_reads + [110.0])
+
+        clock = ServerClock(lambda: server_times.pop(0), samples=3)
+        with patch("py_clob_client.headers.clock.time.time", lambda: next(reads)):
+            offset = clock.sync()
+
+        self.assertAlmostEqual(offset, 151 + 0.5 - 101.1)
+        self.assertAlmostEqual(clock.round_trip, 0.2)
+        self.assertEqual(clock.synced_at, 110.0)
+
+        with patch("py_clob_client.headers.clock.time.time", lambda: 200.0):
+            self.assertAlmostEqual(clock.now(), 250.4)
+            self.assertEqual(clock.timestamp(), 250)
+
+    def test_background_refresh(self):
+        calls = []
+        synced = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            if len(calls) > 1:
+                synced.set()
+            return int(time.time()) + 60
+
+        clock = ServerClock(fetch, samples=1)
+        clock.start(interval=0.01)
+        try:
+            self.assertTrue(synced.wait(2))
+        finally:
+            clock.stop()
+        self.assertGreater(clock.timestamp(), int(time.time()) + 55)
+
+    def test_client_headers_use_the_synced_clock(self):
+        client = ClobClient(
+            "http://localhost",
+            chain_id=AMOY,
+            key="0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+            creds=ApiCreds(
+                api_key="k",
+                api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+                api_passphrase="p",
+            ),
+        )
+        request_args = RequestArgs(method="GET", request_path="/orders")
+        now = int(time.time())
+        self.assertLessEqual(
+            abs(int(client._l2_headers(request_args)[POLY_TIMESTAMP]) - now), 1
+        )
+
+        with patch.object(client, "get_server_time", return_value=now + 3600):
+            client.sync_clock()
+        self.assertLessEqual(
+            abs(int(client._l2_headers(request_args)[POLY_TIMESTAMP]) - now - 3600), 2
+        )
+        self.assertLessEqual(
+            abs(int(client._l1_headers()[POLY_TIMESTAMP]) - now - 3600), 2
+        )
@@ -1,5 +1,9 @@
 from datetime import datetime
+from dataclasses import replace
 from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.client import ClobClient
 from py_clob_client.clob_types import ApiCreds, RequestArgs
 from py_clob_client.constants import AMOY
 from py_clob_client.headers.headers import (
@@ -11,8 +15,10 @@ from py_clob_client.headers.headers import (
     POLY_TIMESTAMP,
     create_level_1_headers,
     create_level_2_headers,
+    L1HeaderCache,
 )
 from py_clob_client.signer import Signer
+from py_clob_client.signing.hmac import HmacSigner
 
 # publicly known private key
 private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
@@ -82,3 +88,74 @@ class TestHeaders(TestCase):
         )
         self.assertEqual(l2_headers[POLY_API_KEY], creds.api_key)
         self.assertEqual(l2_headers[POLY_PASSPHRASE], creds.api_passphrase)
+
+    def test_explicit_timestamp(self):
+        l1_headers = create_level_1_headers(signer, timestamp=1000)
+        self.assertEqual(l1_headers[POLY_TIMESTAMP], "1000")
+
+        request_args = RequestArgs(method="GET", request_path="/order")
+        l2_headers = create_level_2_headers(signer, creds, request_args, 1000)
+        self.assertEqual(l2_headers[POLY_TIMESTAMP], "1000")
+        self.assertNotEqual(
+            l2_headers[POLY_SIGNATURE],
+            create_level_2_headers(signer, creds, request_args, 1001)[POLY_SIGNATURE],
+        )
+
+    def test_level_2_headers_with_a_kept_hmac_signer(self):
+        request_args = RequestArgs(method="GET", request_path="/order")
+        self.assertEqual(
+            create_level_2_headers(
+                signer, creds, request_args, 1000, HmacSigner(creds.api_secret)
+            ),
+            create_level_2_headers(signer, creds, request_args, 1000),
+        )
+
+    def test_client_keeps_the_hmac_signer_of_its_creds(self):
+        client = ClobClient("http://localhost", chain_id, private_key, creds)
+        request_args = RequestArgs(method="GET", request_path="/order")
+        with patch("py_clob_client.client.HmacSigner", wraps=HmacSigner) as built:
+            first = client._l2_headers(request_args)
+            client._l2_headers(request_args)
+            # rfq requests sign with the same signer and clock
+            rfq_headers = client.rfq._get_l2_headers("GET", "/order")
+            self.assertEqual(built.call_count, 1)
+            self.assertEqual(
+                rfq_headers[POLY_SIGNATURE],
+                create_level_2_headers(
+                    signer, creds, request_args, int(rfq_headers[POLY_TIMESTAMP])
+                )[POLY_SIGNATURE],
+            )
+            self.assertIs(client.get_hmac_signer(), client.get_hmac_signer())
+
+            other = replace(
+                creds, api_secret="BBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBBB="
+            )
+            client.set_api_creds(other)
+            second = client._l2_headers(request_args)
+            self.assertEqual(built.call_count, 2)
+        self.assertNotEqual(first[POLY_SIGNATURE], second[POLY_SIGNATURE])
+
+    def test_l1_header_cache(self):
+        cache = L1HeaderCache(ttl=30)
+        headers = cache.get_headers(signer, timestamp=1000)
+        self.assertEqual(headers, create_level_1_headers(signer, timestamp=1000))
+
+        headers["extra"] = "x"
+        reused = cache.get_headers(signer, timestamp=1029)
+        self.assertEqual(reused[POLY_TIMESTAMP], "1000")
+        self.assertNotIn("extra", reused)
+
+        self.assertEqual(
+            cache.get_headers(signer, timestamp=1030)[POLY_TIMESTAMP], "1030"
+        )
+        self.assertEqual(cache.get_headers(signer, 1, 1031)[POLY_NONCE], "1")
+        self.assertEqual(cache.get_headers(signer, 1, 1031)[POLY_TIMESTAMP], "1031")
+        # a clock moving backwards does not reuse headers from the future
+        self.assertEqual(
+            cache.get_headers(signer, timestamp=900)[POLY_TIMESTAMP], "900"
+        )
+
+        cache.clear()
+        self.assertEqual(
+            cache.get_headers(signer, timestamp=901)[POLY_TIMESTAMP], "901"
+        )
@@ -0,0 +1,73 @@
+import threading
+from unittest import TestCase
+
+from py_clob_client.clob_types import TradeParams
+from py_clob_client.history.bulk import fetch_trade_history, split_time_range
+
+
+class FakeClient:
+    def __init__(self, trades):
+        self.trades = trades
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def _query(self, params):
+        with self.lock:
+            self.queries.append(params)
+        # both bounds inclusive, newest first like the API
+        return [
+            t
+            for t in sorted(self.trades, key=lambda t: -int(t["match_time"]))
+            if params.after <= int(t["match_time"]) <= params.before
+            and (params.market is None or t["market"] == params.market)
+        ]
+
+    def iter_trades(self, params=None, next_cursor="MA==", prefetch=True):
+        return iter(self._query(params))
+
+    def iter_builder_trades(self, params=None, next_cursor="MA==", prefetch=True):
+        return iter([{**t, "builder": True} for t in self._query(params)])
+
+
+class TestBulkHistory(TestCase):
+    def test_split_time_range(self):
+        self.assertEqual(
+            split_time_range(0, 100, 4), [(0, 25), (25, 50), (50, 75), (75, 100)]
+        )
+        self.assertEqual(split_time_range(10, 12, 8), [(10, 11), (11, 12)])
+        self.assertEqual(split_time_range(10, 10, 8), [(10, 10)])
+        with self.assertRaises(ValueError):
+            split_time_range(10, 5, 2)
+
+    def test_fetch_trade_history_merges_and_dedups(self):
+        trades = [
+            {"id": str(i), "match_time": str(t), "market": "m1" if i % 2 else "m2"}
+            for i, t in enumerate([0, 25, 25, 49, 50, 51, 75, 99, 100, 101])
+        ]
+        client = FakeClient(trades)
+
+        result = fetch_trade_history(client, after=0, before=100, shards=4)
+        self.assertEqual([t["id"] for t in result], [str(i) for i in range(9)])
+        self.assertEqual(len(client.queries), 4)
+        self.assertEqual(
+            sorted((q.after, q.before) for q in client.queries),
+            [(0, 25), (25, 50), (50, 75), (75, 100)],
+        )
+
+    def test_fetch_trade_history_params(self):
+        trades = [
+            {"id": str(i), "match_time": str(i * 10), "market": "m1" if i % 2 else "m2"}
+            for i in range(10)
+        ]
+        client = FakeClient(trades)
+        result = fetch_trade_history(
+            client, TradeParams(market="m1", after=0, before=100), shards=3
+        )
+        self.assertEqual([t["id"] for t in result], ["1", "3", "5", "7", "9"])
+        self.assertTrue(all(q.market == "m1" for q in client.queries))
+
+        result = fetch_trade_history(client, after=0, before=30, builder=True)
+        self.assertTrue(all(t["builder"] for t in result))
+
+        with self.assertRaises(ValueError):
+            fetch_trade_history(client)
@@ -0,0 +1,72 @@
+import tempfile
+from unittest import TestCase
+
+from py_clob_client.history.sync import TradeSync
+
+
+class FakeClient:
+    def __init__(self):
+        self.trades = []
+        self.queries = []
+
+    def iter_trades(self, params=None, next_cursor="MA==", prefetch=True):
+        self.queries.append(params)
+        return iter(
+            [
+                t
+                for t in self.trades
+                if params.after is None or int(t["match_time"]) >= params.after
+            ]
+        )
+
+    iter_builder_trades = iter_trades
+
+
+def trade(trade_id, match_time):
+    return {"id": trade_id, "match_time": str(match_time)}
+
+
+class TestTradeSync(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.client = FakeClient()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_incremental_sync(self):
+        sync = TradeSync(self.client, self.tmp.name)
+        self.client.trades = [trade("b", 20), trade("a", 10)]
+        self.assertEqual([t["id"] for t in sync.sync()], ["a", "b"])
+        self.assertIsNone(self.client.queries[-1].after)
+        self.assertEqual(sync.checkpoint.last_time, 20)
+
+        # nothing new
+        self.assertEqual(sync.sync(), [])
+        self.assertEqual(self.client.queries[-1].after, 19)
+
+        # a late trade in the checkpoint second and a newer one
+        self.client.trades = [
+            trade("d", 30),
+            trade("c", 20),
+            trade("b", 20),
+            trade("a", 10),
+        ]
+        self.assertEqual([t["id"] for t in sync.sync()], ["c", "d"])
+        self.assertEqual([t["id"] for t in sync.trades_since()], ["a", "b", "c", "d"])
+        self.assertEqual([t["id"] for t in sync.trades_since(20)], ["b", "c", "d"])
+
+    def test_checkpoint_is_persisted(self):
+        self.client.trades = [trade("a", 10), trade("b", 11)]
+        TradeSync(self.client, self.tmp.name).sync()
+
+        restored = TradeSync(self.client, self.tmp.name)
+        self.assertEqual(restored.checkpoint.last_time, 11)
+        self.assertEqual(restored.checkpoint.recent_ids, ["a", "b"])
+        self.assertEqual(restored.sync(), [])
+        self.assertEqual(self.client.queries[-1].after, 10)
+
+    def test_builder_sync(self):
+        self.client.trades = [trade("a", 10)]
+        sync = TradeSync(self.client, self.tmp.name, builder=True)
+        self.assertEqual(len(sync.sync()), 1)
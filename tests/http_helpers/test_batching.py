@@ -0,0 +1,94 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import BookParams
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.batching import (
+    chunked,
+    merge_dicts,
+    merge_lists,
+    merge_nested_dicts,
+    run_chunked,
+)
+
+
+class TestBatching(TestCase):
+    def test_chunked(self):
+        self.assertEqual(chunked([1, 2, 3, 4, 5], 2), [[1, 2], [3, 4], [5]])
+        self.assertEqual(chunked([1, 2], 2), [[1, 2]])
+        self.assertEqual(chunked([1, 2, 3], None), [[1, 2, 3]])
+        self.assertEqual(chunked([], 2), [[]])
+
+    def test_merges(self):
+        self.assertEqual(merge_lists([[1], [2, 3], []]), [1, 2, 3])
+        self.assertEqual(merge_dicts([{"a": 1}, {"b": 2}]), {"a": 1, "b": 2})
+        self.assertEqual(
+            merge_nested_dicts([{"a": {"BUY": 1}}, {"a": {"SELL": 2}, "b": {}}]),
+            {"a": {"BUY": 1, "SELL": 2}, "b": {}},
+        )
+
+    def test_run_chunked_keeps_input_order(self):
+        threads = set()
+        barrier = threading.Barrier(3, timeout=2)
+
+        def call(chunk):
+            threads.add(threading.get_ident())
+            barrier.wait()
+            return [x * 10 for x in chunk]
+
+        result = run_chunked(
+            call, list(range(6)), merge_lists, chunk_size=2, max_workers=3
+        )
+        self.assertEqual(result, [0, 10, 20, 30, 40, 50])
+        self.assertEqual(len(threads), 3)
+
+    @patch("py_clob_client.http_helpers.retry.time.sleep")
+    def test_failed_chunks_are_retried_alone(self, sleep):
+        calls = []
+        lock = threading.Lock()
+        failed = set()
+
+        def call(chunk):
+            with lock:
+                calls.append(tuple(chunk))
+                if chunk[0] == 2 and 2 not in failed:
+                    failed.add(2)
+                    raise PolyApiException(error_msg="timeout")
+            return {x: x for x in chunk}
+
+        result = run_chunked(call, [0, 1, 2, 3, 4], merge_dicts, chunk_size=2)
+        self.assertEqual(list(result), [0, 1, 2, 3, 4])
+        self.assertEqual(sorted(calls), [(0, 1), (2, 3), (2, 3), (4,)])
+
+    def test_non_retryable_chunk_errors_propagate(self):
+        def call(chunk):
+            raise ValueError("bad request")
+
+        with self.assertRaises(ValueError):
+            run_chunked(call, [1, 2, 3], merge_lists, chunk_size=1)
+
+
+class TestClientBatchEndpoints(TestCase):
+    @patch("py_clob_client.client.post")
+    def test_batch_endpoints_are_chunked(self, post):
+        def fake_post(url, data=None):
+            if url.endswith("/midpoints"):
+                return {p["token_id"]: "0.5" for p in data}
+            if url.endswith("/prices"):
+                return {p["token_id"]: {p["side"]: "0.4"} for p in data}
+            return [{"asset_id": p["token_id"]} for p in data]
+
+        post.side_effect = fake_post
+        client = ClobClient("http://localhost", batch_chunk_size=2)
+        params = [BookParams(token_id=str(i), side="BUY") for i in range(5)]
+
+        self.assertEqual(list(client.get_midpoints(params)), ["0", "1", "2", "3", "4"])
+        self.assertEqual(post.call_count, 3)
+
+        prices = client.get_prices(params + [BookParams(token_id="0", side="SELL")])
+        self.assertEqual(prices["0"], {"BUY": "0.4", "SELL": "0.4"})
+
+        books = client.get_raw_order_books(params)
+        self.assertEqual([b["asset_id"] for b in books], ["0", "1", "2", "3", "4"])
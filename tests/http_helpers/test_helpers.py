@@ -1,4 +1,6 @@
 from unittest import TestCase
+
+import httpx
 from py_clob_client.clob_types import (
     TradeParams,
     OpenOrderParams,
@@ -17,6 +19,11 @@ from py_clob_client.http_helpers.helpers import (
     add_balance_allowance_params_to_url,
     add_order_scoring_params_to_url,
     add_orders_scoring_params_to_url,
+    overloadHeaders,
+    request_headers,
+    _http_client,
+    GET,
+    POST,
 )
 
 
@@ -114,3 +121,25 @@ class TestHelpers(TestCase):
         )
         self.assertIsNotNone(url)
         self.assertEqual(url, "http://tracker?order_ids=0x0,0x1,0x2")
+
+    def test_request_headers(self):
+        legacy = overloadHeaders(GET, {"POLY_API_KEY": "k"})
+
+        shared = request_headers(GET)
+        self.assertIs(shared, request_headers(GET))
+        with self.assertRaises(TypeError):
+            shared["POLY_API_KEY"] = "k"
+
+        auth = {"POLY_API_KEY": "k"}
+        self.assertIs(request_headers(GET, auth), auth)
+        self.assertEqual(
+            dict(_http_client.build_request(GET, "http://x", headers=auth).headers),
+            {**dict(httpx.Headers(legacy)), "host": "x"},
+        )
+
+        post_headers = request_headers(POST, {"POLY_API_KEY": "k"})
+        self.assertEqual(post_headers, {"POLY_API_KEY": "k"})
+        built = _http_client.build_request(POST, "http://x", headers=post_headers)
+        self.assertEqual(built.headers["User-Agent"], "py_clob_client")
+        self.assertEqual(built.headers["Content-Type"], "application/json")
+        self.assertEqual(built.headers["POLY_API_KEY"], "k")
@@ -0,0 +1,80 @@
+import threading
+from concurrent.futures import wait
+from unittest import TestCase
+
+from py_clob_client.http_helpers.microbatch import MicroBatcher
+
+
+class TestMicroBatcher(TestCase):
+    def test_items_within_window_share_a_flush(self):
+        batches = []
+
+        def flush(items):
+            batches.append(list(items))
+            return [i * 2 for i in items]
+
+        with MicroBatcher(flush, window=0.05) as batcher:
+            futures = [batcher.submit(i) for i in range(5)]
+            self.assertEqual([f.result(1) for f in futures], [0, 2, 4, 6, 8])
+        self.assertEqual(batches, [[0, 1, 2, 3, 4]])
+
+    def test_submissions_from_many_threads(self):
+        batches = []
+        start = threading.Barrier(8)
+        futures = {}
+
+        def flush(items):
+            batches.append(items)
+            return [f"r{i}" for i in items]
+
+        with MicroBatcher(flush, window=0.05) as batcher:
+
+            def caller(i):
+                start.wait()
+                futures[i] = batcher.submit(i)
+
+            threads = [threading.Thread(target=caller, args=(i,)) for i in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            for i, future in futures.items():
+                self.assertEqual(future.result(1), f"r{i}")
+        self.assertLess(len(batches), 8)
+        self.assertEqual(sorted(i for b in batches for i in b), list(range(8)))
+
+    def test_max_batch_flushes_early(self):
+        batches = []
+
+        def flush(items):
+            batches.append(items)
+            return items
+
+        with MicroBatcher(flush, window=5, max_batch=2) as batcher:
+            futures = [batcher.submit(i) for i in range(4)]
+            done, _ = wait(futures, timeout=1)
+            self.assertEqual(len(done), 4)
+        self.assertEqual(batches, [[0, 1], [2, 3]])
+
+    def test_errors(self):
+        def flush(items):
+            if "fail" in items:
+                raise ValueError("batch failed")
+            return [KeyError(i) if i == "bad" else i for i in items]
+
+        with MicroBatcher(flush, window=0.02) as batcher:
+            good, bad = batcher.submit("good"), batcher.submit("bad")
+            self.assertEqual(good.result(1), "good")
+            self.assertIsInstance(bad.exception(1), KeyError)
+
+            failing = [batcher.submit("fail"), batcher.submit("x")]
+            for future in failing:
+                self.assertIsInstance(future.exception(1), ValueError)
+
+    def test_close_flushes_pending_and_rejects_new_items(self):
+        batcher = MicroBatcher(lambda items: items, window=10)
+        future = batcher.submit(1)
+        batcher.close()
+        self.assertEqual(future.result(0), 1)
+        with self.assertRaises(RuntimeError):
+            batcher.submit(2)
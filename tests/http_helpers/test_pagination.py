@@ -0,0 +1,165 @@
+import asyncio
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+import httpx
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds
+from py_clob_client.constants import AMOY, END_CURSOR
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.http_helpers.pagination import (
+    aiter_pages,
+    aiter_records,
+    iter_pages,
+    iter_records,
+    resumable,
+)
+
+
+class FakePages:
+    def __init__(self, pages):
+        self.pages = pages
+        self.requested = []
+        self.threads = set()
+
+    def __call__(self, next_cursor):
+        self.requested.append(next_cursor)
+        self.threads.add(threading.get_ident())
+        i = int(next_cursor)
+        next_cursor = str(i + 1) if i + 1 < len(self.pages) else END_CURSOR
+        return {"data": self.pages[i], "next_cursor": next_cursor}
+
+
+class TestPagination(TestCase):
+    def test_iter_pages_without_prefetch(self):
+        fetch = FakePages([[1, 2], [3], [4, 5]])
+        self.assertEqual(
+            list(iter_pages(fetch, "0", prefetch=False)), [[1, 2], [3], [4, 5]]
+        )
+        self.assertEqual(fetch.requested, ["0", "1", "2"])
+        self.assertEqual(fetch.threads, {threading.get_ident()})
+
+    def test_iter_records_with_prefetch(self):
+        fetch = FakePages([[1, 2], [3], [4, 5]])
+        self.assertEqual(list(iter_records(fetch, "0")), [1, 2, 3, 4, 5])
+        self.assertEqual(fetch.requested, ["0", "1", "2"])
+
+    def test_prefetch_requests_next_page_before_it_is_consumed(self):
+        fetch = FakePages([[1], [2], [3]])
+        pages = iter_pages(fetch, "0")
+        self.assertEqual(next(pages), [1])
+        # the next page was already submitted while the caller holds the first
+        for _ in range(100):
+            if len(fetch.requested) == 2:
+                break
+            threading.Event().wait(0.01)
+        self.assertEqual(fetch.requested, ["0", "1"])
+        pages.close()
+
+    def test_end_cursor_and_none(self):
+        fetch = FakePages([["a"]])
+        self.assertEqual(list(iter_records(fetch, END_CURSOR)), [])
+        self.assertEqual(fetch.requested, [])
+
+        requested = []
+
+        def first_page(next_cursor):
+            requested.append(next_cursor)
+            return {"data": ["a"], "next_cursor": END_CURSOR}
+
+        self.assertEqual(list(iter_records(first_page, None)), ["a"])
+        self.assertEqual(requested, ["MA=="])
+
+    def test_errors_propagate(self):
+        def fail(next_cursor):
+            raise ValueError("boom")
+
+        with self.assertRaises(ValueError) as ctx:
+            list(iter_records(fail, "0"))
+        self.assertEqual(ctx.exception.next_cursor, "0")
+
+    @patch("py_clob_client.http_helpers.retry.time.sleep")
+    def test_failed_page_is_retried_from_its_cursor(self, sleep):
+        fetch = FakePages([[1], [2], [3]])
+        failures = {"1": 2}
+
+        def flaky(next_cursor):
+            if failures.get(next_cursor):
+                failures[next_cursor] -= 1
+                fetch.requested.append(next_cursor)
+                raise PolyApiException(error_msg="Request exception!")
+            return fetch(next_cursor)
+
+        for prefetch in (True, False):
+            fetch.requested = []
+            failures = {"1": 2}
+            self.assertEqual(list(iter_records(flaky, "0", prefetch)), [1, 2, 3])
+            self.assertEqual(fetch.requested, ["0", "1", "1", "1", "2"])
+
+    @patch("py_clob_client.http_helpers.retry.time.sleep")
+    def test_exhausted_retries_expose_resume_cursor(self, sleep):
+        calls = []
+
+        def fetch(next_cursor):
+            calls.append(next_cursor)
+            if next_cursor == "1":
+                raise PolyApiException(error_msg="down")
+            return {"data": [next_cursor], "next_cursor": "1"}
+
+        records = []
+        with self.assertRaises(PolyApiException) as ctx:
+            for record in iter_records(fetch, "0", prefetch=False, retries=2):
+                records.append(record)
+        self.assertEqual(records, ["0"])
+        self.assertEqual(calls, ["0", "1", "1", "1"])
+        self.assertEqual(ctx.exception.next_cursor, "1")
+        self.assertEqual([c.args[0] for c in sleep.call_args_list], [0.5, 1.0])
+
+    def test_non_retryable_errors_are_not_retried(self):
+        calls = []
+
+        def fetch(next_cursor):
+            calls.append(next_cursor)
+            raise ValueError("bad response")
+
+        with self.assertRaises(ValueError):
+            resumable(fetch)("0")
+        self.assertEqual(calls, ["0"])
+
+    @patch("py_clob_client.http_helpers.retry.time.sleep")
+    @patch("py_clob_client.client.get")
+    def test_auth_failures_are_not_retried(self, get, sleep):
+        get.side_effect = PolyApiException(
+            httpx.Response(401, json={"error": "Invalid api key"})
+        )
+        client = ClobClient(
+            "http://localhost",
+            chain_id=AMOY,
+            key="0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+            creds=ApiCreds(
+                api_key="key",
+                api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+                api_passphrase="passphrase",
+            ),
+        )
+
+        with self.assertRaises(PolyApiException) as ctx:
+            client.get_orders()
+        self.assertEqual(ctx.exception.status_code, 401)
+        self.assertEqual(get.call_count, 1)
+        sleep.assert_not_called()
+
+    def test_async_iteration(self):
+        async def collect(prefetch):
+            fetch = FakePages([[1, 2], [3], [4]])
+            records = [r async for r in aiter_records(fetch, "0", prefetch)]
+            pages = [p async for p in aiter_pages(FakePages([[1], [2]]), "0", prefetch)]
+            return records, pages, fetch.requested
+
+        for prefetch in (True, False):
+            records, pages, requested = asyncio.run(collect(prefetch))
+            self.assertEqual(records, [1, 2, 3, 4])
+            self.assertEqual(pages, [[1], [2]])
+            self.assertEqual(requested, ["0", "1", "2"])
@@ -0,0 +1,23 @@
+import time
+from unittest import TestCase
+
+from py_clob_client.http_helpers.rate_limit import RateLimiter
+
+
+class TestRateLimiter(TestCase):
+    def test_burst_then_throttle(self):
+        limiter = RateLimiter(rate=100, burst=5)
+        for _ in range(5):
+            self.assertTrue(limiter.try_acquire())
+        self.assertFalse(limiter.try_acquire())
+
+        started = time.monotonic()
+        for _ in range(3):
+            limiter.acquire()
+        self.assertGreaterEqual(time.monotonic() - started, 0.02)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=0)
+        with self.assertRaises(ValueError):
+            RateLimiter(rate=10, burst=2).acquire(3)
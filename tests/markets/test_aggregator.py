@@ -0,0 +1,54 @@
+from unittest import TestCase
+
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.markets.aggregator import PriceAggregator
+
+
+class FakeClient:
+    def __init__(self):
+        self.requests = []
+
+    def get_midpoints(self, params):
+        self.requests.append(("midpoints", [p.token_id for p in params]))
+        return {p.token_id: "0.5" for p in params if p.token_id != "missing"}
+
+    def get_prices(self, params):
+        self.requests.append(("prices", [(p.token_id, p.side) for p in params]))
+        prices = {}
+        for p in params:
+            prices.setdefault(p.token_id, {})[p.side] = (
+                "0.4" if p.side == "BUY" else "0.6"
+            )
+        return prices
+
+    def get_spreads(self, params):
+        self.requests.append(("spreads", [p.token_id for p in params]))
+        return {p.token_id: "0.02" for p in params}
+
+
+class TestPriceAggregator(TestCase):
+    def test_single_calls_are_batched(self):
+        client = FakeClient()
+        with PriceAggregator(client, window=0.05) as aggregator:
+            mids = [aggregator.get_midpoint(t) for t in ("a", "b", "a", "missing")]
+            prices = [
+                aggregator.get_price("a", "BUY"),
+                aggregator.get_price("a", "SELL"),
+            ]
+            spread = aggregator.get_spread("b")
+
+            self.assertEqual(mids[0].result(1), {"mid": "0.5"})
+            self.assertEqual(mids[2].result(1), {"mid": "0.5"})
+            self.assertIsInstance(mids[3].exception(1), PolyApiException)
+            self.assertEqual(prices[0].result(1), {"price": "0.4"})
+            self.assertEqual(prices[1].result(1), {"price": "0.6"})
+            self.assertEqual(spread.result(1), {"spread": "0.02"})
+
+        self.assertEqual(
+            sorted(client.requests),
+            [
+                ("midpoints", ["a", "b", "missing"]),
+                ("prices", [("a", "BUY"), ("a", "SELL")]),
+                ("spreads", ["b"]),
+            ],
+        )
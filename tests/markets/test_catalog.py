@@ -0,0 +1,165 @@
+import threading
+from unittest import TestCase
+
+from py_clob_client.constants import END_CURSOR
+from py_clob_client.markets.catalog import (
+    SIMPLIFIED_MARKETS,
+    MarketCatalog,
+    encode_cursor,
+)
+
+
+def make_market(i, **kwargs):
+    market = {
+        "condition_id": f"c{i}",
+        "market_slug": f"market-{i}",
+        "neg_risk": i % 2 == 0,
+        "minimum_tick_size": 0.01,
+        "active": True,
+        "closed": False,
+        "tokens": [
+            {"token_id": f"t{i}-yes", "outcome": "Yes"},
+            {"token_id": f"t{i}-no", "outcome": "No"},
+        ],
+    }
+    market.update(kwargs)
+    return market
+
+
+class FakeClient:
+    def __init__(self, markets, page_size=2, cursor=encode_cursor):
+        self.markets = markets
+        self.page_size = page_size
+        self.cursor = cursor
+        self.requested = []
+        self.threads = set()
+        self.rate_limiter = None
+        self._lock = threading.Lock()
+
+    def _page(self, next_cursor):
+        with self._lock:
+            self.requested.append(next_cursor)
+            self.threads.add(threading.get_ident())
+        offset = self.offset(next_cursor)
+        if offset >= len(self.markets) and offset > 0:
+            raise Exception("invalid cursor")
+        end = offset + self.page_size
+        return {
+            "data": self.markets[offset:end],
+            "next_cursor": self.cursor(end) if end < len(self.markets) else END_CURSOR,
+        }
+
+    def offset(self, cursor):
+        for offset in range(len(self.markets) + 100):
+            if self.cursor(offset) == cursor:
+                return offset
+        raise Exception("invalid cursor")
+
+    def get_markets(self, next_cursor="MA=="):
+        return self._page(next_cursor)
+
+    def get_simplified_markets(self, next_cursor="MA=="):
+        return self._page(next_cursor)
+
+
+class TestMarketCatalog(TestCase):
+    def test_encode_cursor(self):
+        self.assertEqual(encode_cursor(0), "MA==")
+        self.assertEqual(encode_cursor(-1), END_CURSOR)
+
+    def test_load_indexes_markets(self):
+        client = FakeClient([make_market(i) for i in range(5)])
+        catalog = MarketCatalog(client, max_workers=3)
+        self.assertEqual(catalog.load(), 5)
+
+        self.assertEqual(len(catalog), 5)
+        self.assertIn("c3", catalog)
+        self.assertEqual(catalog.get("c1")["market_slug"], "market-1")
+        self.assertEqual(catalog.by_token("t2-no")["condition_id"], "c2")
+        self.assertEqual(catalog.by_slug("market-4")["condition_id"], "c4")
+        self.assertEqual(catalog.complement("t0-yes"), "t0-no")
+        self.assertEqual(catalog.complement("t0-no"), "t0-yes")
+        self.assertEqual(catalog.tick_size("t1-yes"), "0.01")
+        self.assertTrue(catalog.neg_risk("t2-yes"))
+        self.assertFalse(catalog.neg_risk("t1-yes"))
+        self.assertTrue(catalog.is_active("t1-yes"))
+        self.assertIsNone(catalog.by_token("unknown"))
+        self.assertIsNone(catalog.tick_size("unknown"))
+        self.assertFalse(catalog.is_active("unknown"))
+        self.assertEqual(len(catalog.token_ids()), 10)
+
+    def test_load_fetches_guessed_pages_concurrently(self):
+        client = FakeClient([make_market(i) for i in range(9)])
+        catalog = MarketCatalog(client, max_workers=4)
+        catalog.load()
+        self.assertEqual(len(catalog), 9)
+        self.assertEqual(
+            sorted(client.requested),
+            sorted(encode_cursor(i) for i in (0, 2, 4, 6, 8)),
+        )
+        self.assertGreater(len(client.threads), 1)
+
+    def test_load_falls_back_to_sequential_cursors(self):
+        client = FakeClient(
+            [make_market(i) for i in range(7)],
+            cursor=lambda offset: "MA==" if offset == 0 else f"opaque-{offset}",
+        )
+        catalog = MarketCatalog(client, max_workers=4)
+        self.assertEqual(catalog.load(), 7)
+        self.assertEqual(client.requested, ["MA==", "opaque-2", "opaque-4", "opaque-6"])
+
+    def test_refresh_picks_up_new_markets_from_tail(self):
+        markets = [make_market(i) for i in range(5)]
+        client = FakeClient(markets)
+        catalog = MarketCatalog(client, max_workers=2)
+        catalog.load()
+
+        markets.append(make_market(5))
+        markets.append(make_market(6))
+        client.requested = []
+        updated = catalog.refresh()
+
+        self.assertEqual([m["condition_id"] for m in updated], ["c5", "c6"])
+        self.assertEqual(client.requested, [encode_cursor(4), encode_cursor(6)])
+        self.assertEqual(catalog.by_token("t6-no")["condition_id"], "c6")
+
+        client.requested = []
+        self.assertEqual(catalog.refresh(), [])
+        self.assertEqual(client.requested, [encode_cursor(6)])
+
+    def test_upsert_replaces_state(self):
+        client = FakeClient([make_market(i) for i in range(2)])
+        catalog = MarketCatalog(client, source=SIMPLIFIED_MARKETS)
+        catalog.load()
+
+        catalog.upsert(
+            make_market(1, closed=True, minimum_tick_size=0.001, market_slug="moved")
+        )
+        self.assertFalse(catalog.is_active("t1-yes"))
+        self.assertEqual(catalog.tick_size("t1-no"), "0.001")
+        self.assertIsNone(catalog.by_slug("market-1"))
+        self.assertEqual(catalog.by_slug("moved")["condition_id"], "c1")
+
+    def test_invalid_source(self):
+        with self.assertRaises(ValueError):
+            MarketCatalog(FakeClient([]), source="events")
+
+    def test_background_refresh(self):
+        markets = [make_market(0)]
+        client = FakeClient(markets)
+        catalog = MarketCatalog(client)
+        updates = []
+        done = threading.Event()
+
+        def on_update(updated):
+            updates.append(updated)
+            done.set()
+
+        catalog.start(interval=0.01, full_interval=None, on_update=on_update)
+        try:
+            markets.append(make_market(1))
+            self.assertTrue(done.wait(2))
+        finally:
+            catalog.stop()
+        self.assertEqual(updates[0][0]["condition_id"], "c1")
+        self.assertIn("c1", catalog)
@@ -0,0 +1,134 @@
+import threading
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderBookSummary
+from py_clob_client.markets.scheduler import (
+    BOOK,
+    PRICES,
+    LatestValueStore,
+    PollingScheduler,
+    PollTier,
+)
+
+
+class FakeClient:
+    def __init__(self):
+        self.mids = {}
+        self.price_requests = []
+        self.book_requests = []
+
+    def get_prices(self, params):
+        self.price_requests.append([(p.token_id, p.side) for p in params])
+        prices = {}
+        for p in params:
+            mid = self.mids.get(p.token_id, 0.5)
+            price = mid - 0.01 if p.side == "BUY" else mid + 0.01
+            prices.setdefault(p.token_id, {})[p.side] = str(round(price, 4))
+        return prices
+
+    def get_raw_order_books(self, params):
+        self.book_requests.append([p.token_id for p in params])
+        return [
+            {
+                "market": "m",
+                "asset_id": p.token_id,
+                "timestamp": "1",
+                "last_trade_price": "0.5",
+                "bids": [{"price": "0.49", "size": "10"}],
+                "asks": [{"price": "0.51", "size": "10"}],
+                "min_order_size": "5",
+                "tick_size": "0.01",
+                "neg_risk": False,
+                "hash": "h-" + p.token_id,
+            }
+            for p in params
+        ]
+
+
+class TestPollingScheduler(TestCase):
+    def test_tier_defaults(self):
+        tier = PollTier(interval=4)
+        self.assertEqual(tier.min_interval, 1)
+        self.assertEqual(tier.max_interval, 16)
+        with self.assertRaises(ValueError):
+            PollTier(interval=0)
+
+    def test_cycle_batches_due_tokens_by_priority(self):
+        client = FakeClient()
+        scheduler = PollingScheduler(client, max_tokens_per_cycle=2)
+        scheduler.add_tokens(["low"], PollTier(priority=2, interval=10))
+        scheduler.add_tokens(["high", "book"], PollTier(priority=0, interval=1))
+        scheduler.add_tokens(["book"], PollTier(priority=1, interval=1, books=True))
+
+        self.assertEqual(scheduler.cycle(now=100), ["high", "book"])
+        self.assertEqual(
+            client.price_requests,
+            [[("high", "BUY"), ("high", "SELL"), ("book", "BUY"), ("book", "SELL")]],
+        )
+        self.assertEqual(client.book_requests, [["book"]])
+        self.assertEqual(
+            scheduler.store.get("high", PRICES), {"BUY": "0.49", "SELL": "0.51"}
+        )
+        self.assertIsInstance(scheduler.store.get("book", BOOK), OrderBookSummary)
+
+        # leftovers go first in the next cycle, polled tokens wait for their interval
+        self.assertEqual(scheduler.cycle(now=100.5), ["low"])
+        self.assertEqual(scheduler.cycle(now=100.6), [])
+        self.assertEqual(scheduler.cycle(now=101), ["high", "book"])
+
+    def test_unchanged_books_are_not_republished(self):
+        client = FakeClient()
+        store = LatestValueStore()
+        updates = []
+        store.subscribe(lambda token_id, field, value: updates.append(field))
+        scheduler = PollingScheduler(client, store=store)
+        scheduler.add_tokens(["a"], PollTier(interval=1, books=True))
+
+        scheduler.cycle(now=0)
+        scheduler.cycle(now=10)
+        self.assertEqual(updates, [PRICES, BOOK, PRICES])
+
+    def test_intervals_adapt_to_volatility(self):
+        client = FakeClient()
+        scheduler = PollingScheduler(client, move_threshold=0.01)
+        scheduler.add_tokens(["a"], PollTier(interval=4))
+
+        scheduler.cycle(now=0)
+        self.assertEqual(scheduler.interval("a"), 4)
+
+        scheduler.cycle(now=10)
+        self.assertEqual(scheduler.interval("a"), 6)
+
+        client.mids["a"] = 0.6
+        scheduler.cycle(now=20)
+        self.assertEqual(scheduler.interval("a"), 3)
+        self.assertEqual(scheduler.due(now=22.9), [])
+        self.assertEqual(scheduler.due(now=23), ["a"])
+
+        client.mids["a"] = 0.8
+        for now in (30, 40, 50):
+            scheduler.cycle(now=now)
+            client.mids["a"] -= 0.1
+        self.assertEqual(scheduler.interval("a"), 1)
+
+    def test_remove_tokens(self):
+        scheduler = PollingScheduler(FakeClient())
+        scheduler.add_tokens(["a", "b"])
+        scheduler.remove_tokens(["a"])
+        self.assertEqual(scheduler.due(), ["b"])
+        self.assertIsNone(scheduler.interval("a"))
+
+    def test_run_until_stopped(self):
+        client = FakeClient()
+        scheduler = PollingScheduler(client)
+        scheduler.add_tokens(["a"], PollTier(interval=0.01))
+        stop_event = threading.Event()
+        scheduler.store.subscribe(
+            lambda *args: len(client.price_requests) >= 3 and stop_event.set()
+        )
+
+        thread = threading.Thread(target=scheduler.run, args=(stop_event,))
+        thread.start()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertGreaterEqual(len(client.price_requests), 3)
@@ -0,0 +1,98 @@
+from unittest import TestCase
+
+from py_clob_client.clob_types import OrderBookSummary, OrderSummary, OrderType
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.orderbook.depth import OrderBookDepth
+from py_clob_client.signer import Signer
+
+# publicly known private key
+private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
+signer = Signer(private_key=private_key, chain_id=AMOY)
+
+
+def make_book(bids, asks, tick_size="0.01"):
+    return OrderBookSummary(
+        asset_id="100",
+        bids=[OrderSummary(price=p, size=s) for p, s in bids],
+        asks=[OrderSummary(price=p, size=s) for p, s in asks],
+        tick_size=tick_size,
+    )
+
+
+class TestOrderBookDepth(TestCase):
+    def setUp(self):
+        # server order: best level last on both sides
+        self.book = make_book(
+            bids=[("0.45", "300"), ("0.47", "200"), ("0.48", "100")],
+            asks=[("0.55", "300"), ("0.53", "200"), ("0.52", "100")],
+        )
+        self.depth = OrderBookDepth(self.book)
+
+    def test_best_prices_and_midpoint(self):
+        self.assertEqual(self.depth.best_bid(), 0.48)
+        self.assertEqual(self.depth.best_ask(), 0.52)
+        self.assertAlmostEqual(self.depth.midpoint(), 0.50)
+
+        empty = OrderBookDepth(make_book([], []))
+        self.assertIsNone(empty.best_bid())
+        self.assertIsNone(empty.midpoint())
+
+    def test_market_price_matches_builder(self):
+        builder = OrderBuilder(signer)
+        for amount in [1, 52, 53, 150, 158, 300]:
+            self.assertEqual(
+                self.depth.market_price(BUY, amount, OrderType.FOK),
+                builder.calculate_buy_market_price(
+                    self.book.asks, amount, OrderType.FOK
+                ),
+            )
+        for amount in [1, 100, 101, 300, 600]:
+            self.assertEqual(
+                self.depth.market_price(SELL, amount, OrderType.FOK),
+                builder.calculate_sell_market_price(
+                    self.book.bids, amount, OrderType.FOK
+                ),
+            )
+
+    def test_market_price_not_enough_liquidity(self):
+        with self.assertRaises(Exception):
+            self.depth.market_price(BUY, 1000, OrderType.FOK)
+        self.assertEqual(self.depth.market_price(BUY, 1000, OrderType.FAK), 0.55)
+        self.assertEqual(self.depth.market_price(SELL, 1000, OrderType.FAK), 0.45)
+
+        with self.assertRaises(Exception):
+            OrderBookDepth(make_book([], [])).market_price(BUY, 1, OrderType.FAK)
+
+    def test_price_to_fill(self):
+        self.assertEqual(self.depth.price_to_fill(BUY, 100), 0.52)
+        self.assertEqual(self.depth.price_to_fill(BUY, 101), 0.53)
+        self.assertEqual(self.depth.price_to_fill(SELL, 350), 0.45)
+        with self.assertRaises(Exception):
+            self.depth.price_to_fill(SELL, 601)
+
+    def test_vwap(self):
+        self.assertAlmostEqual(self.depth.vwap(BUY, 50), 0.52)
+        self.assertAlmostEqual(self.depth.vwap(BUY, 200), (52 + 53) / 200)
+        self.assertAlmostEqual(self.depth.vwap(SELL, 300), (48 + 94) / 300)
+        with self.assertRaises(Exception):
+            self.depth.vwap(BUY, 601)
+        with self.assertRaises(ValueError):
+            self.depth.vwap(BUY, 0)
+
+    def test_slippage(self):
+        self.assertAlmostEqual(self.depth.slippage(BUY, 100), 0.02)
+        self.assertAlmostEqual(self.depth.slippage(SELL, 200), 0.50 - 0.475)
+
+    def test_size_within_ticks(self):
+        self.assertEqual(self.depth.size_within_ticks(BUY, 0), 100)
+        self.assertEqual(self.depth.size_within_ticks(BUY, 1), 300)
+        self.assertEqual(self.depth.size_within_ticks(BUY, 2), 300)
+        self.assertEqual(self.depth.size_within_ticks(BUY, 3), 600)
+        self.assertEqual(self.depth.size_within_ticks(SELL, 1), 300)
+        self.assertEqual(self.depth.size_within_ticks(SELL, 100), 600)
+
+    def test_invalid_side(self):
+        with self.assertRaises(ValueError):
+            self.depth.vwap("HOLD", 10)
@@ -0,0 +1,101 @@
+from unittest import TestCase
+
+from py_clob_client.orderbook.local_book import (
+    LocalOrderBook,
+    LocalOrderBooks,
+    diff_levels,
+)
+
+
+class TestLocalOrderBook(TestCase):
+    def setUp(self):
+        self.raw = {
+            "event_type": "book",
+            "market": "0xaabb",
+            "asset_id": "1",
+            "timestamp": "100",
+            "hash": "h1",
+            "bids": [{"price": "0.48", "size": "10"}, {"price": "0.47", "size": "20"}],
+            "asks": [{"price": "0.52", "size": "30"}, {"price": "0.55", "size": "40"}],
+            "tick_size": "0.01",
+        }
+
+    def test_snapshot_is_returned_in_server_order(self):
+        book = LocalOrderBook("1")
+        book.apply_snapshot(self.raw)
+        summary = book.to_summary()
+        self.assertEqual([o.price for o in summary.bids], ["0.47", "0.48"])
+        self.assertEqual([o.price for o in summary.asks], ["0.55", "0.52"])
+        self.assertEqual(summary.tick_size, "0.01")
+        self.assertEqual(book.depth().best_bid(), 0.48)
+        self.assertEqual(book.depth().best_ask(), 0.52)
+
+    def test_apply_change(self):
+        book = LocalOrderBook("1")
+        book.apply_snapshot(self.raw)
+        depth = book.depth()
+        book.apply_change("BUY", "0.49", "5")
+        book.apply_change("SELL", "0.52", "0")
+        self.assertIsNot(book.depth(), depth)
+        self.assertEqual(book.depth().best_bid(), 0.49)
+        self.assertEqual(book.depth().best_ask(), 0.55)
+        with self.assertRaises(ValueError):
+            book.apply_change("HOLD", "0.5", "1")
+
+    def test_apply_messages(self):
+        books = LocalOrderBooks()
+        self.assertEqual(books.apply_message(self.raw), {"1"})
+        changed = books.apply_message(
+            {
+                "event_type": "price_change",
+                "market": "0xaabb",
+                "timestamp": "101",
+                "price_changes": [
+                    {"asset_id": "1", "price": "0.48", "size": "0", "side": "BUY"},
+                    {"asset_id": "2", "price": "0.3", "size": "7", "side": "SELL"},
+                ],
+            }
+        )
+        self.assertEqual(changed, {"1", "2"})
+        self.assertEqual(books.get("1").bids, {"0.47": "20"})
+        self.assertEqual(books.get("2").asks, {"0.3": "7"})
+
+        # legacy format
+        books.apply_message(
+            {
+                "event_type": "price_change",
+                "asset_id": "1",
+                "hash": "h2",
+                "changes": [{"price": "0.46", "size": "3", "side": "BUY"}],
+            }
+        )
+        self.assertEqual(books.get("1").bids, {"0.47": "20", "0.46": "3"})
+        self.assertEqual(books.get("1").hash, "h2")
+
+        books.apply_message(
+            {
+                "event_type": "tick_size_change",
+                "asset_id": "1",
+                "new_tick_size": "0.001",
+            }
+        )
+        self.assertEqual(books.get("1").tick_size, "0.001")
+        self.assertEqual(books.apply_message({"event_type": "unknown"}), set())
+
+    def test_diff_levels(self):
+        old = {"0.5": "10", "0.4": "20"}
+        new = {"0.5": "15", "0.3": "5"}
+        changes = diff_levels(old, new, "BUY")
+        self.assertCountEqual(
+            changes,
+            [
+                {"price": "0.5", "size": "15", "side": "BUY"},
+                {"price": "0.3", "size": "5", "side": "BUY"},
+                {"price": "0.4", "size": "0", "side": "BUY"},
+            ],
+        )
+        book = LocalOrderBook("1")
+        book.bids = dict(old)
+        for change in changes:
+            book.apply_change(change["side"], change["price"], change["size"])
+        self.assertEqual(book.bids, new)
@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from py_clob_client.orderbook.poller import OrderBookPoller
+
+
+def raw_book(asset_id, book_hash, bid="0.5"):
+    return {
+        "market": "0xaabb",
+        "asset_id": asset_id,
+        "timestamp": "123456789",
+        "bids": [{"price": bid, "size": "100"}],
+        "asks": [{"price": "0.6", "size": "100"}],
+        "min_order_size": "5",
+        "neg_risk": False,
+        "tick_size": "0.01",
+        "last_trade_price": "0.5",
+        "hash": book_hash,
+    }
+
+
+class FakeClient:
+    def __init__(self):
+        self.responses = []
+        self.requested = []
+
+    def get_raw_order_books(self, params):
+        self.requested.append([p.token_id for p in params])
+        return self.responses.pop(0)
+
+
+class TestOrderBookPoller(TestCase):
+    def test_poll_only_reports_changed_hashes(self):
+        client = FakeClient()
+        poller = OrderBookPoller(client, ["1", "2"])
+
+        client.responses.append([raw_book("1", "h1"), raw_book("2", "h2")])
+        self.assertEqual(poller.poll(), {"1", "2"})
+        self.assertEqual(client.requested[-1], ["1", "2"])
+        first = poller.get_book("1")
+
+        client.responses.append([raw_book("1", "h1"), raw_book("2", "h2b", "0.55")])
+        self.assertEqual(poller.poll(), {"2"})
+        self.assertEqual(poller.changed, {"2"})
+        # unchanged books are not re-parsed
+        self.assertIs(poller.get_book("1"), first)
+        self.assertEqual(poller.get_book("2").bids[0].price, "0.55")
+
+        client.responses.append([raw_book("1", "h1"), raw_book("2", "h2b", "0.55")])
+        self.assertEqual(poller.poll(), set())
+
+    def test_depth_is_rebuilt_only_on_change(self):
+        poller = OrderBookPoller(FakeClient())
+        poller.apply([raw_book("1", "h1")])
+        depth = poller.get_depth("1")
+        self.assertEqual(depth.best_bid(), 0.5)
+
+        poller.apply([raw_book("1", "h1")])
+        self.assertIs(poller.get_depth("1"), depth)
+
+        poller.apply([raw_book("1", "h2", "0.52")])
+        self.assertEqual(poller.get_depth("1").best_bid(), 0.52)
+        self.assertIsNone(poller.get_depth("3"))
+
+    def test_remove_tokens(self):
+        client = FakeClient()
+        poller = OrderBookPoller(client, ["1", "2"])
+        poller.apply([raw_book("1", "h1"), raw_book("2", "h2")])
+        poller.remove_tokens(["2"])
+        self.assertEqual(poller.token_ids, ["1"])
+        self.assertIsNone(poller.get_book("2"))
+
+        # a re-added token is reported as changed again
+        poller.add_tokens(["2"])
+        self.assertEqual(poller.apply([raw_book("2", "h2")]), {"2"})
@@ -0,0 +1,136 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from py_clob_client.orderbook.local_book import LocalOrderBooks
+from py_clob_client.orderbook.recorder import (
+    BookLogReader,
+    BookLogWriter,
+    BookRecorder,
+)
+
+
+def raw_book(asset_id, book_hash, bids, asks):
+    return {
+        "market": "0xaabb",
+        "asset_id": asset_id,
+        "timestamp": "100",
+        "hash": book_hash,
+        "bids": [{"price": p, "size": s} for p, s in bids],
+        "asks": [{"price": p, "size": s} for p, s in asks],
+        "min_order_size": "5",
+        "tick_size": "0.01",
+        "neg_risk": False,
+        "last_trade_price": "0.5",
+    }
+
+
+class TestBookLog(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_write_read_and_seek(self):
+        with BookLogWriter(self.dir, block_bytes=200) as writer:
+            for i in range(100):
+                writer.write({"event_type": "last_trade_price", "i": i}, ts=1000 + i)
+
+        reader = BookLogReader(self.dir)
+        records = list(reader.iter_records())
+        self.assertEqual([ts for ts, _ in records], list(range(1000, 1100)))
+        self.assertEqual(records[42][1]["i"], 42)
+        self.assertGreater(len(reader.read_index(reader.segments()[0])), 1)
+
+        window = list(reader.iter_records(start_ts=1050, end_ts=1059))
+        self.assertEqual([m["i"] for _, m in window], list(range(50, 60)))
+
+        # without the index the blocks are scanned
+        segment = reader.segments()[0]
+        index = reader.read_index(segment)
+        os.remove(segment[: -len(".blog")] + ".bidx")
+        self.assertEqual(reader.read_index(segment), index)
+        self.assertEqual(len(list(reader.iter_records(start_ts=1090))), 10)
+
+    def test_rotation_by_age(self):
+        with BookLogWriter(self.dir, max_segment_age=10) as writer:
+            for i in range(30):
+                writer.write({"i": i}, ts=i * 1000)
+
+        reader = BookLogReader(self.dir)
+        self.assertEqual(len(reader.segments()), 3)
+        self.assertEqual([m["i"] for _, m in reader.iter_records()], list(range(30)))
+
+    def test_rotation_by_size(self):
+        with BookLogWriter(self.dir, max_segment_bytes=300, block_bytes=100) as writer:
+            for i in range(50):
+                writer.write({"i": i, "pad": "x" * 50}, ts=i)
+        self.assertGreater(len(BookLogReader(self.dir).segments()), 1)
+
+
+class TestBookRecorder(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = self.tmp.name
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_polled_books_are_recorded_as_snapshot_then_deltas(self):
+        recorder = BookRecorder(BookLogWriter(self.dir))
+        first = raw_book("1", "h1", [("0.48", "10")], [("0.52", "10")])
+        second = raw_book("1", "h2", [("0.49", "5")], [("0.52", "10")])
+
+        self.assertEqual(recorder.record_raw_books([first], ts=1), {"1"})
+        self.assertEqual(recorder.record_raw_books([first], ts=2), set())
+        self.assertEqual(recorder.record_raw_books([second], ts=3), {"1"})
+        recorder.close()
+
+        records = list(BookLogReader(self.dir).iter_records())
+        self.assertEqual(
+            [m["event_type"] for _, m in records], ["book", "price_change"]
+        )
+        self.assertEqual(records[1][0], 3)
+
+        # replaying the log rebuilds the polled book
+        books = LocalOrderBooks()
+        for _, msg in records:
+            books.apply_message(msg)
+        self.assertEqual(books.get("1").bids, {"0.49": "5"})
+        self.assertEqual(books.get("1").hash, "h2")
+
+    def test_metadata_change_records_snapshot(self):
+        recorder = BookRecorder(BookLogWriter(self.dir))
+        book = raw_book("1", "h1", [("0.48", "10")], [])
+        recorder.record_raw_books([book], ts=1)
+        recorder.record_raw_books([{**book, "hash": "h2", "tick_size": "0.001"}], ts=2)
+        recorder.close()
+
+        records = list(BookLogReader(self.dir).iter_records())
+        self.assertEqual([m["event_type"] for _, m in records], ["book", "book"])
+
+    def test_new_segments_start_with_snapshots(self):
+        recorder = BookRecorder(BookLogWriter(self.dir, max_segment_age=1))
+        recorder.record_message(
+            {"event_type": "book", **raw_book("1", "h1", [("0.48", "10")], [])}, ts=0
+        )
+        recorder.record_message(
+            {
+                "event_type": "price_change",
+                "price_changes": [
+                    {"asset_id": "1", "price": "0.47", "size": "3", "side": "BUY"}
+                ],
+            },
+            ts=5000,
+        )
+        recorder.close()
+
+        reader = BookLogReader(self.dir)
+        segments = reader.segments()
+        self.assertEqual(len(segments), 2)
+        second = [msg for ts, msg in reader.iter_records(start_ts=5000)]
+        self.assertEqual(second[0]["event_type"], "book")
+        self.assertEqual(second[0]["bids"], [{"price": "0.48", "size": "10"}])
+        self.assertEqual(second[1]["event_type"], "price_change")
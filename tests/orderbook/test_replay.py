@@ -0,0 +1,100 @@
+import tempfile
+import time
+from unittest import TestCase
+
+from py_clob_client.clob_types import BookParams
+from py_clob_client.orderbook.recorder import BookLogReader, BookLogWriter
+from py_clob_client.orderbook.replay import ReplayEngine
+
+
+class TestReplayEngine(TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        with BookLogWriter(self.tmp.name) as writer:
+            writer.write(
+                {
+                    "event_type": "book",
+                    "market": "0xaabb",
+                    "asset_id": "1",
+                    "timestamp": "1000",
+                    "hash": "h1",
+                    "bids": [{"price": "0.48", "size": "10"}],
+                    "asks": [{"price": "0.52", "size": "10"}],
+                    "tick_size": "0.01",
+                    "neg_risk": False,
+                    "last_trade_price": "0.5",
+                },
+                ts=1000,
+            )
+            for i in range(10):
+                writer.write(
+                    {
+                        "event_type": "price_change",
+                        "market": "0xaabb",
+                        "price_changes": [
+                            {
+                                "asset_id": "1",
+                                "price": "0.49",
+                                "size": str(i + 1),
+                                "side": "BUY",
+                            }
+                        ],
+                    },
+                    ts=1100 + i * 10,
+                )
+        self.reader = BookLogReader(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_replay_drives_books_and_handlers(self):
+        engine = ReplayEngine(self.reader)
+        messages, changed = [], []
+        engine.add_handler(messages.append)
+        engine.add_book_handler(changed.append)
+
+        stats = engine.run()
+        self.assertEqual(stats.events, 11)
+        self.assertEqual(len(messages), 11)
+        self.assertEqual(changed[0], {"1"})
+        self.assertEqual((stats.first_ts, stats.last_ts), (1000, 1190))
+        self.assertEqual(engine.books.get("1").bids, {"0.48": "10", "0.49": "10"})
+
+    def test_replay_client(self):
+        engine = ReplayEngine(self.reader)
+        client = engine.client()
+        engine.run(end_ts=1100)
+
+        self.assertEqual(client.get_midpoint("1"), {"mid": "0.505"})
+        self.assertEqual(client.get_price("1", "BUY"), {"price": "0.49"})
+        self.assertEqual(client.get_price("1", "SELL"), {"price": "0.52"})
+        self.assertEqual(client.get_spread("1"), {"spread": "0.03"})
+        self.assertEqual(client.get_tick_size("1"), "0.01")
+        self.assertEqual(client.get_server_time(), 1)
+
+        book = client.get_order_book("1")
+        self.assertEqual([o.price for o in book.bids], ["0.48", "0.49"])
+        self.assertEqual(
+            client.get_prices([BookParams("1", "BUY"), BookParams("2", "BUY")]),
+            {"1": {"BUY": "0.49"}},
+        )
+        with self.assertRaises(Exception):
+            client.get_order_book("2")
+
+    def test_time_scaled_replay(self):
+        # 190ms of recorded activity at 10x should take roughly 19ms
+        engine = ReplayEngine(self.reader, speed=10)
+        started = time.perf_counter()
+        engine.run()
+        self.assertGreaterEqual(time.perf_counter() - started, 0.018)
+
+        with self.assertRaises(ValueError):
+            ReplayEngine(self.reader, speed=0)
+
+    def test_benchmark(self):
+        engine = ReplayEngine(self.reader, speed=1)
+        engine.run(end_ts=1000)
+        stats = engine.benchmark()
+        self.assertEqual(stats.events, 11)
+        self.assertGreater(stats.events_per_second, 0)
+        self.assertEqual(engine.speed, 1)
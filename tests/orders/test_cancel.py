@@ -0,0 +1,142 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.orders.cancel import (
+    CHUNK_FAILED,
+    UNANSWERED,
+    CancelCoalescer,
+    bulk_cancel,
+)
+from py_clob_client.orders.store import CANCELED, OrderStore, TrackedOrder
+
+
+class FakeClient:
+    def __init__(self, failures=None, open_ids=()):
+        self.calls = []
+        self.failures = failures or {}
+        self.open_ids = set(open_ids)
+        self.lock = threading.Lock()
+
+    def cancel_orders(self, order_ids):
+        with self.lock:
+            self.calls.append(list(order_ids))
+            first = order_ids[0]
+            if self.failures.get(first):
+                self.failures[first] -= 1
+                raise PolyApiException(error_msg="Request exception!")
+        canceled = [i for i in order_ids if not i.startswith("x")]
+        not_canceled = {
+            i: "order can't be found" for i in order_ids if i.startswith("x")
+        }
+        return {"canceled": canceled, "not_canceled": not_canceled}
+
+    def get_orders(self, params=None):
+        return [{"id": i} for i in self.open_ids]
+
+
+@patch("py_clob_client.http_helpers.retry.time.sleep")
+class TestBulkCancel(TestCase):
+    def test_chunks_and_outcomes(self, _):
+        client = FakeClient(open_ids={"x3"})
+        ids = ["o0", "o1", "o2", "x3", "o4", "o1"]
+        result = bulk_cancel(client, ids, chunk_size=2)
+
+        self.assertEqual(sorted(client.calls), [["o0", "o1"], ["o2", "x3"], ["o4"]])
+        self.assertEqual(sorted(result.canceled), ["o0", "o1", "o2", "o4"])
+        self.assertEqual(result.outcome("o2"), "canceled")
+        self.assertEqual(result.outcome("x3"), "order can't be found")
+        self.assertIsNone(result.outcome("o9"))
+        self.assertEqual(result.still_live, ["x3"])
+        self.assertFalse(result.ok)
+
+    def test_failed_chunks_are_retried(self, sleep):
+        client = FakeClient(failures={"o2": 1})
+        result = bulk_cancel(client, ["o0", "o1", "o2", "o3"], chunk_size=2)
+
+        self.assertEqual(len(client.calls), 3)
+        self.assertEqual(sleep.call_count, 1)
+        self.assertEqual(sorted(result.canceled), ["o0", "o1", "o2", "o3"])
+        self.assertTrue(result.ok)
+
+    def test_chunk_failing_for_good(self, _):
+        client = FakeClient(failures={"o2": 10}, open_ids={"o2"})
+        result = bulk_cancel(client, ["o0", "o1", "o2", "o3"], chunk_size=2, retries=1)
+
+        self.assertEqual(result.canceled, ["o0", "o1"])
+        self.assertEqual(result.outcome("o3"), CHUNK_FAILED)
+        self.assertEqual(len(result.errors), 1)
+        # o3 may have been canceled before the failure, only o2 is still open
+        self.assertEqual(result.still_live, ["o2"])
+
+        result = bulk_cancel(
+            FakeClient(failures={"o2": 10}), ["o2"], retries=0, verify=False
+        )
+        self.assertEqual(result.still_live, ["o2"])
+
+    def test_unanswered_ids_and_store(self, _):
+        class PartialClient(FakeClient):
+            def cancel_orders(self, order_ids):
+                return {"canceled": order_ids[:1], "not_canceled": {}}
+
+        store = OrderStore()
+        for order_id in ("a", "b"):
+            store.add(
+                TrackedOrder(
+                    id=order_id, token_id="1", side="BUY", price=0.5, original_size=1
+                )
+            )
+        result = bulk_cancel(PartialClient(open_ids={"b"}), ["a", "b"], store=store)
+
+        self.assertEqual(result.outcome("b"), UNANSWERED)
+        self.assertEqual(result.still_live, ["b"])
+        self.assertEqual(store.get("a").status, CANCELED)
+        self.assertTrue(store.get("b").is_open)
+
+    def test_empty(self, _):
+        client = FakeClient()
+        self.assertTrue(bulk_cancel(client, []).ok)
+        self.assertEqual(client.calls, [])
+
+
+class TestCancelCoalescer(TestCase):
+    def test_concurrent_cancels_share_a_request(self):
+        client = FakeClient()
+        store = OrderStore()
+        store.add(
+            TrackedOrder(id="o1", token_id="1", side="BUY", price=0.5, original_size=1)
+        )
+        start = threading.Barrier(6)
+        futures = {}
+
+        with CancelCoalescer(client, window=0.05, store=store) as coalescer:
+
+            def caller(order_id):
+                start.wait()
+                futures[order_id] = coalescer.cancel(order_id)
+
+            ids = ["o1", "o2", "o3", "x4", "o5", "o1"]
+            threads = [threading.Thread(target=caller, args=(i,)) for i in ids]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            results = {i: f.result(1) for i, f in futures.items()}
+
+        self.assertEqual(len(client.calls), 1)
+        self.assertEqual(sorted(client.calls[0]), ["o1", "o2", "o3", "o5", "x4"])
+        self.assertEqual(results["o2"], {"canceled": ["o2"], "not_canceled": {}})
+        self.assertEqual(
+            results["x4"],
+            {"canceled": [], "not_canceled": {"x4": "order can't be found"}},
+        )
+        self.assertEqual(store.get("o1").status, CANCELED)
+
+    def test_failure_reaches_every_caller(self):
+        client = FakeClient(failures={"o1": 1})
+        with CancelCoalescer(client, window=0.05) as coalescer:
+            futures = [coalescer.cancel("o1"), coalescer.cancel("o2")]
+            for future in futures:
+                with self.assertRaises(PolyApiException):
+                    future.result(1)
@@ -0,0 +1,171 @@
+import threading
+from unittest import TestCase
+
+from py_clob_client.clob_types import CreateOrderOptions
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.orders.ladder import LadderQuoter, diff_ladder
+from py_clob_client.orders.store import OrderStore, TrackedOrder
+from py_clob_client.signer import Signer
+
+# publicly known private key
+signer = Signer(
+    "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80", AMOY
+)
+builder = OrderBuilder(signer)
+
+
+def tracked(order_id, price, size, side=BUY, recorded_at=0.0):
+    return TrackedOrder(
+        id=order_id,
+        token_id="123",
+        side=side,
+        price=price,
+        original_size=size,
+        recorded_at=recorded_at,
+    )
+
+
+class FakeClient:
+    def __init__(self, cancel_gate=None):
+        self.calls = []
+        self.cancel_gate = cancel_gate
+        self.counter = 0
+
+    def create_order(self, order_args, options=None):
+        return builder.create_order(
+            order_args, CreateOrderOptions(tick_size="0.01", neg_risk=False)
+        )
+
+    def cancel_orders(self, order_ids):
+        if self.cancel_gate is not None:
+            self.cancel_gate.wait(1)
+        self.calls.append(("cancel", list(order_ids)))
+        return {"canceled": list(order_ids), "not_canceled": {}}
+
+    def post_orders(self, args):
+        self.calls.append(("post", len(args)))
+        responses = []
+        for _ in args:
+            self.counter += 1
+            responses.append(
+                {
+                    "success": True,
+                    "orderID": "n{}".format(self.counter),
+                    "status": "live",
+                }
+            )
+        return responses
+
+
+class TestDiffLadder(TestCase):
+    def test_unchanged_levels_are_kept(self):
+        orders = [tracked("a", 0.5, 100), tracked("b", 0.6, 50, SELL)]
+        diff = diff_ladder("123", {BUY: {0.5: 100}, SELL: {"0.60": 50}}, orders)
+        self.assertTrue(diff.empty)
+        self.assertEqual({o.id for o in diff.kept}, {"a", "b"})
+
+    def test_moved_and_resized_levels(self):
+        orders = [
+            tracked("a", 0.5, 100),
+            tracked("b", 0.49, 100),
+            tracked("c", 0.48, 60, recorded_at=1),
+            tracked("d", 0.48, 40, recorded_at=2),
+        ]
+        diff = diff_ladder(
+            "123", {BUY: {0.5: 150, 0.48: 70, 0.47: 100}}, orders, min_size=5
+        )
+        # 0.49 dropped, the newest order at 0.48 goes, the oldest keeps its place
+        self.assertEqual([o.id for o in diff.cancels], ["b", "d"])
+        self.assertEqual({o.id for o in diff.kept}, {"a", "c"})
+        self.assertEqual(
+            sorted((a.price, a.size) for a in diff.creates),
+            [(0.47, 100), (0.48, 10), (0.5, 50)],
+        )
+
+    def test_small_top_ups_are_skipped(self):
+        diff = diff_ladder("123", {BUY: {0.5: 102}}, [tracked("a", 0.5, 100)], 5)
+        self.assertTrue(diff.empty)
+
+    def test_crosses(self):
+        orders = [tracked("a", 0.55, 10, SELL)]
+        self.assertTrue(diff_ladder("123", {BUY: {0.55: 10}}, orders).crosses)
+        self.assertFalse(diff_ladder("123", {BUY: {0.5: 10}}, orders).crosses)
+
+
+class TestLadderQuoter(TestCase):
+    def test_requote_overlaps_cancel_and_post(self):
+        gate = threading.Event()
+        client = FakeClient(cancel_gate=gate)
+        store = OrderStore()
+        store.add(tracked("a", 0.5, 100))
+        store.add(tracked("b", 0.49, 100))
+
+        with LadderQuoter(client, store, batch_size=2) as quoter:
+            result = quoter.requote(
+                "123", {BUY: {0.5: 100, 0.48: 100, 0.47: 100, 0.46: 100}}
+            )
+            gate.set()
+
+        self.assertTrue(result.ok)
+        # both post batches went out while the cancel was still in flight
+        self.assertEqual(client.calls, [("post", 2), ("post", 1), ("cancel", ["b"])])
+        self.assertEqual(
+            store.levels("123", BUY), {0.5: 100, 0.48: 100, 0.47: 100, 0.46: 100}
+        )
+        self.assertEqual(store.get("a").status, "LIVE")
+
+    def test_crossing_posts_wait_for_cancels(self):
+        client = FakeClient(cancel_gate=threading.Event())
+        store = OrderStore()
+        store.add(tracked("a", 0.55, 10, SELL))
+
+        with LadderQuoter(client, store) as quoter:
+            result = quoter.requote("123", {BUY: {0.55: 10}})
+
+        self.assertEqual(client.calls, [("cancel", ["a"]), ("post", 1)])
+        self.assertEqual(store.levels("123", SELL), {})
+        self.assertEqual(store.levels("123", BUY), {0.55: 10})
+        self.assertEqual(result.post_responses[0]["orderID"], "n1")
+
+    def test_crossing_creates_are_skipped_when_the_cancel_fails(self):
+        class FailingCancel(FakeClient):
+            def cancel_orders(self, order_ids):
+                self.calls.append(("cancel", list(order_ids)))
+                raise Exception("down")
+
+        class NotCanceled(FakeClient):
+            def cancel_orders(self, order_ids):
+                self.calls.append(("cancel", list(order_ids)))
+                return {"canceled": ["b"], "not_canceled": {"a": "matched"}}
+
+        for client in (FailingCancel(), NotCanceled()):
+            store = OrderStore()
+            store.add(tracked("a", 0.55, 10, SELL))
+            store.add(tracked("b", 0.45, 10))
+
+            with LadderQuoter(client, store) as quoter:
+                result = quoter.requote(
+                    "123", {BUY: {0.56: 10, 0.4: 10}, SELL: {0.6: 10}}
+                )
+
+            self.assertEqual([(a.side, a.price) for a in result.skipped], [(BUY, 0.56)])
+            self.assertEqual(result.ok, isinstance(client, NotCanceled))
+            self.assertEqual(client.calls[1], ("post", 2))
+            self.assertEqual(store.levels("123", BUY).get(0.56), None)
+            self.assertEqual(store.levels("123", SELL)[0.6], 10)
+
+    def test_errors_are_reported(self):
+        class FailingClient(FakeClient):
+            def post_orders(self, args):
+                raise Exception("rejected")
+
+        store = OrderStore()
+        store.add(tracked("a", 0.5, 10))
+        with LadderQuoter(FailingClient(), store) as quoter:
+            result = quoter.requote("123", {BUY: {0.4: 10}})
+
+        self.assertFalse(result.ok)
+        self.assertEqual(str(result.post_error), "rejected")
+        self.assertEqual(store.levels("123", BUY), {})
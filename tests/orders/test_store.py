@@ -0,0 +1,218 @@
+import time
+from unittest import TestCase
+
+from py_clob_client.clob_types import (
+    CreateOrderOptions,
+    OrderArgs,
+    OrderType,
+    PostOrdersArgs,
+)
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY, SELL
+from py_clob_client.orders.store import CANCELED, MATCHED, OrderStore
+from py_clob_client.signer import Signer
+
+# publicly known private key
+signer = Signer(
+    "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80", AMOY
+)
+builder = OrderBuilder(signer)
+
+
+def signed(price, size, side, token_id="123"):
+    return builder.create_order(
+        OrderArgs(token_id=token_id, price=price, size=size, side=side),
+        CreateOrderOptions(tick_size="0.01", neg_risk=False),
+    )
+
+
+def open_order(order_id, price, original_size, side="BUY", size_matched="0"):
+    return {
+        "id": order_id,
+        "status": "LIVE",
+        "market": "m1",
+        "asset_id": "123",
+        "side": side,
+        "original_size": str(original_size),
+        "size_matched": size_matched,
+        "price": str(price),
+        "order_type": "GTC",
+    }
+
+
+class TestOrderStore(TestCase):
+    def test_record_post_indexes_by_level(self):
+        store = OrderStore()
+        order = store.record_post(
+            signed(0.53, 100, BUY), {"success": True, "orderID": "o1", "status": "live"}
+        )
+        self.assertEqual(
+            (order.side, order.price, order.original_size), (BUY, 0.53, 100)
+        )
+        self.assertEqual(order.token_id, "123")
+        self.assertEqual(store.orders_at("123", BUY, "0.53"), [order])
+        self.assertEqual(store.orders_at("123", BUY, 0.530000001), [order])
+        self.assertEqual(store.size_at("123", BUY, 0.53), 100)
+        self.assertEqual(store.orders_at("123", SELL, 0.53), [])
+
+        sell = store.record_post(
+            signed(0.6, 20, SELL), {"success": True, "orderID": "o2", "status": "live"}
+        )
+        self.assertEqual((sell.price, sell.original_size), (0.6, 20))
+        self.assertEqual(store.levels("123", SELL), {0.6: 20})
+
+        self.assertIsNone(
+            store.record_post(signed(0.5, 10, BUY), {"success": False, "errorMsg": "x"})
+        )
+
+    def test_record_posts_and_immediate_orders(self):
+        store = OrderStore()
+        args = [
+            PostOrdersArgs(signed(0.5, 10, BUY), OrderType.GTC),
+            PostOrdersArgs(signed(0.51, 10, BUY), OrderType.FAK),
+            PostOrdersArgs(signed(0.52, 10, BUY), OrderType.FOK),
+            PostOrdersArgs(signed(0.53, 10, BUY), OrderType.GTC),
+            PostOrdersArgs(signed(0.54, 10, BUY), OrderType.GTC),
+        ]
+        orders = store.record_posts(
+            args,
+            [
+                {"success": True, "orderID": "a", "status": "live"},
+                {"success": True, "orderID": "b", "status": "unmatched"},
+                {"success": True, "orderID": "c", "status": "matched"},
+                {
+                    "success": True,
+                    "orderID": "d",
+                    "status": "matched",
+                    "makingAmount": "5.4",
+                    "takingAmount": "10",
+                },
+                # without amounts the match size is unknown, the order stays open
+                {"success": True, "orderID": "e", "status": "matched"},
+            ],
+        )
+        self.assertEqual(
+            [o.status for o in orders], ["LIVE", CANCELED, MATCHED, MATCHED, "LIVE"]
+        )
+        self.assertEqual(orders[2].size_matched, 10)
+        self.assertEqual([o.id for o in store.open_orders("123")], ["a", "e"])
+
+    def test_partially_matched_gtc_keeps_resting(self):
+        store = OrderStore()
+        buy = store.record_post(
+            signed(0.5, 100, BUY),
+            {
+                "success": True,
+                "orderID": "b",
+                "status": "matched",
+                "makingAmount": "20",
+                "takingAmount": "40",
+            },
+            OrderType.GTC,
+        )
+        sell = store.record_post(
+            signed(0.6, 50, SELL),
+            {
+                "success": True,
+                "orderID": "s",
+                "status": "matched",
+                "makingAmount": "30",
+                "takingAmount": "18",
+            },
+            OrderType.GTD,
+        )
+
+        self.assertEqual(
+            (buy.status, buy.size_matched, buy.remaining), ("LIVE", 40, 60)
+        )
+        self.assertEqual((sell.status, sell.remaining), ("LIVE", 20))
+        self.assertEqual(store.levels("123", BUY), {0.5: 60})
+        self.assertEqual(store.levels("123", SELL), {0.6: 20})
+
+    def test_user_channel_events(self):
+        store = OrderStore()
+        store.apply_event(
+            dict(open_order("o1", 0.5, 100), type="PLACEMENT", event_type="order")
+        )
+        self.assertEqual(store.size_at("123", BUY, 0.5), 100)
+
+        store.apply_event(
+            {"event_type": "order", "id": "o1", "type": "UPDATE", "size_matched": "40"}
+        )
+        self.assertEqual(store.size_at("123", BUY, 0.5), 60)
+
+        # replayed or out of order updates never lower the matched size
+        store.apply_event(
+            {"event_type": "order", "id": "o1", "type": "UPDATE", "size_matched": "10"}
+        )
+        self.assertEqual(store.get("o1").size_matched, 40)
+
+        store.apply_event({"event_type": "trade", "id": "x"})
+        store.apply_event({"event_type": "order", "id": "o1", "type": "CANCELLATION"})
+        self.assertEqual(store.get("o1").status, CANCELED)
+        self.assertEqual(store.orders_at("123", BUY, 0.5), [])
+
+        store.apply_event(
+            {"event_type": "order", "id": "o1", "type": "UPDATE", "size_matched": "100"}
+        )
+        self.assertFalse(store.get("o1").is_open)
+
+    def test_fill_to_completion_and_cancel_response(self):
+        store = OrderStore()
+        store.reconcile([open_order("o1", 0.5, 10), open_order("o2", 0.5, 10)])
+        store.apply_event(
+            {"event_type": "order", "id": "o1", "type": "UPDATE", "size_matched": "10"}
+        )
+        self.assertEqual([o.id for o in store.orders_at("123", BUY, 0.5)], ["o2"])
+
+        store.apply_cancel_response({"canceled": ["o2", "unknown"], "not_canceled": {}})
+        self.assertEqual(store.open_orders(), [])
+
+    def test_reconcile(self):
+        store = OrderStore()
+        store.reconcile([open_order("o1", 0.5, 10), open_order("o2", 0.4, 10)])
+        as_of = time.time()
+        late = store.record_post(
+            signed(0.45, 5, BUY), {"success": True, "orderID": "late"}
+        )
+
+        store.reconcile([open_order("o2", 0.4, 10, size_matched="4")], as_of=as_of)
+        self.assertEqual(store.get("o1").status, CANCELED)
+        self.assertEqual(store.size_at("123", BUY, 0.4), 6)
+        self.assertTrue(late.is_open)
+        self.assertEqual({o.id for o in store.open_orders()}, {"o2", "late"})
+
+        store.prune()
+        self.assertIsNone(store.get("o1"))
+        self.assertIsNotNone(store.get("o2"))
+
+    def test_sync_uses_get_orders(self):
+        class FakeClient:
+            def get_orders(self, params=None):
+                return [open_order("o9", 0.3, 7, side="SELL")]
+
+        store = OrderStore()
+        store.sync(FakeClient())
+        self.assertEqual(store.size_at("123", SELL, 0.3), 7)
+
+    def test_side_index_follows_fills_and_cancels(self):
+        store = OrderStore()
+        store.reconcile(
+            [
+                open_order("b1", 0.5, 10),
+                open_order("b2", 0.49, 10),
+                open_order("s1", 0.6, 10, side="SELL"),
+            ]
+        )
+        self.assertEqual({o.id for o in store.open_orders("123", BUY)}, {"b1", "b2"})
+        self.assertEqual([o.id for o in store.open_orders("123", SELL)], ["s1"])
+
+        store.apply_event(
+            dict(open_order("b1", 0.5, 10, size_matched="10"), type="UPDATE")
+        )
+        store.apply_cancel(["s1"])
+        self.assertEqual([o.id for o in store.open_orders("123", BUY)], ["b2"])
+        self.assertEqual(store.open_orders("123", SELL), [])
+        self.assertEqual(store.levels("123", BUY), {0.49: 10})
+        self.assertEqual(store.levels("123", SELL), {})
@@ -0,0 +1,139 @@
+import queue
+import threading
+from unittest import TestCase
+
+from py_clob_client.clob_types import CreateOrderOptions, OrderArgs, OrderType
+from py_clob_client.constants import AMOY
+from py_clob_client.order_builder.builder import OrderBuilder
+from py_clob_client.order_builder.constants import BUY
+from py_clob_client.orders.store import OrderStore
+from py_clob_client.orders.submission import OrderQueue
+from py_clob_client.signer import Signer
+
+# publicly known private key
+signer = Signer(
+    "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80", AMOY
+)
+builder = OrderBuilder(signer)
+order = builder.create_order(
+    OrderArgs(token_id="123", price=0.5, size=10, side=BUY),
+    CreateOrderOptions(tick_size="0.01", neg_risk=False),
+)
+
+
+class FakeClient:
+    def __init__(self, gate=None):
+        self.calls = []
+        self.gate = gate
+        self.lock = threading.Lock()
+        self.counter = 0
+
+    def post_orders(self, args):
+        if self.gate is not None:
+            self.gate.wait(1)
+        with self.lock:
+            self.calls.append(("post", len(args)))
+            responses = []
+            for _ in args:
+                self.counter += 1
+                responses.append(
+                    {
+                        "success": True,
+                        "orderID": "o{}".format(self.counter),
+                        "status": "live",
+                    }
+                )
+            return responses
+
+    def cancel_orders(self, order_ids):
+        with self.lock:
+            self.calls.append(("cancel", list(order_ids)))
+        return {
+            "canceled": [i for i in order_ids if i != "gone"],
+            "not_canceled": {"gone": "order can't be found"},
+        }
+
+
+class TestOrderQueue(TestCase):
+    def test_orders_within_window_share_a_batch(self):
+        client = FakeClient()
+        store = OrderStore()
+        with OrderQueue(client, window=0.05, max_batch=3, store=store) as orders:
+            futures = [orders.submit(order) for _ in range(5)]
+            responses = [f.result(1) for f in futures]
+
+        self.assertEqual(client.calls, [("post", 3), ("post", 2)])
+        self.assertEqual(
+            [r["orderID"] for r in responses], ["o1", "o2", "o3", "o4", "o5"]
+        )
+        self.assertEqual(store.size_at("123", BUY, 0.5), 50)
+        self.assertEqual(orders.pending, 0)
+
+    def test_cancels_go_first(self):
+        client = FakeClient()
+        with OrderQueue(client, window=0.5, max_workers=1) as orders:
+            posted = orders.submit(order)
+            canceled = orders.cancel("a")
+            gone = orders.cancel("gone")
+            self.assertEqual(
+                canceled.result(1), {"canceled": ["a"], "not_canceled": {}}
+            )
+            self.assertEqual(
+                gone.result(1),
+                {"canceled": [], "not_canceled": {"gone": "order can't be found"}},
+            )
+            posted.result(1)
+
+        self.assertEqual(client.calls, [("cancel", ["a", "gone"]), ("post", 1)])
+
+    def test_cancels_do_not_wait_behind_posts_in_flight(self):
+        gate = threading.Event()
+        client = FakeClient(gate=gate)
+        with OrderQueue(client, window=0, max_batch=1, max_workers=2) as orders:
+            posts = [orders.submit(order) for _ in range(8)]
+            # both post workers are busy and six batches are queued behind them
+            canceled = orders.cancel("a")
+            self.assertEqual(
+                canceled.result(0.5), {"canceled": ["a"], "not_canceled": {}}
+            )
+            self.assertEqual(client.calls, [("cancel", ["a"])])
+
+            gate.set()
+            for future in posts:
+                future.result(1)
+        self.assertEqual(client.calls[0], ("cancel", ["a"]))
+        self.assertEqual(len(client.calls), 9)
+
+    def test_backpressure(self):
+        gate = threading.Event()
+        client = FakeClient(gate=gate)
+        with OrderQueue(client, window=0, max_batch=1, max_pending=2) as orders:
+            first = orders.submit(order)
+            orders.submit(order)
+            with self.assertRaises(queue.Full):
+                orders.submit(order, block=False)
+            with self.assertRaises(queue.Full):
+                orders.submit(order, timeout=0.01)
+            # cancels are never held back
+            orders.cancel("a").result(1)
+
+            gate.set()
+            first.result(1)
+            orders.submit(order).result(1)
+        self.assertEqual(orders.pending, 0)
+
+    def test_errors_and_validation(self):
+        class FailingClient(FakeClient):
+            def post_orders(self, args):
+                raise Exception("rejected")
+
+        with OrderQueue(FailingClient(), window=0.01) as orders:
+            future = orders.submit(order)
+            with self.assertRaises(Exception) as ctx:
+                future.result(1)
+            self.assertEqual(str(ctx.exception), "rejected")
+            with self.assertRaises(Exception):
+                orders.submit(order, OrderType.FOK, post_only=True)
+
+        with self.assertRaises(RuntimeError):
+            orders.submit(order)
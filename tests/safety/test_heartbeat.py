@@ -0,0 +1,94 @@
+import threading
+from unittest import TestCase
+from unittest.mock import patch
+
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.safety.heartbeat import HeartbeatService
+
+
+class FakeClient:
+    def __init__(self):
+        self.sent = []
+        self.http_clients = set()
+        self.fail_with = None
+        self.beats = threading.Event()
+
+    def post_heartbeat(self, heartbeat_id, http_client=None):
+        self.sent.append(heartbeat_id)
+        self.http_clients.add(http_client)
+        self.beats.set()
+        if self.fail_with is not None:
+            error, self.fail_with = self.fail_with, None
+            raise error
+        return {"heartbeat_id": f"hb-{len(self.sent)}"}
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestHeartbeatService(TestCase):
+    def test_chains_ids_and_measures_slack(self):
+        client = FakeClient()
+        alerts = []
+        service = HeartbeatService(
+            client,
+            interval=5,
+            slack_threshold=3,
+            on_slack=lambda slack, stats: alerts.append(slack),
+        )
+        clock = Clock()
+        with patch("py_clob_client.safety.heartbeat.time.monotonic", clock):
+            self.assertIsNone(service.beat())
+
+            clock.now = 5.0
+            self.assertEqual(service.beat(), 5.0)
+
+            # a stalled process: sent late and slow to come back
+            def slow_post(heartbeat_id, http_client=None):
+                clock.now += 1.5
+                return {"heartbeat_id": "hb-slow"}
+
+            clock.now = 11.0
+            with patch.object(client, "post_heartbeat", slow_post):
+                self.assertEqual(service.beat(), 10 - (12.5 - 5.0))
+
+        self.assertEqual(client.sent, [None, "hb-1"])
+        self.assertEqual(service.stats.heartbeat_id, "hb-slow")
+        self.assertEqual(service.stats.sent, 3)
+        self.assertEqual(service.stats.last_latency, 1.5)
+        self.assertEqual(service.stats.min_slack, 2.5)
+        self.assertEqual(alerts, [2.5])
+        service.stop()
+
+    def test_broken_chain_adopts_server_heartbeat_id(self):
+        client = FakeClient()
+        service = HeartbeatService(client)
+        client.fail_with = PolyApiException(
+            error_msg={"error": "Invalid Heartbeat ID", "heartbeat_id": "hb-server"}
+        )
+        with self.assertRaises(PolyApiException):
+            service.beat()
+        self.assertEqual(service.stats.failures, 1)
+
+        service.beat()
+        self.assertEqual(client.sent, [None, "hb-server"])
+        service.stop()
+
+    def test_background_thread_uses_dedicated_connection(self):
+        client = FakeClient()
+        with HeartbeatService(client, interval=0.01, deadline=1) as service:
+            for _ in range(3):
+                client.beats.clear()
+                self.assertTrue(client.beats.wait(2))
+        self.assertGreaterEqual(len(client.sent), 3)
+        self.assertEqual(client.http_clients, {service.http_client})
+        self.assertTrue(service.http_client.is_closed)
+
+    def test_interval_must_fit_the_deadline(self):
+        with self.assertRaises(ValueError):
+            HeartbeatService(FakeClient(), interval=10, deadline=10)
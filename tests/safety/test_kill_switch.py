@@ -0,0 +1,135 @@
+import os
+import signal
+import threading
+import time
+from types import SimpleNamespace
+from unittest import TestCase, skipUnless
+from unittest.mock import patch
+
+from py_clob_client.client import ClobClient
+from py_clob_client.clob_types import ApiCreds, RequestArgs
+from py_clob_client.constants import AMOY
+from py_clob_client.endpoints import CANCEL_ALL, CANCEL_MARKET_ORDERS
+from py_clob_client.exceptions import PolyApiException
+from py_clob_client.headers.headers import POLY_TIMESTAMP, create_level_2_headers
+from py_clob_client.safety.kill_switch import KillSwitch
+
+
+def make_client():
+    return ClobClient(
+        "http://localhost",
+        chain_id=AMOY,
+        key="0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80",
+        creds=ApiCreds(
+            api_key="key",
+            api_secret="AAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAA=",
+            api_passphrase="passphrase",
+        ),
+    )
+
+
+@patch("py_clob_client.safety.kill_switch.get")
+@patch("py_clob_client.safety.kill_switch.delete")
+class TestKillSwitch(TestCase):
+    def test_fire_sends_a_correctly_signed_cancel_all(self, delete, get):
+        client = make_client()
+        delete.return_value = {"canceled": ["o1"], "not_canceled": {}}
+        with KillSwitch(client, keepalive=None) as switch:
+            self.assertEqual(get.call_count, 1)
+            self.assertIs(get.call_args.kwargs["http_client"], switch.http_client)
+
+            result = switch.fire()
+            self.assertTrue(result.ok)
+            self.assertEqual(result.target, "all")
+            self.assertEqual(result.response["canceled"], ["o1"])
+            self.assertGreaterEqual(result.latency, 0)
+            self.assertEqual(switch.history, [result])
+
+            (url,), kwargs = delete.call_args
+            self.assertEqual(url, "http://localhost" + CANCEL_ALL)
+            self.assertIsNone(kwargs["data"])
+            self.assertIs(kwargs["http_client"], switch.http_client)
+            timestamp = int(kwargs["headers"][POLY_TIMESTAMP])
+            expected = create_level_2_headers(
+                client.signer,
+                client.creds,
+                RequestArgs(method="DELETE", request_path=CANCEL_ALL),
+                timestamp,
+            )
+            self.assertEqual(kwargs["headers"], expected)
+
+    def test_fire_markets(self, delete, get):
+        client = make_client()
+        errors = {"m2"}
+
+        def fake_delete(url, headers=None, data=None, http_client=None):
+            if '"m2"' in data:
+                raise PolyApiException(error_msg="down")
+            return {"canceled": [data]}
+
+        delete.side_effect = fake_delete
+        with KillSwitch(
+            client, markets=["m1", "m2"], asset_ids=["a1"], keepalive=None
+        ) as switch:
+            results = switch.fire_markets()
+
+        self.assertEqual([r.target for r in results], ["m1", "m2", "a1"])
+        self.assertEqual([r.ok for r in results], [True, False, True])
+        self.assertEqual(
+            results[0].response["canceled"], ['{"market":"m1","asset_id":""}']
+        )
+        self.assertEqual(
+            results[2].response["canceled"], ['{"market":"","asset_id":"a1"}']
+        )
+        for call in delete.call_args_list:
+            headers, body = call.kwargs["headers"], call.kwargs["data"]
+            expected = create_level_2_headers(
+                client.signer,
+                client.creds,
+                RequestArgs(
+                    method="DELETE",
+                    request_path=CANCEL_MARKET_ORDERS,
+                    serialized_body=body,
+                ),
+                int(headers[POLY_TIMESTAMP]),
+            )
+            self.assertEqual(headers, expected)
+        self.assertEqual(errors, {r.target for r in results if not r.ok})
+
+    def test_keepalive_rewarms_the_connection(self, delete, get):
+        warmed = threading.Event()
+        get.side_effect = lambda *args, **kwargs: get.call_count > 2 and warmed.set()
+        switch = KillSwitch(make_client(), keepalive=0.01)
+        try:
+            self.assertTrue(warmed.wait(2))
+        finally:
+            switch.close()
+        self.assertTrue(switch.http_client.is_closed)
+
+    @skipUnless(hasattr(signal, "SIGUSR1"), "SIGUSR1 is not available")
+    def test_signal_handler(self, delete, get):
+        fired = threading.Event()
+        delete.side_effect = lambda *args, **kwargs: fired.set() or {}
+        with KillSwitch(make_client(), keepalive=None) as switch:
+            previous = switch.install_signal_handler()
+            try:
+                os.kill(os.getpid(), signal.SIGUSR1)
+                self.assertTrue(fired.wait(2))
+            finally:
+                signal.signal(signal.SIGUSR1, previous)
+            for _ in range(100):
+                if switch.history:
+                    break
+                time.sleep(0.01)
+            self.assertEqual(switch.history[0].target, "all")
+
+    def test_signal_handler_without_sigusr1(self, delete, get):
+        no_sigusr1 = SimpleNamespace(signal=signal.signal)
+        with KillSwitch(make_client(), keepalive=None) as switch:
+            with patch("py_clob_client.safety.kill_switch.signal", no_sigusr1):
+                with self.assertRaises(ValueError):
+                    switch.install_signal_handler()
+
+    def test_requires_level_2_auth(self, delete, get):
+        with self.assertRaises(Exception):
+            KillSwitch(ClobClient("http://localhost"))
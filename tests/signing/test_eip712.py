@@ -2,7 +2,10 @@ from unittest import TestCase
 from py_clob_client.constants import AMOY
 
 from py_clob_client.signer import Signer
-from py_clob_client.signing.eip712 import sign_clob_auth_message
+from py_clob_client.signing.eip712 import (
+    get_clob_auth_domain,
+    sign_clob_auth_message,
+)
 
 # publicly known private key
 private_key = "0xac0974bec39a17e36ba4a6b4d238ff944bacb478cbed5efcae784d7bf4f2ff80"
@@ -18,3 +21,7 @@ class TestEIP712(TestCase):
             signature,
             "0xf62319a987514da40e57e2f4d7529f7bac38f0355bd88bb5adbb3768d80de6c1682518e0af677d5260366425f4361e7b70c25ae232aff0ab2331e2b164a1aedc1b",
         )
+
+    def test_clob_auth_domain_is_cached(self):
+        self.assertIs(get_clob_auth_domain(chain_id), get_clob_auth_domain(chain_id))
+        self.assertIsNot(get_clob_auth_domain(chain_id), get_clob_auth_domain(137))
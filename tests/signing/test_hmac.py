@@ -1,7 +1,13 @@
 from unittest import TestCase
+import base64
 import binascii
+import hashlib
+import hmac
 
-from py_clob_client.signing.hmac import build_hmac_signature
+from py_clob_client.signing.hmac import (
+    HmacSigner,
+    build_hmac_signature,
+)
 
 
 class TestHMAC(TestCase):
@@ -194,3 +200,38 @@ class TestHMAC(TestCase):
             self.secret, self.timestamp, self.method, self.path, string_b
         )
         self.assertNotEqual(sig_a, sig_b)
+
+    def test_signer_matches_concatenated_message(self):
+        signer = HmacSigner(self.secret)
+        for body in (
+            None,
+            "",
+            self.string_body,
+            "{'quoted': 'single'}",
+            {"hash": "0x123"},
+            [{"b": 2, "a": 1}],
+            {"emoji": "😃"},
+            42,
+            True,
+        ):
+            message = self.timestamp + self.method + self.path
+            if body:
+                message += str(body).replace("'", '"')
+            expected = base64.urlsafe_b64encode(
+                hmac.new(
+                    base64.urlsafe_b64decode(self.secret),
+                    message.encode("utf-8"),
+                    hashlib.sha256,
+                ).digest()
+            ).decode("utf-8")
+            self.assertEqual(
+                signer.sign(self.timestamp, self.method, self.path, body), expected
+            )
+
+    def test_signer_is_reusable(self):
+        signer = HmacSigner(self.secret)
+        first = signer.sign(self.timestamp, self.method, self.path, self.string_body)
+        signer.sign("1", "GET", "/other", "{}")
+        second = signer.sign(self.timestamp, self.method, self.path, self.string_body)
+        self.assertEqual(first, second)
+        self.assertEqual(first, self.baseline_signature)
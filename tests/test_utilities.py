@@ -1,3 +1,5 @@
+import hashlib
+import json
 from unittest import TestCase
 
 from py_clob_client.clob_types import (
@@ -12,6 +14,9 @@ from py_clob_client.order_builder.builder import OrderBuilder
 from py_clob_client.utilities import (
     parse_raw_orderbook_summary,
     generate_orderbook_summary_hash,
+    generate_raw_orderbook_hash,
+    verify_orderbook_summary_hash,
+    verify_orderbook_summary_hashes,
     order_to_json,
     is_tick_size_smaller,
     price_valid,
@@ -193,6 +198,81 @@ class TestUtilities(TestCase):
             "74c6a7c81c1d572f1c877b7d3e25b80c336d8a6e",
         )
 
+    def test_generate_orderbook_summary_hash_matches_json_payload(self):
+        raw_obs = {
+            "market": "0xaabbcc",
+            "asset_id": "100",
+            "timestamp": "123456789",
+            "bids": [
+                {"price": "0.3", "size": "100"},
+                {"price": "0.4", "size": "1.5"},
+            ],
+            "asks": [{"price": "0.6", "size": "100"}],
+            "hash": "",
+            "min_order_size": None,
+            "neg_risk": True,
+            "tick_size": "0.01",
+            "last_trade_price": 'q"uo\\te \u00e9',
+        }
+        payload = {
+            "market": raw_obs["market"],
+            "asset_id": raw_obs["asset_id"],
+            "timestamp": raw_obs["timestamp"],
+            "hash": "",
+            "bids": raw_obs["bids"],
+            "asks": raw_obs["asks"],
+            "min_order_size": raw_obs["min_order_size"],
+            "tick_size": raw_obs["tick_size"],
+            "neg_risk": raw_obs["neg_risk"],
+            "last_trade_price": raw_obs["last_trade_price"],
+        }
+        expected = hashlib.sha1(
+            json.dumps(payload, separators=(",", ":"), ensure_ascii=False).encode(
+                "utf-8"
+            )
+        ).hexdigest()
+
+        self.assertEqual(generate_raw_orderbook_hash(raw_obs), expected)
+        orderbook_summary = parse_raw_orderbook_summary(raw_obs)
+        self.assertEqual(generate_orderbook_summary_hash(orderbook_summary), expected)
+
+    def test_verify_orderbook_summary_hashes(self):
+        raw_obs = {
+            "market": "0xaabbcc",
+            "asset_id": "100",
+            "timestamp": "123456789",
+            "bids": [{"price": "0.3", "size": "100"}],
+            "asks": [{"price": "0.6", "size": "100"}],
+            "hash": "",
+            "min_order_size": "100",
+            "neg_risk": False,
+            "tick_size": "0.01",
+            "last_trade_price": "0.5",
+        }
+        raw_obs["hash"] = generate_raw_orderbook_hash(raw_obs)
+        valid = parse_raw_orderbook_summary(raw_obs)
+        self.assertTrue(verify_orderbook_summary_hash(valid))
+        self.assertEqual(valid.hash, raw_obs["hash"])
+
+        tampered = parse_raw_orderbook_summary(raw_obs)
+        tampered.bids[0].size = "99"
+        self.assertFalse(verify_orderbook_summary_hash(tampered))
+        self.assertEqual(tampered.hash, raw_obs["hash"])
+
+        missing = parse_raw_orderbook_summary({**raw_obs, "hash": ""})
+        self.assertFalse(verify_orderbook_summary_hash(missing))
+
+        books = [valid, tampered, missing] * 4
+        self.assertEqual(
+            verify_orderbook_summary_hashes(books, max_workers=4),
+            [True, False, False] * 4,
+        )
+        self.assertEqual(
+            verify_orderbook_summary_hashes(books, max_workers=1),
+            [True, False, False] * 4,
+        )
+        self.assertEqual(verify_orderbook_summary_hashes([]), [])
+
     def test_order_to_json_0_1(self):
         # publicly known private key
         private_key = (